@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+from functools import lru_cache
+import numpy as np
+
+# Action kinds of the decode table
+IDLE = 0
+BOARD_TO_BOARD = 1
+BOARD_TO_BENCH = 2
+BENCH_TO_BOARD = 3
+BENCH_TO_BENCH = 4
+SELL_FROM_BOARD = 5
+SELL_FROM_BENCH = 6
+PURCHASE = 7
+REFRESH = 8
+
+class SimpleTFTActionSpec(object):
+    def __init__(self, board_size: int, bench_size: int, shop_size: int):
+        """
+        Precompute how every action index decodes and which slot enables it, for one board, bench, and shop size.
+        Use SimpleTFTActionSpec.get to share one spec between all players of a configuration.
+
+        Slots are numbered as board, bench, shop. Each action belongs to exactly one mask fragment:
+        a board or bench slot (available when occupied), a shop slot (available when purchasable),
+        the refresh action (available with gold), or the idle action (always available).
+
+        :param board_size: The size of the board.
+        :param bench_size: The size of the bench.
+        :param shop_size: The size of the shop.
+        """
+        from .player import SimpleTFTPlayer
+
+        self.__board_size = board_size
+        self.__bench_size = bench_size
+        self.__shop_size = shop_size
+        self.__num_slots = board_size + bench_size + shop_size
+        self.__action_space_size = SimpleTFTPlayer.calculate_action_space_size(board_size, bench_size, shop_size)
+
+        A = self.__action_space_size
+        roster_size = board_size + bench_size
+        self.__kind = np.full(A, IDLE, dtype=np.int8)
+        self.__action_from = np.zeros(A, dtype=np.intp)
+        self.__action_to = np.zeros(A, dtype=np.intp)
+        self.__fragment = np.zeros(A, dtype=np.intp)
+        # (kind, first argument, second argument) of the SimpleTFTPlayer method handling each action
+        self.__decoded = []
+
+        for a in range(A):
+            action_from, action_to = SimpleTFTPlayer.map_action_index_to_from_to(a, board_size, bench_size, shop_size)
+            kind, args = IDLE, (0, 0)
+            if action_from < board_size:
+                if action_to < board_size:
+                    kind, args = BOARD_TO_BOARD, (action_from, action_to)
+                elif action_to < roster_size:
+                    kind, args = BOARD_TO_BENCH, (action_from, action_to - board_size)
+                elif action_to == roster_size:
+                    kind, args = SELL_FROM_BOARD, (action_from, 0)
+            elif action_from < roster_size:
+                bench_from = action_from - board_size
+                if action_to < board_size:
+                    kind, args = BENCH_TO_BOARD, (bench_from, action_to)
+                elif action_to < roster_size:
+                    kind, args = BENCH_TO_BENCH, (bench_from, action_to - board_size)
+                elif action_to == roster_size:
+                    kind, args = SELL_FROM_BENCH, (bench_from, 0)
+            elif action_from < self.__num_slots:
+                kind, args = PURCHASE, (action_from - roster_size, 0)
+            elif action_from == self.__num_slots:
+                kind = REFRESH
+
+            self.__kind[a] = kind
+            self.__action_from[a] = action_from
+            self.__action_to[a] = action_to
+            self.__fragment[a] = min(action_from, self.__num_slots + 1)
+            self.__decoded.append((kind,) + args)
+
+        for table in (self.__kind, self.__action_from, self.__action_to, self.__fragment):
+            table.flags.writeable = False
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get(board_size: int, bench_size: int, shop_size: int) -> 'SimpleTFTActionSpec':
+        """
+        Get the shared spec for a board, bench, and shop size, building it on first use.
+
+        :param board_size: The size of the board.
+        :param bench_size: The size of the bench.
+        :param shop_size: The size of the shop.
+        :return: A SimpleTFTActionSpec instance.
+        """
+        return SimpleTFTActionSpec(board_size, bench_size, shop_size)
+
+    @property
+    def action_space_size(self):
+        return self.__action_space_size
+
+    @property
+    def num_fragments(self):
+        """
+        Get the number of mask fragments: one per slot, plus refresh and idle.
+
+        :return: int
+        """
+        return self.__num_slots + 2
+
+    @property
+    def kind(self):
+        """
+        Get the kind of every action index.
+
+        :return: A read-only integer array of shape (action_space_size,).
+        """
+        return self.__kind
+
+    @property
+    def action_from(self):
+        """
+        Get the slot every action originates from, as returned by SimpleTFTPlayer.map_action_index_to_from_to.
+
+        :return: A read-only integer array of shape (action_space_size,).
+        """
+        return self.__action_from
+
+    @property
+    def action_to(self):
+        """
+        Get the target position of every action, as returned by SimpleTFTPlayer.map_action_index_to_from_to.
+
+        :return: A read-only integer array of shape (action_space_size,).
+        """
+        return self.__action_to
+
+    def decode(self, action: int) -> tuple:
+        """
+        Decode an action index. Indices beyond the action space decode as idle.
+
+        :param action: The action index.
+        :return: Tuple of (kind, first argument, second argument) for the SimpleTFTPlayer method handling the action.
+        """
+        return self.__decoded[min(action, self.__action_space_size - 1)]
+
+    def make_action_masks(self, available: np.ndarray) -> np.ndarray:
+        """
+        Build action masks by OR-ing the mask fragments of the available slots. Fragments do not overlap,
+        so this is a single gather of the availability bits.
+
+        :param available: A boolean array or sequence of shape (..., num_fragments): board and bench occupancy,
+                          shop slots that can be purchased, refresh, and idle.
+        :return: A float array of shape (..., action_space_size).
+        """
+        return np.asarray(available, dtype=np.float64).take(self.__fragment, -1)
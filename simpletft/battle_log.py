@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+import argparse
+import os
+import struct
+import numpy as np
+
+# Binary battle logs start with a fixed size header: magic, version, board size, bench size, record size
+HEADER_FORMAT = '<8s4I'
+HEADER_SIZE = 32
+MAGIC = b'STFTBLOG'
+VERSION = 1
+
+def battle_record_dtype(board_size: int, bench_size: int) -> np.dtype:
+    """
+    Get the fixed-width record type of a binary battle log. Each record is one matchup.
+    Champions are (team, preferred_position, level) rows, with -1 marking empty slots.
+
+    :param board_size: The size of the board.
+    :param bench_size: The size of the bench.
+    :return: A numpy structured dtype.
+    """
+    return np.dtype([('game', '<u4'),
+                     ('round', '<u4'),
+                     ('ghost', 'u1'),
+                     ('player', '<i2', (2,)),
+                     ('power', '<i2', (2,)),
+                     ('hp', '<i2', (2,)),
+                     ('gold', '<i4', (2,)),
+                     ('board', '<i2', (2, board_size, 3)),
+                     ('bench', '<i2', (2, bench_size, 3))])
+
+def make_header(board_size: int, bench_size: int) -> bytes:
+    """
+    Build the header of a binary battle log.
+
+    :param board_size: The size of the board.
+    :param bench_size: The size of the bench.
+    :return: The header bytes.
+    """
+    record_size = battle_record_dtype(board_size, bench_size).itemsize
+    return struct.pack(HEADER_FORMAT, MAGIC, VERSION, board_size, bench_size, record_size).ljust(HEADER_SIZE, b'\0')
+
+def read_header(log_file_path: str) -> (int, int):
+    """
+    Read the header of a binary battle log.
+
+    :param log_file_path: Path of the log file.
+    :return: Tuple of (board size, bench size).
+    :raises ValueError: If the file is not a binary battle log.
+    """
+    with open(log_file_path, 'rb') as file:
+        header = file.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE:
+        raise ValueError(f"{log_file_path} is not a binary battle log")
+    magic, version, board_size, bench_size, record_size = struct.unpack_from(HEADER_FORMAT, header)
+    if magic != MAGIC or version != VERSION or record_size != battle_record_dtype(board_size, bench_size).itemsize:
+        raise ValueError(f"{log_file_path} is not a binary battle log")
+    return board_size, bench_size
+
+def encode_matchup(game: int, combat_round: int, ghost: bool, player1: tuple, player2: tuple) -> bytes:
+    """
+    Encode a matchup as a binary battle log record.
+
+    :param game: Index of the game.
+    :param combat_round: Index of the combat round within the game.
+    :param ghost: Whether the second player is the unpaired opponent of an odd matchup, which takes no damage.
+    :param player1: Snapshot of the first player, as (index, power, hp, gold, board rows, bench rows).
+    :param player2: Snapshot of the second player.
+    :return: The record bytes.
+    """
+    board, bench = player1[4], player1[5]
+    record = (game, combat_round, ghost,
+              (player1[0], player2[0]), (player1[1], player2[1]), (player1[2], player2[2]), (player1[3], player2[3]),
+              (board, player2[4]), (bench, player2[5]))
+    return np.array([record], dtype=battle_record_dtype(len(board), len(bench))).tobytes()
+
+def render_matchup(player1: tuple, player2: tuple) -> str:
+    """
+    Format a matchup log entry as side by side tables of both players' boards.
+
+    :param player1: Snapshot of the first player, as (name, power, hp, gold, board rows, bench rows),
+                    with rows as (team, preferred_position, level) and -1 marking empty slots.
+    :param player2: Snapshot of the second player.
+    :return: The log entry.
+    """
+    player1_name, player1_power, player1_hp, player1_gold, player1_board, player1_bench = player1
+    player2_name, player2_power, player2_hp, player2_gold, player2_board, player2_bench = player2
+    header = f"\t{player1_name} - Power: {player1_power} - HP: {player1_hp} - Gold: {player1_gold}\t\t\t{player2_name} - Power: {player2_power} - HP: {player2_hp} - Gold: {player2_gold}\n"
+    p1 = [tuple(c) for c in player1_bench if c[0] >= 0]
+    p2 = [tuple(c) for c in player2_bench if c[0] >= 0]
+    ts = 6 - int(1.4 * len(p1))
+    bench_header = f"\t Bench: {p1}" + "\t" * ts + f" Bench: {p2}\n"
+    sub_header = f"{'Position':^10} | {'Team':^10} | {'Preferred Pos':^15} | {'Level':^10}\t|||\t"
+    sub_header += f"{'Position':^10} | {'Team':^10} | {'Preferred Pos':^15} | {'Level':^10}\n"
+    divider = '-' * (10 + 1 + 10 + 1 + 15 + 1 + 10 + 1) * 2 + "\n"
+
+    log_entry = header + bench_header + sub_header + divider
+
+    for position, (champ1, champ2) in enumerate(zip(player1_board, player2_board)):
+        team, pref_pos, level = champ1 if champ1[0] >= 0 else ("None", "None", "None")
+        log_entry += f"{position:^10} | {team:^10} | {pref_pos:^15} | {level:^10}\t|||\t"
+        team, pref_pos, level = champ2 if champ2[0] >= 0 else ("None", "None", "None")
+        log_entry += f"{position:^10} | {team:^10} | {pref_pos:^15} | {level:^10}\n"
+
+    return log_entry
+
+class SimpleTFTBattleLogReader(object):
+    def __init__(self, log_file_path: str):
+        """
+        Open a binary battle log written with the 'binary' log format. Records are memory mapped, not loaded.
+        Only complete records present when the log is opened are visible.
+
+        :param log_file_path: Path of the log file.
+        :raises ValueError: If the file is not a binary battle log.
+        """
+        self.__board_size, self.__bench_size = read_header(log_file_path)
+        self.__dtype = battle_record_dtype(self.__board_size, self.__bench_size)
+        num_records = (os.path.getsize(log_file_path) - HEADER_SIZE) // self.__dtype.itemsize
+        if num_records:
+            self.__records = np.memmap(log_file_path, dtype=self.__dtype, mode='r',
+                                       offset=HEADER_SIZE, shape=(num_records,))
+        else:
+            self.__records = np.zeros(0, dtype=self.__dtype)
+
+    def __len__(self):
+        return len(self.__records)
+
+    @property
+    def board_size(self):
+        return self.__board_size
+
+    @property
+    def bench_size(self):
+        return self.__bench_size
+
+    def games(self) -> np.ndarray:
+        """
+        Get the indices of the games present in the log.
+
+        :return: A sorted integer array.
+        """
+        return np.unique(self.__records['game'])
+
+    def records(self, game: int = None) -> np.ndarray:
+        """
+        Get the records of the log, or of a single game.
+
+        :param game: Optional game index to filter by.
+        :return: A structured array of records, memory mapped when not filtered.
+        """
+        if game is None:
+            return self.__records
+        return self.__records[self.__records['game'] == game]
+
+    def iter_records(self, game: int = None, chunk_size: int = 4096):
+        """
+        Stream records in chunks, so that large logs are never loaded at once.
+
+        :param game: Optional game index to filter by.
+        :param chunk_size: Number of records read at a time.
+        :return: A generator of records.
+        """
+        for start in range(0, len(self.__records), chunk_size):
+            chunk = self.__records[start:start + chunk_size]
+            if game is not None:
+                chunk = chunk[chunk['game'] == game]
+            yield from chunk
+
+    @staticmethod
+    def render(record) -> str:
+        """
+        Render a record in the text battle log format.
+
+        :param record: A record of the log.
+        :return: The log entry.
+        """
+        players = [('player_{}'.format(record['player'][i]), int(record['power'][i]), int(record['hp'][i]),
+                    int(record['gold'][i]), record['board'][i].tolist(), record['bench'][i].tolist())
+                   for i in range(2)]
+        return render_matchup(*players)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a binary battle log as text tables.")
+    parser.add_argument('log_file_path')
+    parser.add_argument('--game', type=int, default=None, help="Only render the matchups of this game.")
+    args = parser.parse_args()
+
+    reader = SimpleTFTBattleLogReader(args.log_file_path)
+    for record in reader.iter_records(args.game):
+        print(f"game {record['game']} round {record['round']}")
+        print(reader.render(record))
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+from .champion import SimpleTFTChampion
+from .tft import SimpleTFT
+from collections import defaultdict
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+
+BASE_CONFIG = {'num_players': 4, 'num_teams': 8}
+
+# Each setting is varied on its own around the base configuration
+SWEEP = {'num_players': [2, 4, 8],
+         'board_size': [3, 4],
+         'bench_size': [2, 4],
+         'shop_size': [2, 4],
+         'champ_copies': [5, 9]}
+
+LOG_FORMATS = [None, 'text', 'binary']
+
+PHASES = ['take_action', 'combat', 'post_combat', 'make_player_observations', 'make_action_masks']
+
+def fit_pool(config: dict) -> dict:
+    """
+    Raise num_teams until the champion pool is large enough for the configuration.
+
+    :param config: A dictionary containing game configuration settings.
+    :return: A copy of the configuration that SimpleTFT accepts.
+    """
+    config = dict(config)
+    while True:
+        try:
+            SimpleTFT(config)
+            return config
+        except ValueError as e:
+            if "Insufficient champions" not in str(e):
+                raise
+            config['num_teams'] = config.get('num_teams', 3) + 1
+
+def _random_actions(masks: dict, rng: np.random.Generator) -> dict:
+    actions = {}
+    for p, mask in masks.items():
+        valid = np.flatnonzero(mask)
+        actions[p] = int(valid[rng.integers(len(valid))]) if len(valid) else 0
+    return actions
+
+def _timed(timings: dict, name: str, method):
+    """
+    Wrap a method so that its wall time is added to timings[name].
+    """
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            timings[name] += time.perf_counter() - start
+    return wrapper
+
+def benchmark_config(config: dict,
+                     num_steps: int = 2000,
+                     num_resets: int = 200,
+                     log_format: str = None,
+                     seed: int = 0) -> dict:
+    """
+    Measure the throughput of one configuration with random valid actions.
+
+    Steps/sec times SimpleTFT.step, including closing the log so buffered writes are counted.
+    Per-phase costs come from a second run that times the methods each step is made of: applying the
+    actions, combat and post_combat at the end of each round, and the observation and mask builders.
+
+    :param config: A dictionary containing game configuration settings.
+    :param num_steps: Number of steps timed in each run.
+    :param num_resets: Number of resets timed.
+    :param log_format: None to disable battle logs, or the log format to write.
+    :param seed: Seed of the game and of the random actions.
+    :return: A dictionary of results.
+    """
+    config = dict(config, seed=seed, log_format=log_format or 'text')
+    with tempfile.TemporaryDirectory() as directory:
+        log_file_path = os.path.join(directory, 'battle.log') if log_format else ""
+
+        # Steps per second
+        env = SimpleTFT(config)
+        rng = np.random.default_rng(seed)
+        _, _, masks = env.reset(log_file_path)
+        elapsed = 0.0
+        for _ in range(num_steps):
+            actions = _random_actions(masks, rng)
+            start = time.perf_counter()
+            _, _, _, dones, masks = env.step(actions)
+            if all(dones.values()):
+                _, _, masks = env.reset()
+            elapsed += time.perf_counter() - start
+        start = time.perf_counter()
+        env.close()
+        elapsed += time.perf_counter() - start
+        log_bytes = os.path.getsize(log_file_path) if log_format else 0
+
+        # Resets per second
+        start = time.perf_counter()
+        for _ in range(num_resets):
+            env.reset()
+        resets_elapsed = time.perf_counter() - start
+
+        # Per-phase costs
+        env = SimpleTFT(config)
+        timings = defaultdict(float)
+        env._apply_actions = _timed(timings, 'take_action', env._apply_actions)
+        env.combat = _timed(timings, 'combat', env.combat)
+        env.post_combat = _timed(timings, 'post_combat', env.post_combat)
+        make_player_observations = _timed(timings, 'make_player_observations', env.make_player_observations)
+        make_action_masks = _timed(timings, 'make_action_masks', env.make_action_masks)
+        rng = np.random.default_rng(seed)
+        _, _, masks = env.reset(log_file_path)
+        for _ in range(num_steps):
+            _, dones = env.simulate(_random_actions(masks, rng))
+            make_player_observations()
+            masks = make_action_masks()
+            if all(dones.values()):
+                _, _, masks = env.reset()
+        env.close()
+
+    return {'config': {k: v for k, v in config.items() if k not in ('seed', 'log_format')},
+            'log_format': log_format,
+            'steps': num_steps,
+            'steps_per_sec': num_steps / elapsed,
+            'resets_per_sec': num_resets / resets_elapsed,
+            'phase_us_per_step': {name: timings[name] / num_steps * 1e6 for name in PHASES},
+            'log_bytes': log_bytes}
+
+def run_sweep(base_config: dict = BASE_CONFIG,
+              sweep: dict = SWEEP,
+              log_formats: list = LOG_FORMATS,
+              num_steps: int = 2000,
+              num_resets: int = 200,
+              seed: int = 0):
+    """
+    Benchmark the base configuration and every single-setting variation of it, with each log format.
+
+    :param base_config: The configuration every variation starts from.
+    :param sweep: A dictionary mapping a setting to the values it takes.
+    :param log_formats: Log formats to run each configuration with, None disabling logs.
+    :param num_steps: Number of steps timed in each run.
+    :param num_resets: Number of resets timed.
+    :param seed: Seed of the games and of the random actions.
+    :return: A generator of result dictionaries.
+    """
+    configs = [dict(base_config)]
+    for key, values in sweep.items():
+        configs += [dict(base_config, **{key: value}) for value in values if base_config.get(key) != value]
+    seen = set()
+    for config in configs:
+        config = fit_pool(config)
+        key = json.dumps(config, sort_keys=True)
+        if key in seen:
+            continue
+        seen.add(key)
+        for log_format in log_formats:
+            yield benchmark_config(config, num_steps, num_resets, log_format, seed)
+
+class _ReferenceChampion(object):
+    """
+    Champion with plain attributes, validated on every construction and set_power, and matched
+    field by field, as SimpleTFTChampion was before keys were interned. Used as a baseline by
+    benchmark_champions.
+    """
+    def __init__(self, preferred_position: int, team: int, level: int = 0):
+        if not all(isinstance(x, int) and x >= 0 for x in [preferred_position, team, level]):
+            raise ValueError("preferred_position, team, and level must be non-negative integers")
+        self.preferred_position = preferred_position
+        self.team = team
+        self.level = level
+        self.power = 0
+
+    def set_power(self, power: int):
+        if not isinstance(power, int):
+            raise TypeError("Power must be an integer")
+        if power < 0:
+            raise ValueError("Power cannot be negative")
+        self.power = power
+
+    def match(self, other):
+        if isinstance(other, self.__class__):
+            return all((self.preferred_position == other.preferred_position,
+                        self.team == other.team,
+                        self.level == other.level))
+        return False
+
+def _measure_champions(champion_class, keys: list) -> dict:
+    """
+    Time building, updating and matching champions of one class, and trace their memory footprint.
+
+    :param champion_class: The champion class measured.
+    :param keys: (preferred_position, team, level) of each champion built.
+    :return: A dictionary of nanoseconds per champion for each operation, and bytes per champion.
+    """
+    num = len(keys)
+    start = time.perf_counter()
+    champions = [champion_class(position, team, level) for position, team, level in keys]
+    construct = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for champ in champions:
+        champ.set_power(1)
+    set_power = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for champ, other in zip(champions, champions[1:] + champions[:1]):
+        champ.match(other)
+    match = time.perf_counter() - start
+    del champions
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        champions = [champion_class(position, team, level) for position, team, level in keys]
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    return {'construct_ns': construct / num * 1e9,
+            'set_power_ns': set_power / num * 1e9,
+            'match_ns': match / num * 1e9,
+            'bytes_per_champion': size / len(champions)}
+
+def benchmark_champions(num: int = 100000, num_teams: int = 8, num_positions: int = 4) -> dict:
+    """
+    Measure the cost of building, updating and matching champions, and their memory footprint,
+    against a reference champion with plain, validated attributes.
+
+    :param num: Number of champions built.
+    :param num_teams: Number of distinct teams among the champions.
+    :param num_positions: Number of distinct preferred positions among the champions.
+    :return: A dictionary of nanoseconds per champion for each operation and bytes per champion,
+             the same measurements for the reference champion under 'reference', and the ratio of
+             reference to SimpleTFTChampion for each under 'speedup'.
+    """
+    keys = [(i % num_positions, (i // num_positions) % num_teams, i % 3) for i in range(num)]
+    result = _measure_champions(SimpleTFTChampion, keys)
+    reference = _measure_champions(_ReferenceChampion, keys)
+    return dict(result, champions=num, reference=reference,
+                speedup={name: reference[name] / value for name, value in result.items() if value})
+
+def result_key(result: dict) -> str:
+    """
+    Identify the configuration and log format of a result, for comparing runs.
+    """
+    return json.dumps([result['config'], result['log_format']], sort_keys=True)
+
+def compare(results: list, baseline: list) -> list:
+    """
+    Compare results with a baseline run of the same configurations.
+
+    :param results: Result dictionaries.
+    :param baseline: Result dictionaries of the baseline run.
+    :return: A list of (result key, steps/sec ratio, resets/sec ratio) for every configuration in both runs.
+    """
+    baseline = {result_key(result): result for result in baseline}
+    return [(result_key(result),
+             result['steps_per_sec'] / baseline[result_key(result)]['steps_per_sec'],
+             result['resets_per_sec'] / baseline[result_key(result)]['resets_per_sec'])
+            for result in results if result_key(result) in baseline]
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Benchmark SimpleTFT throughput across configurations. "
+                                                 "Results are written as JSON lines, after a metadata line.")
+    parser.add_argument('--steps', type=int, default=2000, help="Steps timed per configuration.")
+    parser.add_argument('--resets', type=int, default=200, help="Resets timed per configuration.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-sweep', action='store_true', help="Only benchmark the base configuration.")
+    parser.add_argument('--no-logs', action='store_true', help="Only benchmark with logging disabled.")
+    parser.add_argument('--champions', action='store_true', help="Only run the champion microbenchmark.")
+    parser.add_argument('--output', default=None, help="File to write results to, instead of stdout.")
+    parser.add_argument('--baseline', default=None, help="Results file of a previous run to compare against.")
+    args = parser.parse_args(argv)
+
+    metadata = {'timestamp': time.time(),
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'platform': platform.platform(),
+                'steps': args.steps,
+                'resets': args.resets}
+    output = open(args.output, 'w') if args.output else sys.stdout
+    results = []
+    try:
+        output.write(json.dumps({'metadata': metadata}) + "\n")
+        if args.champions:
+            output.write(json.dumps(benchmark_champions()) + "\n")
+            return
+        for result in run_sweep(sweep={} if args.no_sweep else SWEEP,
+                                log_formats=[None] if args.no_logs else LOG_FORMATS,
+                                num_steps=args.steps,
+                                num_resets=args.resets,
+                                seed=args.seed):
+            results.append(result)
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+    finally:
+        if args.output:
+            output.close()
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = [json.loads(line) for line in file if 'metadata' not in json.loads(line)]
+        for key, steps_ratio, resets_ratio in compare(results, baseline):
+            print(f"{key}: steps/sec x{steps_ratio:.2f}, resets/sec x{resets_ratio:.2f}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+from .player import SimpleTFTPlayer
+from collections import OrderedDict
+import numpy as np
+
+class SimpleTFTBoardPowerCache(object):
+    # Largest number of board configurations allowed in a precomputed table
+    MAX_TABLE_SIZE = 2 ** 20
+
+    def __init__(self,
+                 board_size: int,
+                 num_teams: int,
+                 max_champ_level: int,
+                 maxsize: int = 4096,
+                 precompute: bool = False):
+        """
+        Initialize a cache of champion powers keyed by a compact board signature,
+        shared by every player of a game.
+
+        :param board_size: The size of the board.
+        :param num_teams: Number of teams in the game.
+        :param max_champ_level: The maximum attainable champion level.
+        :param maxsize: Maximum number of boards kept, least recently used boards are evicted first.
+        :param precompute: Precompute the powers of every possible board in a lookup table instead.
+        :raises ValueError: If maxsize is negative or the lookup table would be too large.
+        """
+        if not isinstance(maxsize, int) or maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer")
+
+        self.__board_size = board_size
+        self.__num_teams = num_teams
+        self.__num_levels = max_champ_level + 1
+        self.__maxsize = maxsize
+        self.__entries = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__table = None
+        if precompute:
+            self._build_table()
+
+    def _build_table(self):
+        """
+        Precompute the champion powers of every board configuration. Each board position is encoded
+        as 0 when empty, or 1 + (team * board_size + preferred_position) * num_levels + level,
+        and a board is indexed by its position codes in mixed radix.
+        """
+        B, L = self.__board_size, self.__num_levels
+        num_codes = 1 + self.__num_teams * B * L
+        if num_codes ** B > self.MAX_TABLE_SIZE:
+            raise ValueError(f"A board power table would hold {num_codes ** B} boards, "
+                             f"more than the maximum of {self.MAX_TABLE_SIZE}")
+
+        self.__radix = num_codes ** np.arange(B)
+        codes = np.arange(num_codes ** B)[:, None] // self.__radix % num_codes
+        champs = codes - 1
+        boards = np.stack([champs // (B * L), champs // L % B, champs % L], axis=-1)
+        boards[codes == 0] = -1
+        # Powers are stored compactly and widened on lookup to the dtype of the cached path
+        self.__table = SimpleTFTPlayer.calculate_champion_powers(boards).astype(np.int8)
+        self.__table.flags.writeable = False
+
+    def _table_index(self, boards: np.ndarray) -> np.ndarray:
+        """
+        Compute the lookup table index of boards.
+
+        :param boards: An array of (team, preferred_position, level) rows with shape (..., board_size, 3).
+        :return: An integer array of shape (...).
+        """
+        boards = boards.astype(np.int64)
+        team, position, level = boards[..., 0], boards[..., 1], boards[..., 2]
+        codes = 1 + (team * self.__board_size + position) * self.__num_levels + level
+        return np.where(team >= 0, codes, 0) @ self.__radix
+
+    def champion_powers(self, board: np.ndarray, signature: bytes = None) -> np.ndarray:
+        """
+        Get the power of each position of a board.
+
+        :param board: An array of (team, preferred_position, level) rows with shape (board_size, 3).
+        :param signature: The board's signature, board.tobytes(), if already known.
+        :return: A read-only integer array of shape (board_size,).
+        """
+        if self.__table is not None:
+            self.__hits += 1
+            powers = self.__table[self._table_index(board)].astype(np.int64)
+            powers.flags.writeable = False
+            return powers
+
+        if signature is None:
+            signature = board.tobytes()
+        powers = self.__entries.get(signature)
+        if powers is not None:
+            self.__hits += 1
+            self.__entries.move_to_end(signature)
+            return powers
+
+        self.__misses += 1
+        powers = SimpleTFTPlayer.calculate_champion_powers(board)
+        powers.flags.writeable = False
+        if self.__maxsize:
+            self.__entries[signature] = powers
+            if len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+        return powers
+
+    def batch_champion_powers(self, boards: np.ndarray) -> np.ndarray:
+        """
+        Get the power of each position of a stack of boards, using the lookup table if there is one.
+
+        :param boards: An array of (team, preferred_position, level) rows with shape (..., board_size, 3).
+        :return: An integer array of shape (..., board_size).
+        """
+        if self.__table is not None:
+            return self.__table[self._table_index(boards)].astype(np.int64)
+        return SimpleTFTPlayer.calculate_champion_powers(boards)
+
+    def stats(self) -> dict:
+        """
+        Get the cache statistics.
+
+        :return: A dictionary with the number of hits, misses, cached boards, the maximum size,
+                 and whether a precomputed table is used.
+        """
+        return {'hits': self.__hits,
+                'misses': self.__misses,
+                'size': len(self.__entries),
+                'maxsize': self.__maxsize,
+                'table': self.__table is not None}
+
+    def clear(self):
+        """
+        Remove every cached board and reset the statistics. A precomputed table is kept.
+        """
+        self.__entries.clear()
+        self.__hits = 0
+        self.__misses = 0
@@ -1,70 +1,94 @@
 # -*- coding: utf-8 -*-
 
 class SimpleTFTChampion(object):
-    def __init__(self, preferred_position: int, team: int, level: int = 0):
+    # Champions hold an interned, immutable (team, preferred_position, level) key, so champions are
+    # matched by identity and equal keys are stored once
+    __slots__ = ('__key', '__power', '__debug')
+
+    __keys = {}
+
+    def __init__(self, preferred_position: int, team: int, level: int = 0, debug: bool = False):
         """
         Initialize a SimpleTFT Champion with preferred position, team, and level.
 
         :param preferred_position: An integer representing the champion's preferred position.
         :param team: An integer representing the team the champion belongs to.
         :param level: An integer representing the champion's level, default is 0.
+        :param debug: Validate powers passed to set_power.
+        :raises ValueError: If any value is not a non-negative integer.
         """
-        if not all(isinstance(x, int) and x >= 0 for x in [preferred_position, team, level]):
-            raise ValueError("preferred_position, team, and level must be non-negative integers")
-            
-        self.__preferred_position = preferred_position
-        self.__team = team
-        self.__level = level
+        self.__key = self.intern(team, preferred_position, level)
         self.__power = 0
+        self.__debug = debug
+
+    @classmethod
+    def intern(cls, team: int, preferred_position: int, level: int = 0) -> tuple:
+        """
+        Get the shared key of a champion. Values are validated before the lookup, since keys of
+        other numeric types, such as numpy integers or floats, compare equal to interned keys.
+
+        :param team: An integer representing the team.
+        :param preferred_position: An integer representing the preferred position.
+        :param level: An integer representing the level.
+        :return: The interned (team, preferred_position, level) tuple.
+        :raises ValueError: If any value is not a non-negative integer.
+        """
+        if not (isinstance(team, int) and isinstance(preferred_position, int) and isinstance(level, int)
+                and team >= 0 and preferred_position >= 0 and level >= 0):
+            raise ValueError("preferred_position, team, and level must be non-negative integers")
+        key = (team, preferred_position, level)
+        interned = cls.__keys.get(key)
+        if interned is None:
+            interned = cls.__keys.setdefault(key, key)
+        return interned
+
+    @property
+    def key(self):
+        return self.__key
 
     @property
     def preferred_position(self):
-        return self.__preferred_position
+        return self.__key[1]
 
     @property
     def team(self):
-        return self.__team
+        return self.__key[0]
 
     @property
     def level(self):
-        return self.__level
-    
+        return self.__key[2]
+
     @property
     def power(self):
         return self.__power
 
     def set_preferred_position(self, position: int):
-        if isinstance(position, int) and position >= 0:
-            self.__preferred_position = position
-        else:
-            raise ValueError("Preferred position must be a non-negative integer")
+        self.__key = self.intern(self.__key[0], position, self.__key[2])
 
     def set_team(self, team: int):
-        if isinstance(team, int) and team >= 0:
-            self.__team = team
-        else:
-            raise ValueError("Team must be a non-negative integer")
+        self.__key = self.intern(team, self.__key[1], self.__key[2])
 
     def level_up(self):
         """
         Increment the champion's level by 1.
         """
-        self.__level += 1
-        
+        team, preferred_position, level = self.__key
+        self.__key = self.intern(team, preferred_position, level + 1)
+
     def set_power(self, power: int):
         """
-        Set the power of the champion.
+        Set the power of the champion. Powers are computed by the player from validated slots,
+        so they are only checked in debug mode.
 
         :param power: An integer representing the new power value of the champion.
-        :raises TypeError: If the power is not an integer.
-        :raises ValueError: If the power is negative.
+        :raises TypeError: In debug mode, if the power is not an integer.
+        :raises ValueError: In debug mode, if the power is negative.
         """
-        if not isinstance(power, int):
-            raise TypeError("Power must be an integer")
-
-        if power < 0:
-            raise ValueError("Power cannot be negative")
-
+        if self.__debug:
+            if not isinstance(power, int):
+                raise TypeError("Power must be an integer")
+            if power < 0:
+                raise ValueError("Power cannot be negative")
         self.__power = power
 
     def match(self, other):
@@ -74,8 +98,4 @@ class SimpleTFTChampion(object):
         :param other: Another instance of SimpleTFTChampion to compare with.
         :return: Boolean, True if all attributes match, False otherwise.
         """
-        if isinstance(other, self.__class__):
-            return all((self.__preferred_position == other.preferred_position,
-                        self.__team == other.team,
-                        self.__level == other.level))
-        return False
+        return isinstance(other, SimpleTFTChampion) and self.__key is other.__key
@@ -1,25 +1,86 @@
 # -*- coding: utf-8 -*-
 from .champion import SimpleTFTChampion
+from .random_stream import SimpleTFTRandomStream
+from bisect import bisect_right, insort
 import numpy as np
 
 class SimpleTFTChampionPool(object):
-    def __init__(self, 
-                 champ_copies: int, 
-                 num_teams: int, 
+    def __init__(self,
+                 champ_copies: int,
+                 num_teams: int,
                  num_positions: int,
-                 debug : bool = False):
+                 debug : bool = False,
+                 random_stream: SimpleTFTRandomStream = None):
         """
         Initialize the Champion Pool with a specified number of copies, teams, and positions.
 
+        The pool only stores how many base level copies of each (team, position) champion remain.
+
         :param champ_copies: Number of copies for each champion.
         :param num_teams: Number of teams in the pool.
         :param num_positions: Number of different positions in the pool.
         :param debug: Verbose logging enabled.
+        :param random_stream: The game's random stream. A new unseeded stream is used if not provided.
+        """
+        self.__champ_copies = champ_copies
+        self.__num_positions = num_positions
+        self.__random_stream = SimpleTFTRandomStream() if random_stream is None else random_stream
+        self.__counts = np.full((num_teams, num_positions), champ_copies, dtype=np.int64)
+
+    @property
+    def counts(self):
+        """
+        Get a read-only view of the remaining base level copies of each champion.
+
+        :return: A numpy array of shape (num_teams, num_positions).
+        """
+        counts = self.__counts.view()
+        counts.flags.writeable = False
+        return counts
+
+    def refill(self):
+        """
+        Return the pool to its initial state in place, with every copy of every champion available.
+        """
+        self.__counts.fill(self.__champ_copies)
+
+    def get_state(self) -> np.ndarray:
+        """
+        Capture the remaining copies of each champion.
+
+        :return: A read-only copy of the counts.
+        """
+        counts = self.__counts.copy()
+        counts.flags.writeable = False
+        return counts
+
+    def set_state(self, counts: np.ndarray):
         """
-        self.__champions = [SimpleTFTChampion(pos, team, 0) 
-                            for team in range(num_teams) 
-                            for pos in range(num_positions) 
-                            for _ in range(champ_copies)]
+        Restore counts captured with get_state.
+
+        :param counts: An array of shape (num_teams, num_positions).
+        """
+        self.__counts[:] = counts
+
+    def __len__(self):
+        return int(self.__counts.sum())
+
+    @staticmethod
+    def draw_from_counts(counts: np.ndarray, uniforms) -> np.ndarray:
+        """
+        Draw one copy from each row of a count array, removing it from the counts.
+        Each copy is equally likely to be drawn.
+
+        :param counts: A contiguous integer array of shape (..., num_champions), updated in place.
+        :param uniforms: Uniform random numbers in [0, 1), one per row of counts.
+        :return: The flat champion index drawn from each row.
+        """
+        flat = counts.reshape(-1, counts.shape[-1])
+        cumulative = flat.cumsum(1)
+        target = np.floor(np.reshape(uniforms, -1) * cumulative[:, -1])
+        idx = (cumulative > target[:, None]).argmax(1)
+        flat[np.arange(len(flat)), idx] -= 1
+        return idx.reshape(np.shape(uniforms))
 
     def sample(self, num: int = 1) -> list:
         """
@@ -28,27 +89,55 @@ class SimpleTFTChampionPool(object):
         :param num: Number of champions to sample.
         :return: A list of sampled SimpleTFTChampion instances.
         """
-        if num > len(self.__champions):
-            raise Exception(f"Cannot sample {num} champions from a pool of size {len(self.__champions)}")
+        return [SimpleTFTChampion(int(pos), int(team), 0) for team, pos, _ in self.sample_slots(num)]
 
-        indices = np.random.choice(len(self.__champions), size=num, replace=False)
-        sample = [self.__champions[idx] for idx in indices]
-        for idx in sorted(indices, reverse=True):
-            del self.__champions[idx]
+    def sample_slots(self, num: int = 1) -> np.ndarray:
+        """
+        Sample a specified number of champions from the pool without replacement.
+
+        :param num: Number of champions to sample.
+        :return: An array of sampled (team, preferred_position, level) rows with shape (num, 3).
+        """
+        flat = self.__counts.reshape(-1)
+        cumulative = flat.cumsum().tolist()
+        total = cumulative[-1]
+        if num > total:
+            raise Exception(f"Cannot sample {num} champions from a pool of size {total}")
 
-        return sample
+        # Each draw picks a copy by its rank among the remaining copies, like draw_from_counts. Ranks are
+        # mapped back to the full pool by skipping the copies drawn before, so one cumulative sum serves all draws.
+        drawn = []
+        sample = []
+        for u in self.__random_stream.uniforms(num).tolist():
+            rank = int(u * total)
+            total -= 1
+            for copy in drawn:
+                if copy > rank:
+                    break
+                rank += 1
+            insort(drawn, rank)
+            idx = bisect_right(cumulative, rank)
+            flat[idx] -= 1
+            sample.append(divmod(idx, self.__num_positions) + (0,))
+        return np.array(sample, dtype=np.int16).reshape(num, 3)
 
     def add(self, champ: SimpleTFTChampion):
         """
-        Add a champion back to the pool. If the champion is leveled up, 
+        Add a champion back to the pool. If the champion is leveled up,
         decompose it into base level champions.
 
         :param champ: The SimpleTFTChampion instance to be added.
         """
-        if not champ.level:
-            champ.set_power(0)
-            self.__champions.append(champ)
-        else:
-            self.__champions.extend(SimpleTFTChampion(champ.preferred_position, champ.team, 0)
-                                    for _ in range(2 ** champ.level))
+        team, preferred_position, level = champ.key
+        self.__counts[team, preferred_position] += 2 ** level
 
+    def add_slots(self, slots: np.ndarray):
+        """
+        Add champions back to the pool, decomposing leveled champions into base level champions.
+
+        :param slots: An array of (team, preferred_position, level) rows. Empty rows (-1) are ignored.
+        """
+        counts = self.__counts
+        for team, preferred_position, level in slots.tolist():
+            if team >= 0:
+                counts[team, preferred_position] += 1 << level
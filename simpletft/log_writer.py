@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+import atexit
+import threading
+
+class SimpleTFTLogWriter(object):
+    def __init__(self,
+                 log_file_path: str,
+                 flush_size: int = 1000,
+                 flush_interval: float = 1.0,
+                 binary: bool = False,
+                 header: bytes = b""):
+        """
+        Initialize a log writer that batches entries in memory and appends them to a file
+        from a background thread, keeping a single file handle open.
+
+        Entries are formatted lazily by the background thread. Entries are written in the order they were added.
+        The writer is flushed and closed at process exit if close was not called. If formatting or writing a batch
+        fails, the batch is dropped and the exception is raised by the next call to write, flush, or close.
+
+        :param log_file_path: Path of the log file, opened in append mode on the first write.
+        :param flush_size: Number of pending entries that triggers a flush.
+        :param flush_interval: Maximum number of seconds an entry stays pending.
+        :param binary: Write entries as bytes records instead of lines of text.
+        :param header: Bytes written first when the binary file is empty.
+        :raises ValueError: If flush_size or flush_interval is not positive.
+        """
+        if not isinstance(flush_size, int) or flush_size <= 0:
+            raise ValueError("flush_size must be a positive integer")
+        if not isinstance(flush_interval, (int, float)) or flush_interval <= 0:
+            raise ValueError("flush_interval must be a positive number")
+
+        self.__log_file_path = log_file_path
+        self.__flush_size = flush_size
+        self.__flush_interval = flush_interval
+        self.__binary = binary
+        self.__header = header
+        self.__file = None
+        self.__pending = []
+        self.__closed = False
+        self.__error = None
+        # Guards the pending entries; writes hold the io lock first so batches reach the file in order
+        self.__condition = threading.Condition()
+        self.__io_lock = threading.Lock()
+        self.__thread = threading.Thread(target=self._run, name="SimpleTFTLogWriter", daemon=True)
+        self.__thread.start()
+        atexit.register(self.close)
+
+    @property
+    def log_file_path(self):
+        return self.__log_file_path
+
+    def write(self, entry, *args):
+        """
+        Queue a log entry.
+
+        :param entry: A string (bytes in binary mode), or a function that formats args into one in the background thread.
+                      The arguments must not be modified after they are queued.
+        :param args: Arguments of the formatting function.
+        :raises Exception: The exception of a batch that failed since the last call.
+        """
+        self._raise_error()
+        with self.__condition:
+            if self.__closed:
+                raise ValueError("Cannot write to a closed log writer")
+            self.__pending.append((entry, args))
+            if len(self.__pending) >= self.__flush_size:
+                self.__condition.notify()
+
+    def write_lines(self, lines: list):
+        """
+        Queue preformatted lines. The writer takes ownership of the list.
+
+        :param lines: A list of strings, written one per line.
+        """
+        if lines:
+            self.write("\n".join, lines)
+
+    def flush(self):
+        """
+        Write every pending entry to the file before returning.
+
+        :raises Exception: The exception of a batch that failed since the last call, including this flush.
+        """
+        self._flush()
+        self._raise_error()
+
+    def _flush(self):
+        """
+        Write every pending entry to the file, keeping any exception for the caller's thread.
+        """
+        with self.__io_lock:
+            with self.__condition:
+                batch, self.__pending = self.__pending, []
+            self._write_batch(batch)
+
+    def _raise_error(self):
+        """
+        Raise the exception of a failed batch, if any, and forget it.
+        """
+        with self.__condition:
+            error, self.__error = self.__error, None
+        if error is not None:
+            raise error
+
+    def close(self):
+        """
+        Flush pending entries, stop the background thread, and close the file.
+
+        :raises Exception: The exception of a batch that failed since the last call, including the final flush.
+        """
+        with self.__condition:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__condition.notify()
+        self.__thread.join()
+        self._flush()
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        atexit.unregister(self.close)
+        self._raise_error()
+
+    def _run(self):
+        """
+        Background thread loop, flushing when enough entries are pending, the flush interval elapsed, or on close.
+        """
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(lambda: self.__closed or len(self.__pending) >= self.__flush_size,
+                                          timeout=self.__flush_interval)
+                closed = self.__closed
+            self._flush()
+            if closed:
+                return
+
+    def _write_batch(self, batch: list):
+        """
+        Format and append a batch of entries to the file. Must be called with the io lock held.
+        An exception is kept to be raised on the caller's thread, the first one if several batches fail.
+
+        :param batch: A list of (entry, args) tuples.
+        """
+        if not batch:
+            return
+        try:
+            if self.__file is None:
+                self.__file = open(self.__log_file_path, 'ab' if self.__binary else 'a')
+                if self.__binary and not self.__file.tell():
+                    self.__file.write(self.__header)
+            entries = ((entry(*args) if callable(entry) else entry) for entry, args in batch)
+            if self.__binary:
+                self.__file.write(b"".join(entries))
+            else:
+                self.__file.write("".join(entry + "\n" for entry in entries))
+            self.__file.flush()
+        except Exception as e:
+            with self.__condition:
+                if self.__error is None:
+                    self.__error = e
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+class SimpleTFTOpponentEnv(object):
+    def __init__(self, env, policy, opponent_seats: list):
+        """
+        Wrap a SimpleTFTVectorEnv or SubprocVectorEnv so that a batched policy plays designated seats
+        of every game. Each step gathers the observations and action masks of all opponent seats that can act,
+        across all games, calls the policy once, and scatters its actions back. Only the learner seats,
+        the seats not controlled by the policy, are exposed to the caller.
+
+        :param env: A SimpleTFTVectorEnv or SubprocVectorEnv.
+        :param policy: A callable policy(observations, action_masks) taking arrays of shape
+                       (n,) + observation_shape and (n, action_space_size), and returning n integer actions.
+        :param opponent_seats: Indices of the player seats controlled by the policy.
+        :raises ValueError: If a seat is out of range or repeated, or every seat is an opponent seat.
+        """
+        opponent_seats = [int(p) for p in opponent_seats]
+        if len(set(opponent_seats)) != len(opponent_seats) or \
+           not all(0 <= p < env.num_players for p in opponent_seats):
+            raise ValueError(f"Opponent seats must be distinct player indices below {env.num_players}")
+        if len(opponent_seats) == env.num_players:
+            raise ValueError("At least one seat must be left to the learner")
+
+        self.__env = env
+        self.__policy = policy
+        self.__opponent_seats = np.array(sorted(opponent_seats), dtype=np.intp)
+        self.__learner_seats = np.array([p for p in range(env.num_players) if p not in opponent_seats], dtype=np.intp)
+        self.__observations = None
+        self.__masks = None
+        self.__policy_calls = 0
+
+    @property
+    def env(self):
+        return self.__env
+
+    @property
+    def num_games(self):
+        return self.__env.num_games
+
+    @property
+    def learner_seats(self):
+        """
+        Get the player indices of the learner seats, in the order of the learner axis of actions and results.
+
+        :return: An integer array.
+        """
+        return self.__learner_seats.copy()
+
+    @property
+    def opponent_seats(self):
+        return self.__opponent_seats.copy()
+
+    @property
+    def observation_shape(self):
+        return self.__env.observation_shape
+
+    @property
+    def policy_calls(self):
+        """
+        Get the number of batched policy calls made so far.
+
+        :return: int
+        """
+        return self.__policy_calls
+
+    def action_space_size(self):
+        return self.__env.action_space_size()
+
+    def reset(self, *args, **kwargs) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Reset games, with the arguments of the wrapped environment's reset.
+
+        :return: Tuple containing the observations, acting players, and action masks of the learner seats.
+        """
+        observations, acting, masks = self.__env.reset(*args, **kwargs)
+        self.__observations, self.__masks = observations, masks
+        learner = self.__learner_seats
+        return observations[:, learner], acting[:, learner], masks[:, learner]
+
+    def step(self, actions: np.ndarray) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+        """
+        Process a game step in every game, with the policy acting for the opponent seats.
+
+        :param actions: An integer array of shape (num_games, len(learner_seats)).
+        :return: Tuple containing the observations, rewards, acting players, dones, and action masks
+                 of the learner seats.
+        :raises ValueError: If the actions have the wrong shape, or the environment was not reset.
+        """
+        if self.__observations is None:
+            raise ValueError("The environment must be reset before stepping")
+        actions = np.asarray(actions)
+        num_games = self.__env.num_games
+        if actions.shape != (num_games, len(self.__learner_seats)):
+            raise ValueError(f"Actions must have shape {(num_games, len(self.__learner_seats))}")
+
+        all_actions = np.zeros((num_games, self.__env.num_players), dtype=np.int64)
+        all_actions[:, self.__learner_seats] = actions
+        all_actions[:, self.__opponent_seats] = self._opponent_actions()
+
+        observations, rewards, acting, dones, masks = self.__env.step(all_actions)
+        self.__observations, self.__masks = observations, masks
+        learner = self.__learner_seats
+        return observations[:, learner], rewards[:, learner], acting[:, learner], dones[:, learner], masks[:, learner]
+
+    def _opponent_actions(self) -> np.ndarray:
+        """
+        Query the policy once for every opponent seat that has a valid action. Seats without one,
+        such as eliminated players, idle with action 0, which the environment ignores.
+
+        :return: An integer array of shape (num_games, len(opponent_seats)).
+        """
+        masks = self.__masks[:, self.__opponent_seats]
+        games, seats = np.nonzero(masks.any(-1))
+        actions = np.zeros(masks.shape[:2], dtype=np.int64)
+        if len(games):
+            batch = self.__observations[games, self.__opponent_seats[seats]]
+            actions[games, seats] = np.asarray(self.__policy(batch, masks[games, seats])).reshape(len(games))
+            self.__policy_calls += 1
+        return actions
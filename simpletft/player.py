@@ -1,42 +1,63 @@
 # -*- coding: utf-8 -*-
+from .action_spec import (SimpleTFTActionSpec, BOARD_TO_BOARD, BOARD_TO_BENCH, BENCH_TO_BOARD, BENCH_TO_BENCH,
+                          SELL_FROM_BOARD, SELL_FROM_BENCH, PURCHASE, REFRESH)
 from .champion import SimpleTFTChampion
 from .champion_pool import SimpleTFTChampionPool
 import numpy as np
+from bisect import insort
 from collections import defaultdict
 
 class SimpleTFTPlayer(object):
-    def __init__(self, 
-                     champion_pool_ptr: SimpleTFTChampionPool, 
-                     board_size: int, 
-                     bench_size: int, 
+    def __init__(self,
+                     champion_pool_ptr: SimpleTFTChampionPool,
+                     board_size: int,
+                     bench_size: int,
                      shop_size: int,
-                     debug: bool = False):
+                     debug: bool = False,
+                     board_power_cache=None):
             """
             Initialize a SimpleTFT player with a reference to a champion pool, and sizes for board, bench, and shop.
-    
+
+            Champions are stored in a single integer array with one (team, preferred_position, level)
+            row per slot, laid out as board, bench, shop. Empty slots hold -1.
+            An index from (team, preferred_position, level) to the board and bench slots holding it
+            is kept up to date, so finding a champion to merge with is a dictionary lookup.
+
             :param champion_pool_ptr: Reference to the SimpleTFTChampionPool.
             :param board_size: The size of the player's board.
             :param bench_size: The size of the player's bench.
             :param shop_size: The size of the player's shop.
             :param debug: Verbose logging enabled.
+            :param board_power_cache: Optional SimpleTFTBoardPowerCache shared with other players.
             :raises ValueError: If any size values are non-positive integers.
             """
             if not all(isinstance(x, int) and x > 0 for x in [board_size, bench_size, shop_size]):
                 raise ValueError("board_size, bench_size, and shop_size must be positive integers")
-    
+
             self.__champion_pool_ptr = champion_pool_ptr
-            self.__board = [None for _ in range(board_size)]
-            self.__bench = [None for _ in range(bench_size)]
-            self.__shop = [None for _ in range(shop_size)]
-            self.__action_positions = self.calculate_action_space_size(len(self.__board), len(self.__bench), len(self.__shop))
+            self.__board_size = board_size
+            self.__bench_size = bench_size
+            self.__shop_size = shop_size
+            self.__roster_size = board_size + bench_size
+            self.__slots = np.full((board_size + bench_size + shop_size, 3), -1, dtype=np.int16)
+            self.__keys = [None] * self.__roster_size
+            self.__locations = {}
+            self.__duplicates = set()
+            self.__champion_powers = np.zeros(board_size, dtype=np.int64)
+            self.__board_power = 0
+            self.__board_power_cache = board_power_cache
+            self.__board_signature = None
+            self.__spec = SimpleTFTActionSpec.get(board_size, bench_size, shop_size)
+            self.__action_positions = self.__spec.action_space_size
             self.__gold = 0
             self.__hp = 10
             self.__killed = False
+            self.__version = 0
             self.__debug = debug
             self.__log = []
             if self.__debug:
                 self._log_state()
-        
+
     @property
     def gold(self):
         return self.__gold
@@ -44,19 +65,169 @@ class SimpleTFTPlayer(object):
     @property
     def hp(self):
         return self.__hp
-    
+
+    @property
+    def killed(self):
+        """
+        Check whether the player's champions were already returned to the pool after death.
+
+        :return: bool
+        """
+        return self.__killed
+
+    @property
+    def version(self):
+        """
+        Get a counter that increases whenever the board, bench, shop, gold or hp changes.
+
+        :return: int
+        """
+        return self.__version
+
     @property
     def board(self):
-        return self.__board.copy()
-    
+        return self._make_champions(0, self.__board_size)
+
     @property
     def bench(self):
-        return self.__bench.copy()
-    
+        return self._make_champions(self.__board_size, self.__roster_size)
+
     @property
     def shop(self):
-        return self.__shop.copy()
-    
+        return self._make_champions(self.__roster_size, len(self.__slots))
+
+    @property
+    def slots(self):
+        """
+        Get a read-only view of the (team, preferred_position, level) slot array,
+        laid out as board, bench, shop. Empty slots hold -1.
+
+        :return: A numpy array of shape (board_size + bench_size + shop_size, 3).
+        """
+        slots = self.__slots.view()
+        slots.flags.writeable = False
+        return slots
+
+    @property
+    def champion_powers(self):
+        """
+        Get a read-only view of the power of each board position, as of the last board state update.
+
+        :return: A numpy array of shape (board_size,).
+        """
+        powers = self.__champion_powers.view()
+        powers.flags.writeable = False
+        return powers
+
+    def clear(self):
+        """
+        Return the player to its initial state in place: empty board, bench, and shop, no gold, and full health.
+        """
+        self.__slots.fill(-1)
+        self._rebuild_index()
+        self.__gold = 0
+        self.__hp = 10
+        self.__killed = False
+        self.__version += 1
+        self.update_board_state()
+        self.__log = []
+        if self.__debug:
+            self._log_state()
+
+    def get_state(self) -> tuple:
+        """
+        Capture the player's state.
+
+        :return: Tuple of (slots copy, gold, hp, killed).
+        """
+        return self.__slots.copy(), self.__gold, self.__hp, self.__killed
+
+    def set_state(self, state: tuple):
+        """
+        Restore a state captured with get_state.
+
+        :param state: Tuple of (slots, gold, hp, killed).
+        """
+        slots, self.__gold, self.__hp, self.__killed = state
+        self.__slots[:] = slots
+        self._rebuild_index()
+        self.__version += 1
+        self.update_board_state()
+
+    def _index_set(self, i: int, key: tuple):
+        """
+        Record the champion a board or bench slot holds in the index. Slot contents are written separately.
+
+        :param i: The slot index.
+        :param key: The (team, preferred_position, level) tuple of the champion, or None for an empty slot.
+        """
+        old_key = self.__keys[i]
+        if old_key is not None:
+            locations = self.__locations[old_key]
+            locations.remove(i)
+            if not locations:
+                del self.__locations[old_key]
+            elif len(locations) == 1:
+                self.__duplicates.discard(old_key)
+        self.__keys[i] = key
+        if key is not None:
+            locations = self.__locations.get(key)
+            if locations is None:
+                self.__locations[key] = [i]
+            else:
+                insort(locations, i)
+                self.__duplicates.add(key)
+
+    def _rebuild_index(self):
+        """
+        Rebuild the index of board and bench slots from scratch.
+        """
+        self.__keys = [None] * self.__roster_size
+        self.__locations = {}
+        self.__duplicates = set()
+        for i, key in enumerate(self.__slots[:self.__roster_size].tolist()):
+            if key[0] >= 0:
+                self._index_set(i, tuple(key))
+
+    def _make_champions(self, start: int, stop: int) -> list:
+        """
+        Build SimpleTFTChampion instances for a range of slots.
+
+        :param start: The first slot of the range.
+        :param stop: The end of the range (exclusive).
+        :return: A list containing a SimpleTFTChampion, or None, for each slot.
+        """
+        champions = []
+        for i in range(start, stop):
+            champ = self._make_champion(self.__slots[i], self.__debug)
+            if champ and i < self.__board_size:
+                champ.set_power(int(self.__champion_powers[i]))
+            champions.append(champ)
+        return champions
+
+    @staticmethod
+    def _make_champion(slot, debug: bool = False) -> SimpleTFTChampion:
+        """
+        Build a SimpleTFTChampion from a slot row.
+
+        :param slot: A (team, preferred_position, level) row.
+        :param debug: Verbose checks enabled on the champion.
+        :return: A SimpleTFTChampion instance, or None for an empty slot.
+        """
+        if slot[0] < 0:
+            return None
+        return SimpleTFTChampion(int(slot[1]), int(slot[0]), int(slot[2]), debug)
+
+    @staticmethod
+    def _describe(slot):
+        """
+        Describe a slot row for logging.
+
+        :param slot: A (team, preferred_position, level) row.
+        :return: A (team, preferred_position, level) tuple of ints, or None for an empty slot.
+        """
+        return tuple(int(x) for x in slot) if slot[0] >= 0 else None
+
     @staticmethod
     def calculate_action_space_size(board_size, bench_size, shop_size):
         """
@@ -64,18 +235,39 @@ class SimpleTFTPlayer(object):
         """
         # Board actions: move within board, move to bench, sell
         board_actions = board_size * (board_size - 1 + bench_size + 1)
-    
+
         # Bench actions: move to board, sell
         bench_actions = bench_size * (board_size + 1)
-    
+
         # Shop actions: buy (equals shop size)
         shop_actions = shop_size
-    
+
         # Additional actions: refresh shop, idle action
         additional_actions = 2
-    
+
         return board_actions + bench_actions + shop_actions + additional_actions
-        
+
+    @staticmethod
+    def calculate_champion_powers(board: np.ndarray) -> np.ndarray:
+        """
+        Calculate the power of each board position, assigning power based on level, preferred position,
+        and bonuses for having teammates with different preferred positions.
+
+        :param board: An array of (team, preferred_position, level) rows with shape (..., board_size, 3).
+        :return: An integer array of shape (..., board_size), zero for empty positions.
+        """
+        board = np.asarray(board, dtype=np.int64)
+        team, position, level = board[..., 0], board[..., 1], board[..., 2]
+        occupied = team >= 0
+
+        # Team composition bonus: a teammate on the board with a different preferred position
+        teammates = (team[..., :, None] == team[..., None, :]) & occupied[..., None, :]
+        team_bonus = (teammates & (position[..., :, None] != position[..., None, :])).any(-1)
+
+        # Base power from champion level and preferred position bonus
+        powers = level + 1 + (position == np.arange(board.shape[-2])) + team_bonus
+        return np.where(occupied, powers, 0)
+
     def take_action(self, action: int):
         """
         Execute an action based on the given action code.
@@ -89,54 +281,72 @@ class SimpleTFTPlayer(object):
             raise ValueError(f"Action must be within the range 0 to {self.__action_positions * self.__action_positions - 1}")
 
         if self.is_alive():
-            action_from, action_to = self._map_action_index_to_from_to(action)
+            kind, first, second = self.__spec.decode(action)
             if self.__debug:
+                action_from, action_to = self._map_action_index_to_from_to(action)
                 self.__log.append(f"action: {action}, action from: {action_from}, action to: {action_to}")
-            
-            if action_from < len(self.__board):
-                self._process_board_actions(action_from, action_to)
-            elif action_from < len(self.__board) + len(self.__bench):
-                self._process_bench_actions(action_from, action_to)
-            elif action_from < len(self.__board) + len(self.__bench) + len(self.__shop):
-                self._process_shop_actions(action_from, action_to)
-            else:
-                self._process_other_actions(action_from)
+
+            if kind == BOARD_TO_BOARD:
+                self.move_board_to_board(first, second)
+            elif kind == BOARD_TO_BENCH:
+                self.move_board_to_bench(first, second)
+            elif kind == BENCH_TO_BOARD:
+                self.move_bench_to_board(first, second)
+            elif kind == BENCH_TO_BENCH:
+                self.move_bench_to_bench(first, second)
+            elif kind == SELL_FROM_BOARD:
+                self.sell_from_board(first)
+            elif kind == SELL_FROM_BENCH:
+                self.sell_from_bench(first)
+            elif kind == PURCHASE:
+                self.purchase_from_shop(first)
+            elif kind == REFRESH:
+                self.refresh_shop()
             self.update_board_state()
 
     def _map_action_index_to_from_to(self, action_index):
         """
         Map an action index to corresponding from and to action positions.
-    
+
+        :param action_index: Linear index of the action.
+        :return: Tuple of (action_from, action_to).
+        """
+        return self.map_action_index_to_from_to(action_index, self.__board_size, self.__bench_size, self.__shop_size)
+
+    @staticmethod
+    def map_action_index_to_from_to(action_index, board_size, bench_size, shop_size):
+        """
+        Map an action index to corresponding from and to action positions.
+
         :param action_index: Linear index of the action.
         :param board_size: Size of the board.
         :param bench_size: Size of the bench.
         :param shop_size: Size of the shop.
         :return: Tuple of (action_from, action_to).
         """
-        board_size, bench_size, shop_size = len(self.__board), len(self.__bench), len(self.__shop)
         total_board_actions = board_size * (board_size + bench_size)
         total_bench_actions = bench_size * (board_size + 1)
-    
+
         # Check if action is a board action
         if action_index < total_board_actions:
             action_from = action_index // (board_size + bench_size)
             action_to = action_index % (board_size + bench_size)
             action_to += action_to >= action_from
             return action_from, action_to
-    
+
         # Adjust index for bench actions
         action_index -= total_board_actions
-    
+
         # Check if action is a bench action
         if action_index < total_bench_actions:
             action_from = (action_index // (board_size + 1)) + board_size
             action_to = action_index % (board_size + 1)
             action_to += (action_to >= board_size) * 2
             return action_from, action_to
-    
+
         # Adjust index for shop actions
         action_index -= total_bench_actions
-    
+
         # Check if action is a shop action
         if action_index < shop_size:
             return board_size + bench_size + action_index, 0
@@ -145,140 +355,68 @@ class SimpleTFTPlayer(object):
         return board_size + bench_size + shop_size + action_index, 0
 
 
-    def _process_board_actions(self, action_from: int, action_to: int):
-        """
-        Process actions originating from the board.
-
-        :param action_from: The board position from which the action originates.
-        :param action_to: The target position of the action.
-        """
-        if action_to < len(self.__board):
-            self.move_board_to_board(action_from, action_to)
-        elif action_to < len(self.__board) + len(self.__bench):
-            bench_dest = action_to - len(self.__board)
-            self.move_board_to_bench(action_from, bench_dest)
-        elif action_to == len(self.__board) + len(self.__bench):
-            self.sell_from_board(action_from)
-
-    def _process_bench_actions(self, action_from: int, action_to: int):
-        """
-        Process actions originating from the bench.
-
-        :param action_from: The bench position from which the action originates.
-        :param action_to: The target position of the action.
-        """
-        bench_from = action_from - len(self.__board)
-        if action_to < len(self.__board):
-            self.move_bench_to_board(bench_from, action_to)
-        elif action_to < len(self.__board) + len(self.__bench):
-            bench_dest = action_to - len(self.__board)
-            self.move_bench_to_bench(bench_from, bench_dest)
-        elif action_to == len(self.__board) + len(self.__bench):
-            self.sell_from_bench(bench_from)
-
-    def _process_shop_actions(self, action_from: int, action_to: int):
-        """
-        Process actions originating from the shop.
-
-        :param action_from: The shop position from which the action originates.
-        :param action_to: The target position of the action.
-        """
-        shop_from = action_from - len(self.__board) - len(self.__bench)
-        self.purchase_from_shop(shop_from)
-
-    def _process_other_actions(self, action_from: int):
-        """
-        Process other types of actions.
-
-        :param action_to: The target position of the action.
-        """
-        if action_from == len(self.__board) + len(self.__bench) + len(self.__shop):
-            self.refresh_shop()
-        # 'pass' for action_to == 1 is already implicit
-        
     def make_action_mask(self) -> np.array:
         """
         Create an action mask representing the valid actions the player can take.
 
         :return: A numpy array representing the action mask.
         """
-        mask = np.zeros(self.__action_positions)
+        if not self.is_alive():
+            return np.zeros(self.__action_positions)
 
-        if self.is_alive():
-            action_index = 0
-
-            # Board Actions
-            for i_board, pos in enumerate(self.__board):
-                action_index = self._update_mask_for_board(mask, action_index, pos)
-
-            # Bench Actions
-            for i_bench, pos in enumerate(self.__bench):
-                action_index = self._update_mask_for_bench(mask, action_index, pos)
+        teams = self.__slots[:, 0].tolist()
+        has_gold = self.__gold > 0
 
-            # Shop Actions
-            for i_shop, pos in enumerate(self.__shop):
-                action_index = self._update_mask_for_shop(mask, action_index, pos)
+        # Board and bench actions need a champion
+        available = [team >= 0 for team in teams[:self.__roster_size]]
 
-            # Additional Actions (e.g., refresh shop, idle)
-            if self.__gold > 0:
-                mask[action_index] = 1  # Refresh shop action
-            action_index += 1
+        # Shop champions can be bought with gold if there is bench space or a matching champion
+        can_buy = [has_gold and team >= 0 for team in teams[self.__roster_size:]]
+        if any(can_buy) and all(available[self.__board_size:]):
+            can_buy = [buy and match for buy, match in zip(can_buy, self._shop_matches())]
 
-            mask[action_index] = 1  # Always allow idle action
+        # Refresh needs gold, idle is always allowed
+        available += can_buy
+        available += (has_gold, True)
+        return self.__spec.make_action_masks(available)
 
-        return mask
-
-    def _update_mask_for_board(self, mask, action_index, pos):
-        """
-        Update the action mask for board positions.
-        
-        :param mask: The action mask to update.
-        :param action_index: The current action index in the mask.
-        :return: The updated action index.
+    def _shop_matches(self) -> list:
         """
-        num_actions = len(self.__board) + len(self.__bench)  # Move within board, to bench, and sell
-        if pos:
-            mask[action_index:action_index + num_actions] = 1
-        return action_index + num_actions
+        Check which shop champions have a matching champion on the board or bench.
 
-    def _update_mask_for_bench(self, mask, action_index, pos):
+        :return: A list of booleans with one entry per shop position.
         """
-        Update the action mask for bench positions.
-        
-        :param mask: The action mask to update.
-        :param action_index: The current action index in the mask.
-        :return: The updated action index.
-        """
-        num_actions = len(self.__board) + 1  # Move to board and sell
-        if pos:
-            mask[action_index:action_index + num_actions] = 1
-        return action_index + num_actions
+        locations = self.__locations
+        return [tuple(champ) in locations for champ in self.__slots[self.__roster_size:].tolist()]
 
-    def _update_mask_for_shop(self, mask, action_index, pos):
-        """
-        Update the action mask for shop positions.
-        
-        :param mask: The action mask to update.
-        :param action_index: The current action index in the mask.
-        :param pos: The champion position in the shop.
-        :return: The updated action index.
+    def _swap(self, i: int, j: int):
         """
-        if pos and self.__gold > 0:
-            if not self.bench_full() or self._has_matching_champion(pos):
-                mask[action_index] = 1
-        return action_index + 1
+        Swap the contents of two board or bench slots.
 
-
-    def _has_matching_champion(self, champion: SimpleTFTChampion) -> bool:
+        :param i: The first slot index.
+        :param j: The second slot index.
         """
-        Check if there is a matching champion on the board or bench.
+        if self.__slots[i, 0] < 0 and self.__slots[j, 0] < 0:
+            return
+        self.__version += 1
+        if i == j:
+            return
+        from_champ = self.__slots[i].copy()
+        self.__slots[i] = self.__slots[j]
+        self.__slots[j] = from_champ
+        key_i, key_j = self.__keys[i], self.__keys[j]
+        if key_i != key_j:
+            self._index_set(i, key_j)
+            self._index_set(j, key_i)
 
-        :param champion: The SimpleTFTChampion instance to match against.
-        :return: True if a matching champion is found, False otherwise.
+    def _log_swap(self, from_type: str, from_pos: int, from_slot: int, to_type: str, to_pos: int, to_slot: int):
+        """
+        Log a swap of two slots after it happened.
         """
-        # Check both the board and the bench for a match
-        return any(champ.match(champion) for champ in self.__board if champ) or \
-               any(champ.match(champion) for champ in self.__bench if champ)
+        from_champ = self._describe(self.__slots[to_slot])
+        to_champ = self._describe(self.__slots[from_slot])
+        self.__log.append(f"moved {from_champ} from {from_type} position {from_pos} to {to_type} position {to_pos}")
+        self.__log.append(f"moved {to_champ} from {to_type} position {to_pos} to {from_type} position {from_pos}")
 
     def move_board_to_board(self, board_from: int, board_to: int):
         """
@@ -288,19 +426,13 @@ class SimpleTFTPlayer(object):
         :param board_to: The target position of the champion on the board.
         :raises IndexError: If either board_from or board_to are out of bounds.
         """
-        if not 0 <= board_from < len(self.__board) or not 0 <= board_to < len(self.__board):
+        if not 0 <= board_from < self.__board_size or not 0 <= board_to < self.__board_size:
             raise IndexError("Board positions are out of bounds")
 
-        from_champ = self.__board[board_from]
-        to_champ = self.__board[board_to]
-        self.__board[board_from] = to_champ
-        self.__board[board_to] = from_champ
-        
+        self._swap(board_from, board_to)
+
         if self.__debug:
-            from_champ = (from_champ.team, from_champ.preferred_position, from_champ.level) if from_champ else from_champ
-            to_champ = (to_champ.team, to_champ.preferred_position, to_champ.level) if to_champ else to_champ
-            self.__log.append(f"moved {from_champ} from board position {board_from} to board position {board_to}")
-            self.__log.append(f"moved {to_champ} from board position {board_to} to board position {board_from}")
+            self._log_swap('board', board_from, board_from, 'board', board_to, board_to)
 
     def move_board_to_bench(self, board_from: int, bench_to: int):
         """
@@ -310,19 +442,13 @@ class SimpleTFTPlayer(object):
         :param bench_to: The target position on the bench.
         :raises IndexError: If board_from or bench_to are out of bounds.
         """
-        if not 0 <= board_from < len(self.__board) or not 0 <= bench_to < len(self.__bench):
+        if not 0 <= board_from < self.__board_size or not 0 <= bench_to < self.__bench_size:
             raise IndexError("Board or bench positions are out of bounds")
 
-        from_champ = self.__board[board_from]
-        to_champ = self.__bench[bench_to]
-        self.__board[board_from] = to_champ
-        self.__bench[bench_to] = from_champ
-        
+        self._swap(board_from, self.__board_size + bench_to)
+
         if self.__debug:
-            from_champ = (from_champ.team, from_champ.preferred_position, from_champ.level) if from_champ else from_champ
-            to_champ = (to_champ.team, to_champ.preferred_position, to_champ.level) if to_champ else to_champ
-            self.__log.append(f"moved {from_champ} from board position {board_from} to bench position {bench_to}")
-            self.__log.append(f"moved {to_champ} from bench position {bench_to} to board position {board_from}")
+            self._log_swap('board', board_from, board_from, 'bench', bench_to, self.__board_size + bench_to)
 
     def move_bench_to_board(self, bench_from: int, board_to: int):
         """
@@ -332,19 +458,13 @@ class SimpleTFTPlayer(object):
         :param board_to: The target position on the board.
         :raises IndexError: If bench_from or board_to are out of bounds.
         """
-        if not 0 <= bench_from < len(self.__bench) or not 0 <= board_to < len(self.__board):
+        if not 0 <= bench_from < self.__bench_size or not 0 <= board_to < self.__board_size:
             raise IndexError("Bench or board positions are out of bounds")
 
-        from_champ = self.__bench[bench_from]
-        to_champ = self.__board[board_to]
-        self.__bench[bench_from] = to_champ
-        self.__board[board_to] = from_champ
-        
+        self._swap(self.__board_size + bench_from, board_to)
+
         if self.__debug:
-            from_champ = (from_champ.team, from_champ.preferred_position, from_champ.level) if from_champ else from_champ
-            to_champ = (to_champ.team, to_champ.preferred_position, to_champ.level) if to_champ else to_champ
-            self.__log.append(f"moved {from_champ} from bench position {bench_from} to board position {board_to}")
-            self.__log.append(f"moved {to_champ} from board position {board_to} to bench position {bench_from}")
+            self._log_swap('bench', bench_from, self.__board_size + bench_from, 'board', board_to, board_to)
 
     def move_bench_to_bench(self, bench_from: int, bench_to: int):
         """
@@ -354,19 +474,14 @@ class SimpleTFTPlayer(object):
         :param bench_to: The target position of the champion on the bench.
         :raises IndexError: If either bench_from or bench_to are out of bounds.
         """
-        if not 0 <= bench_from < len(self.__bench) or not 0 <= bench_to < len(self.__bench):
+        if not 0 <= bench_from < self.__bench_size or not 0 <= bench_to < self.__bench_size:
             raise IndexError("Bench positions are out of bounds")
 
-        from_champ = self.__bench[bench_from]
-        to_champ = self.__bench[bench_to]
-        self.__bench[bench_from] = to_champ
-        self.__bench[bench_to] = from_champ
-        
+        self._swap(self.__board_size + bench_from, self.__board_size + bench_to)
+
         if self.__debug:
-            from_champ = (from_champ.team, from_champ.preferred_position, from_champ.level) if from_champ else from_champ
-            to_champ = (to_champ.team, to_champ.preferred_position, to_champ.level) if to_champ else to_champ
-            self.__log.append(f"moved {from_champ} from bench position {bench_from} to bench position {bench_to}")
-            self.__log.append(f"moved {to_champ} from bench position {bench_to} to bench position {bench_from}")
+            self._log_swap('bench', bench_from, self.__board_size + bench_from,
+                           'bench', bench_to, self.__board_size + bench_to)
 
     def purchase_from_shop(self, shop_from: int):
         """
@@ -376,58 +491,39 @@ class SimpleTFTPlayer(object):
         :raises IndexError: If shop_from is out of bounds.
         :raises ValueError: If there is insufficient gold or the shop position is empty.
         """
-        if not 0 <= shop_from < len(self.__shop):
+        if not 0 <= shop_from < self.__shop_size:
             raise IndexError("Shop position is out of bounds")
         if self.__gold <= 0:
             raise ValueError("Insufficient gold to make a purchase")
-        if not self.__shop[shop_from]:
+        shop_i = self.__roster_size + shop_from
+        if self.__slots[shop_i, 0] < 0:
             raise ValueError("No champion at the specified shop position")
 
-        if self.add_champion(self.__shop[shop_from]):
+        if self.add_slot(self.__slots[shop_i].copy()):
             self.__gold -= 1
-            self.__shop[shop_from] = None
+            self.__slots[shop_i] = -1
             if self.__debug:
                 self.__log.append(f"purchased champion from shop position {shop_from}")
         else:
             if self.__debug:
-                self.__log.append(f"unable to purchase champion from shop position {shop_from}")            
+                self.__log.append(f"unable to purchase champion from shop position {shop_from}")
 
     def find_matches(self):
         """
         Find and process matching champions on the board and bench to level them up.
-        """
-        # Searching for matches on the board
-        for board_i, pos in enumerate(self.__board):
-            if pos:
-                if self._process_match_in_list(self.__board, pos, start_index=board_i + 1):
-                    return  # Restart search after finding a match
-                if self._process_match_in_list(self.__bench, pos):
-                    return  # Restart search after finding a match
-                
-        # Searching for matches on the bench
-        for bench_i, pos in enumerate(self.__bench):
-            if pos:
-                if self._process_match_in_list(self.__bench, pos, start_index=bench_i + 1):
-                    return  # Restart search after finding a match
-
-    def _process_match_in_list(self, lst, champion, start_index=0):
-        """
-        Process matching champions in a given list (board or bench).
-
-        :param lst: The list to search in (either board or bench).
-        :param champion: The champion to match against.
-        :param start_index: The index to start searching from.
-        :return: True if a match was found and processed, False otherwise.
-        """
-        for i, match_pos in enumerate(lst[start_index:], start=start_index):
-            if match_pos and champion.match(match_pos):
-                champion.level_up()
-                lst[i] = None
-                if self.__debug:
-                    self.__log.append(f"leveled {(champion.team, champion.preferred_position)} to level {champion.level} after finding match")
-                self.find_matches()  # Recursively search for new matches
-                return True
-        return False
+        The first slot holding a duplicated champion absorbs the next slot holding it,
+        and leveling up can cascade into further matches.
+        """
+        while self.__duplicates:
+            key = min(self.__duplicates, key=lambda k: self.__locations[k][0])
+            champion_i, match_i = self.__locations[key][:2]
+            self.__slots[champion_i, 2] += 1
+            self.__slots[match_i] = -1
+            self._index_set(match_i, None)
+            self._index_set(champion_i, (key[0], key[1], key[2] + 1))
+            if self.__debug:
+                champion = self.__slots[champion_i]
+                self.__log.append(f"leveled {(int(champion[0]), int(champion[1]))} to level {int(champion[2])} after finding match")
 
     def add_champion(self, champ: SimpleTFTChampion) -> bool:
         """
@@ -436,49 +532,55 @@ class SimpleTFTPlayer(object):
         :param champ: The SimpleTFTChampion instance to be added.
         :return: True if the champion was successfully added or matched, False otherwise.
         """
-        for pos in self.__board:
-            if pos and pos.match(champ):
-                pos.level_up()
-                if self.__debug:
-                    self.__log.append(f"added {(champ.team, champ.preferred_position, champ.level)} by leveling {(pos.team, pos.preferred_position, pos.level)} on board")
-                self.find_matches()
-                return True
+        return self.add_slot(np.array(champ.key, dtype=np.int16))
 
-        for pos in self.__bench:
-            if pos and pos.match(champ):
-                pos.level_up()
-                if self.__debug:
-                    self.__log.append(f"added {(champ.team, champ.preferred_position, champ.level)} by leveling {(pos.team, pos.preferred_position, pos.level)} on bench")
-                self.find_matches()
-                return True
+    def add_slot(self, champ: np.ndarray) -> bool:
+        """
+        Attempt to add a champion, given as a slot row, to the board or bench.
 
-        for i, pos in enumerate(self.__bench):
-            if not pos:
-                self.__bench[i] = champ
+        :param champ: The (team, preferred_position, level) row to be added.
+        :return: True if the champion was successfully added or matched, False otherwise.
+        """
+        key = tuple(champ.tolist())
+        locations = self.__locations.get(key)
+        if locations:
+            i = locations[0]
+            self.__slots[i, 2] += 1
+            self._index_set(i, (key[0], key[1], key[2] + 1))
+            self.__version += 1
+            if self.__debug:
+                location = 'board' if i < self.__board_size else 'bench'
+                self.__log.append(f"added {self._describe(champ)} by leveling {self._describe(self.__slots[i])} on {location}")
+            self.find_matches()
+            return True
+
+        for i in range(self.__board_size, self.__roster_size):
+            if self.__slots[i, 0] < 0:
+                self.__slots[i] = champ
+                self._index_set(i, key)
+                self.__version += 1
                 if self.__debug:
-                    self.__log.append(f"added {(champ.team, champ.preferred_position, champ.level)} to bench")
+                    self.__log.append(f"added {self._describe(champ)} to bench")
                 return True
-            
+
         if self.__debug:
-            self.__log.append(f"unable to add {(champ.team, champ.preferred_position, champ.level)} to bench")
+            self.__log.append(f"unable to add {self._describe(champ)} to bench")
         return False  # No space or match found
-        
+
     def refresh_shop(self):
         """
-        Refresh the shop's champions if the player has enough gold. 
+        Refresh the shop's champions if the player has enough gold.
         Existing champions in the shop are returned to the champion pool.
         """
         if self.__gold <= 0:
             raise ValueError("Insufficient gold to refresh shop")
 
-        for i in range(len(self.__shop)):
-            if self.__shop[i]:
-                self.__champion_pool_ptr.add(self.__shop[i])
-                self.__shop[i] = None
+        self._return_champions_to_pool(self.__roster_size, len(self.__slots))
 
-        self.__shop = self.__champion_pool_ptr.sample(len(self.__shop))
+        self.__slots[self.__roster_size:] = self.__champion_pool_ptr.sample_slots(self.__shop_size)
         self.__gold -= 1
-        
+        self.__version += 1
+
         if self.__debug:
             self.__log.append("refreshed shop")
 
@@ -489,15 +591,10 @@ class SimpleTFTPlayer(object):
         :param board_from: The board position of the champion to be sold.
         :raises IndexError: If board_from is out of bounds.
         """
-        if not 0 <= board_from < len(self.__board):
+        if not 0 <= board_from < self.__board_size:
             raise IndexError("Board position is out of bounds")
 
-        if self.__board[board_from]:
-            self.__champion_pool_ptr.add(self.__board[board_from])
-            self.__gold += 2 ** self.__board[board_from].level
-            if self.__debug:
-                self.__log.append(f"sold {(self.__board[board_from].team, self.__board[board_from].preferred_position, self.__board[board_from].level)} from board position {board_from} for {2 ** self.__board[board_from].level} gold")
-            self.__board[board_from] = None
+        self._sell(board_from, 'board', board_from)
 
     def sell_from_bench(self, bench_from: int):
         """
@@ -506,51 +603,75 @@ class SimpleTFTPlayer(object):
         :param bench_from: The bench position of the champion to be sold.
         :raises IndexError: If bench_from is out of bounds.
         """
-        if not 0 <= bench_from < len(self.__bench):
+        if not 0 <= bench_from < self.__bench_size:
             raise IndexError("Bench position is out of bounds")
 
-        if self.__bench[bench_from]:
-            self.__champion_pool_ptr.add(self.__bench[bench_from])
-            self.__gold += 2 ** self.__bench[bench_from].level
+        self._sell(self.__board_size + bench_from, 'bench', bench_from)
+
+    def _sell(self, i: int, position_type: str, position: int):
+        """
+        Sell the champion in a slot, if any, returning it to the champion pool.
+
+        :param i: The slot index.
+        :param position_type: Type of the position (e.g., 'board', 'bench'), for logging.
+        :param position: The position within the board or bench, for logging.
+        """
+        if self.__slots[i, 0] >= 0:
+            value = 2 ** int(self.__slots[i, 2])
             if self.__debug:
-                self.__log.append(f"sold {(self.__bench[bench_from].team, self.__bench[bench_from].preferred_position, self.__bench[bench_from].level)} from bench position {bench_from} for {2 ** self.__bench[bench_from].level} gold")
-            self.__bench[bench_from] = None
-        
+                self.__log.append(f"sold {self._describe(self.__slots[i])} from {position_type} position {position} for {value} gold")
+            self._return_champions_to_pool(i, i + 1)
+            self.__gold += value
+
     def calculate_board_power(self) -> int:
         """
         Calculate the total power of the board by summing the power of each champion.
+        The sum is kept from the last board state update that changed the board.
 
         :return: An integer representing the total power of the board.
         """
         self.update_board_state()  # Ensure board state is updated
-        return sum(champ.power for champ in self.__board if champ)
-    
+        return self.__board_power
+
     def update_board_state(self):
         """
-        Update the state of each champion on the board, assigning power based on level, preferred position,
+        Update the power of each board position, assigning power based on level, preferred position,
         and bonuses for having teammates with different preferred positions.
+        Powers are only recalculated when the board changed since the last update.
         """
+        board = self.__slots[:self.__board_size]
+        signature = board.tobytes()
+        if signature == self.__board_signature:
+            return
+        self.__board_signature = signature
+
+        if self.__board_power_cache is not None:
+            self.__champion_powers = self.__board_power_cache.champion_powers(board, signature)
+            self.__board_power = int(self.__champion_powers.sum())
+            return
+
+        board = board.tolist()
+
         # First pass: Assemble teams with unique preferred positions
         teams = defaultdict(set)
-        for champ in self.__board:
-            if champ:
-                teams[champ.team].add(champ.preferred_position)
-        
+        for team, preferred_position, level in board:
+            if team >= 0:
+                teams[team].add(preferred_position)
+
         # Second pass: Calculate power for each champion
-        for i, champ in enumerate(self.__board):
-            if champ:
+        for i, (team, preferred_position, level) in enumerate(board):
+            if team >= 0:
                 # Base power from champion level and preferred position bonus
-                champ_power = champ.level + 1
-                if i == champ.preferred_position:
+                champ_power = level + 1
+                if i == preferred_position:
                     champ_power += 1
-        
+
                 # Team composition bonus
-                team_bonus = len(teams[champ.team]) > 1
-                champ.set_power(champ_power + team_bonus)
-                
-        for champ in self.__bench:
-            if champ:
-                champ.set_power(0)
+                team_bonus = len(teams[team]) > 1
+                self.__champion_powers[i] = champ_power + team_bonus
+            else:
+                self.__champion_powers[i] = 0
+        self.__board_power = int(self.__champion_powers.sum())
 
     def add_gold(self, amount: int):
         """
@@ -562,6 +683,7 @@ class SimpleTFTPlayer(object):
         if amount < 0:
             raise ValueError("Cannot add a negative amount of gold")
         self.__gold += amount
+        self.__version += amount > 0
         if self.__debug:
             self.__log.append(f"added {amount} gold")
 
@@ -575,6 +697,7 @@ class SimpleTFTPlayer(object):
         if amount < 0:
             raise ValueError("Cannot inflict negative damage")
         self.__hp -= amount
+        self.__version += amount > 0
         if self.__debug:
             self.__log.append(f"took {amount} damage")
 
@@ -585,28 +708,29 @@ class SimpleTFTPlayer(object):
         :return: True if the player's health points are greater than 0, False otherwise.
         """
         return self.__hp > 0
-    
+
     def death_cleanup(self):
         """
-        Perform cleanup actions upon the death of the player. 
+        Perform cleanup actions upon the death of the player.
         This includes returning all champions from board, bench, and shop to the champion pool.
         """
         if not self.__killed:
-            self._return_champions_to_pool(self.__board)
-            self._return_champions_to_pool(self.__bench)
-            self._return_champions_to_pool(self.__shop)
+            self._return_champions_to_pool(0, len(self.__slots))
+            self.update_board_state()
             self.__killed = True
 
-    def _return_champions_to_pool(self, lst):
+    def _return_champions_to_pool(self, start: int, stop: int):
         """
-        Helper method to return champions from a list (board, bench, or shop) to the champion pool.
+        Helper method to return champions from a range of slots (board, bench, or shop) to the champion pool.
 
-        :param lst: The list of champions (board, bench, or shop).
+        :param start: The first slot of the range.
+        :param stop: The end of the range (exclusive).
         """
-        for i, champ in enumerate(lst):
-            if champ:
-                self.__champion_pool_ptr.add(champ)
-                lst[i] = None
+        for i in range(start, min(stop, self.__roster_size)):
+            self._index_set(i, None)
+        self.__champion_pool_ptr.add_slots(self.__slots[start:stop])
+        self.__slots[start:stop] = -1
+        self.__version += 1
 
     def board_full(self) -> bool:
         """
@@ -614,7 +738,7 @@ class SimpleTFTPlayer(object):
 
         :return: True if the board is full, False otherwise.
         """
-        return all(pos is not None for pos in self.__board)
+        return bool((self.__slots[:self.__board_size, 0] >= 0).all())
 
     def bench_full(self) -> bool:
         """
@@ -622,7 +746,7 @@ class SimpleTFTPlayer(object):
 
         :return: True if the bench is full, False otherwise.
         """
-        return all(pos is not None for pos in self.__bench)
+        return bool((self.__slots[self.__board_size:self.__roster_size, 0] >= 0).all())
 
     def add_to_bench(self, champ: SimpleTFTChampion) -> bool:
         """
@@ -635,39 +759,40 @@ class SimpleTFTPlayer(object):
         if not isinstance(champ, SimpleTFTChampion):
             raise TypeError("champ must be an instance of SimpleTFTChampion")
 
-        for i, pos in enumerate(self.__bench):
-            if not pos:
-                self.__bench[i] = champ
+        for i in range(self.__board_size, self.__roster_size):
+            if self.__slots[i, 0] < 0:
+                self.__slots[i] = champ.key
+                self._index_set(i, champ.key)
+                self.__version += 1
                 return True
         return False  # Bench is full
-    
+
     def _log_state(self):
         """
         Log the current state of the player, including gold, health, and positions of champions.
         """
         self.__log.append(f"gold: {self.__gold}, hp: {self.__hp}")
-        self._log_positions('board', self.__board)
-        self._log_positions('bench', self.__bench)
-        self._log_positions('shop', self.__shop)
-        
+        self._log_positions('board', self.__slots[:self.__board_size])
+        self._log_positions('bench', self.__slots[self.__board_size:self.__roster_size])
+        self._log_positions('shop', self.__slots[self.__roster_size:])
+
     def _log_positions(self, position_type, positions):
         """
         Log the positions (board, bench, shop) of the player.
 
         :param position_type: Type of the position (e.g., 'board', 'bench', 'shop').
-        :param positions: The positions to be logged.
+        :param positions: The slot rows to be logged.
         """
         for i, pos in enumerate(positions):
-            pos_description = (pos.team, pos.preferred_position, pos.level) if pos else None
-            self.__log.append(f"{position_type} position {i}: {pos_description}")
-            
+            self.__log.append(f"{position_type} position {i}: {self._describe(pos)}")
+
     def dump_log(self):
         """
         Dump the accumulated logs and reset the log.
-        
+
         :return: A list of logged messages.
         """
         self._log_state()
         logs = self.__log
         self.__log = []
-        return logs
\ No newline at end of file
+        return logs
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+from collections import defaultdict
+import functools
+import time
+
+class SimpleTFTProfiler(object):
+    # Number of histogram buckets; bucket i counts durations below 2 ** i microseconds
+    NUM_BUCKETS = 24
+
+    def __init__(self):
+        """
+        Initialize wall-time counters and histograms per phase, and call counters.
+
+        Methods are instrumented by replacing them on the instance with timing or counting wrappers,
+        so objects that are not instrumented pay no overhead.
+        """
+        # Time spent in timed methods called by each timed method currently running
+        self.__nested = []
+        self.clear()
+
+    def clear(self):
+        """
+        Reset every counter and histogram.
+        """
+        self.__totals = defaultdict(float)
+        self.__calls = defaultdict(int)
+        self.__histograms = defaultdict(lambda: [0] * self.NUM_BUCKETS)
+
+    def record(self, phase: str, seconds: float):
+        """
+        Record the duration of one run of a phase.
+
+        :param phase: Name of the phase.
+        :param seconds: Wall time of the run.
+        """
+        self.__totals[phase] += seconds
+        self.__calls[phase] += 1
+        self.__histograms[phase][min(int(seconds * 1e6).bit_length(), self.NUM_BUCKETS - 1)] += 1
+
+    def time_method(self, obj, name: str, phase: str = None):
+        """
+        Time every call of a method of an object. Time spent in other timed methods it calls is only
+        recorded in their own phases, so phases do not overlap.
+
+        :param obj: The object.
+        :param name: Name of the method.
+        :param phase: Name of the phase, defaults to the method name.
+        """
+        method = getattr(obj, name)
+        phase = phase or name
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            self.__nested.append(0.0)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                nested = self.__nested.pop()
+                if self.__nested:
+                    self.__nested[-1] += elapsed
+                self.record(phase, elapsed - nested)
+        setattr(obj, name, timed)
+
+    def count_method(self, obj, name: str):
+        """
+        Count every call of a method of an object.
+
+        :param obj: The object.
+        :param name: Name of the method, also used as the counter name.
+        """
+        method = getattr(obj, name)
+
+        @functools.wraps(method)
+        def counted(*args, **kwargs):
+            self.__calls[name] += 1
+            return method(*args, **kwargs)
+        setattr(obj, name, counted)
+
+    def stats(self) -> dict:
+        """
+        Get the recorded counters.
+
+        :return: A dictionary with 'phases', mapping each timed phase to its number of calls, total seconds,
+                 mean microseconds and a histogram of {upper bound in microseconds: count} for non-empty buckets,
+                 and 'calls', mapping each counted method to its number of calls.
+        """
+        phases = {}
+        for phase, total in self.__totals.items():
+            calls = self.__calls[phase]
+            phases[phase] = {'calls': calls,
+                             'total_s': total,
+                             'mean_us': total / calls * 1e6,
+                             'histogram_us': {2 ** i: n for i, n in enumerate(self.__histograms[phase]) if n}}
+        return {'phases': phases,
+                'calls': {name: n for name, n in self.__calls.items() if name not in self.__totals}}
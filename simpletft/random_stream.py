@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+def spawn_seeds(seed, num: int) -> list:
+    """
+    Derive independent seeds for several games from a single seed using SeedSequence.spawn.
+
+    :param seed: None, an integer, a SeedSequence, or a numpy Generator.
+    :param num: Number of seeds to derive.
+    :return: A list of SeedSequence (or Generator, if a Generator was given) instances.
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed.spawn(num)
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(num)
+
+class SimpleTFTRandomStream(object):
+    # Number of uniforms drawn from the generator at once
+    BLOCK_SIZE = 1024
+
+    def __init__(self, seed=None):
+        """
+        Initialize the random stream of a game. Uniforms are drawn from a numpy Generator in blocks
+        and handed out in order, so identical seeds give identical streams.
+
+        :param seed: None, an integer, a SeedSequence, or a numpy Generator.
+        """
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """
+        Restart the stream from a new seed, discarding any pre-drawn uniforms.
+
+        :param seed: None, an integer, a SeedSequence, or a numpy Generator.
+        """
+        self.__generator = np.random.default_rng(seed)
+        self.__block = np.empty(0)
+        self.__next = 0
+
+    @property
+    def generator(self):
+        return self.__generator
+
+    def uniforms(self, num: int) -> np.ndarray:
+        """
+        Get the next uniform random numbers of the stream.
+
+        :param num: Number of uniforms.
+        :return: A float array of shape (num,) with values in [0, 1).
+        """
+        if num > self.BLOCK_SIZE:
+            return self.__generator.random(num)
+        if self.__next + num > len(self.__block):
+            self.__block = self.__generator.random(self.BLOCK_SIZE)
+            self.__block.flags.writeable = False
+            self.__next = 0
+        uniforms = self.__block[self.__next:self.__next + num]
+        self.__next += num
+        return uniforms
+
+    def get_state(self) -> tuple:
+        """
+        Capture the stream's position. Pre-drawn blocks are never modified, so they are shared rather than copied.
+
+        :return: Tuple of (bit generator state, pre-drawn block, position in the block).
+        """
+        return self.__generator.bit_generator.state, self.__block, self.__next
+
+    def set_state(self, state: tuple):
+        """
+        Restore a position captured with get_state.
+
+        :param state: Tuple of (bit generator state, pre-drawn block, position in the block).
+        """
+        self.__generator.bit_generator.state, self.__block, self.__next = state
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import numpy as np
+
+META_FILE = 'meta.json'
+FIELDS = ('observations', 'actions', 'rewards', 'masks', 'dones')
+
+def trajectory_schema(observation_shape: tuple, action_space_size: int, observation_dtype=np.float32) -> dict:
+    """
+    Get the per-transition shape and type of every recorded field.
+
+    :param observation_shape: Shape of a single player's observation.
+    :param action_space_size: Size of the action space.
+    :param observation_dtype: Type observations are stored as.
+    :return: A dictionary mapping field name to (shape, dtype).
+    """
+    return {'observations': (tuple(observation_shape), np.dtype(observation_dtype)),
+            'actions': ((), np.dtype(np.int32)),
+            'rewards': ((), np.dtype(np.float32)),
+            'masks': ((action_space_size,), np.dtype(bool)),
+            'dones': ((), np.dtype(bool))}
+
+def _stack(values, players: list = None) -> np.ndarray:
+    """
+    Stack per-player values given as a dictionary, in player order, or pass an array through.
+    """
+    if isinstance(values, dict):
+        return np.stack([np.asarray(values[p]) for p in (values if players is None else players)])
+    return np.asarray(values)
+
+class SimpleTFTTrajectoryRecorder(object):
+    def __init__(self,
+                 directory: str,
+                 capacity: int,
+                 observation_shape: tuple,
+                 action_space_size: int,
+                 observation_dtype=np.float32,
+                 resume: bool = False):
+        """
+        Initialize a recorder that appends per-player transitions to preallocated memory-mapped
+        ring buffers, one .npy file per field. Once capacity transitions were recorded,
+        the oldest transitions are overwritten.
+
+        :param directory: Directory holding the buffers. It is created if needed.
+        :param capacity: Maximum number of transitions kept.
+        :param observation_shape: Shape of a single player's observation (env.observation_shape).
+        :param action_space_size: Size of the action space (env.action_space_size()).
+        :param observation_dtype: Type observations are stored as.
+        :param resume: Continue recording into existing buffers instead of creating new ones.
+        :raises ValueError: If capacity is not a positive integer, or existing buffers do not match.
+        """
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+
+        self.__directory = directory
+        self.__capacity = capacity
+        self.__schema = trajectory_schema(observation_shape, action_space_size, observation_dtype)
+        self.__meta = {'capacity': capacity,
+                       'observation_shape': list(observation_shape),
+                       'action_space_size': action_space_size,
+                       'observation_dtype': np.dtype(observation_dtype).str,
+                       'cursor': 0,
+                       'size': 0}
+        os.makedirs(directory, exist_ok=True)
+
+        if resume:
+            with open(os.path.join(directory, META_FILE)) as file:
+                meta = json.load(file)
+            if {k: v for k, v in meta.items() if k not in ('cursor', 'size')} != \
+               {k: v for k, v in self.__meta.items() if k not in ('cursor', 'size')}:
+                raise ValueError(f"Existing buffers in {directory} have a different schema")
+            self.__meta = meta
+            self.__buffers = {name: np.load(self._path(name), mmap_mode='r+') for name in FIELDS}
+        else:
+            self.__buffers = {name: np.lib.format.open_memmap(self._path(name), mode='w+', dtype=dtype,
+                                                              shape=(capacity,) + shape)
+                              for name, (shape, dtype) in self.__schema.items()}
+            self._write_meta()
+
+    @classmethod
+    def for_env(cls, env, directory: str, capacity: int, **kwargs) -> 'SimpleTFTTrajectoryRecorder':
+        """
+        Create a recorder with the schema of an environment.
+
+        :param env: A SimpleTFT or SimpleTFTVectorEnv instance.
+        :param directory: Directory holding the buffers.
+        :param capacity: Maximum number of transitions kept.
+        :return: A SimpleTFTTrajectoryRecorder instance.
+        """
+        return cls(directory, capacity, env.observation_shape, env.action_space_size(), **kwargs)
+
+    def __len__(self):
+        return self.__meta['size']
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.__directory, name + '.npy')
+
+    def _write_meta(self):
+        with open(os.path.join(self.__directory, META_FILE), 'w') as file:
+            json.dump(self.__meta, file)
+
+    def record(self, observations, actions, rewards, masks, dones, players: list = None):
+        """
+        Append one transition per player: the observation and action mask an action was chosen from,
+        the action, and the reward and done flag step returned for it. Values are dictionaries keyed by
+        player, as used by SimpleTFT, or arrays with a leading player (or game and player) axis.
+
+        :param observations: Observations the actions were chosen from.
+        :param actions: The actions taken.
+        :param rewards: The rewards returned by step.
+        :param masks: Action masks the actions were chosen from.
+        :param dones: The dones returned by step.
+        :param players: Optional list of the players to record, when values are dictionaries.
+                        Defaults to every player of the observations.
+        """
+        if players is None and isinstance(observations, dict):
+            players = list(observations)
+        values = {'observations': observations, 'actions': actions, 'rewards': rewards, 'masks': masks, 'dones': dones}
+        values = {name: _stack(value, players) for name, value in values.items()}
+        num = values['actions'].size
+        if num > self.__capacity:
+            values = {name: value.reshape((num,) + self.__schema[name][0])[-self.__capacity:]
+                      for name, value in values.items()}
+            num = self.__capacity
+
+        rows = (self.__meta['cursor'] + np.arange(num)) % self.__capacity
+        for name, value in values.items():
+            self.__buffers[name][rows] = value.reshape((num,) + self.__schema[name][0])
+        self.__meta['cursor'] = int((self.__meta['cursor'] + num) % self.__capacity)
+        self.__meta['size'] = min(self.__meta['size'] + num, self.__capacity)
+
+    def flush(self):
+        """
+        Write the buffers and the recorded size to disk, making the transitions visible to loaders.
+        """
+        for buffer in self.__buffers.values():
+            buffer.flush()
+        self._write_meta()
+
+    def close(self):
+        """
+        Flush and release the buffers.
+        """
+        if self.__buffers:
+            self.flush()
+            self.__buffers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class SimpleTFTTrajectoryLoader(object):
+    def __init__(self, directory: str):
+        """
+        Open transitions written by SimpleTFTTrajectoryRecorder. The buffers are memory mapped
+        read-only, so only the sampled transitions are read from disk.
+
+        :param directory: Directory holding the buffers.
+        """
+        with open(os.path.join(directory, META_FILE)) as file:
+            self.__meta = json.load(file)
+        self.__buffers = {name: np.load(os.path.join(directory, name + '.npy'), mmap_mode='r') for name in FIELDS}
+
+    def __len__(self):
+        return self.__meta['size']
+
+    @property
+    def observation_shape(self):
+        return tuple(self.__meta['observation_shape'])
+
+    def action_space_size(self):
+        return self.__meta['action_space_size']
+
+    def get(self, indices: np.ndarray) -> dict:
+        """
+        Gather transitions.
+
+        :param indices: Indices of the transitions, below len(self).
+        :return: A dictionary mapping field name to an array with a leading len(indices) axis.
+        """
+        return {name: buffer[indices] for name, buffer in self.__buffers.items()}
+
+    def sample(self, batch_size: int, rng: np.random.Generator = None) -> dict:
+        """
+        Sample a random minibatch of transitions, uniformly with replacement.
+
+        :param batch_size: Number of transitions.
+        :param rng: Optional numpy Generator.
+        :return: A dictionary mapping field name to an array with a leading batch_size axis.
+        :raises ValueError: If no transitions were recorded.
+        """
+        if not len(self):
+            raise ValueError("Cannot sample from an empty trajectory buffer")
+        rng = np.random.default_rng() if rng is None else rng
+        # Sorted indices read the memory map front to back
+        return self.get(np.sort(rng.integers(len(self), size=batch_size)))
+
+    def batches(self, batch_size: int, num_batches: int, rng: np.random.Generator = None):
+        """
+        Generate random minibatches.
+
+        :param batch_size: Number of transitions per batch.
+        :param num_batches: Number of batches.
+        :param rng: Optional numpy Generator.
+        :return: A generator of minibatch dictionaries.
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        for _ in range(num_batches):
+            yield self.sample(batch_size, rng)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import queue
+import threading
+
+class SimpleTFTResetPregenerator(object):
+    def __init__(self, config: dict, seed=None, capacity: int = 8):
+        """
+        Initialize a generator of initial game states that runs ahead in a background thread,
+        so that a reset only has to restore a ready state.
+
+        States are generated by a scratch game with its own random stream, so the sequence of
+        states only depends on the seed, not on when they are requested.
+
+        :param config: The SimpleTFT configuration of the game being reset.
+        :param seed: None, an integer, a SeedSequence, or a numpy Generator seeding the scratch game.
+        :param capacity: Number of states generated ahead.
+        """
+        from .tft import SimpleTFT
+
+        self.__game = SimpleTFT(dict(config, seed=seed, debug=False, profile=False,
+                                     observation_mode='dict', reset_pregeneration=0))
+        self.__capacity = capacity
+        self.__thread = None
+        self.__stopped = threading.Event()
+        self.__states = queue.Queue(maxsize=capacity)
+        # States generated before the thread was stopped, served first to keep the sequence intact
+        self.__backlog = []
+        self.__unsent = None
+
+    def get(self):
+        """
+        Get the next initial game state, waiting for it if it is not generated yet.
+        The background thread is started on the first call.
+
+        :return: A SimpleTFTState.
+        """
+        if self.__thread is None:
+            self.__stopped.clear()
+            self.__thread = threading.Thread(target=self._run, name="SimpleTFTResetPregenerator", daemon=True)
+            self.__thread.start()
+        if self.__backlog:
+            return self.__backlog.pop(0)
+        return self.__states.get()
+
+    def seed(self, seed):
+        """
+        Discard the states generated so far and restart from a new seed.
+
+        :param seed: None, an integer, a SeedSequence, or a numpy Generator.
+        """
+        self.close()
+        self.__backlog = []
+        self.__game.seed(seed)
+
+    def close(self):
+        """
+        Stop the background thread. It is started again by the next get, which first serves
+        the states already generated.
+        """
+        if self.__thread is None:
+            return
+        self.__stopped.set()
+        self.__thread.join()
+        self.__thread = None
+        try:
+            while True:
+                self.__backlog.append(self.__states.get_nowait())
+        except queue.Empty:
+            pass
+        if self.__unsent is not None:
+            self.__backlog.append(self.__unsent)
+            self.__unsent = None
+
+    def _run(self):
+        """
+        Background thread loop, generating states until the queue is full and waiting for room.
+        """
+        while not self.__stopped.is_set():
+            self.__game._initialize_game()
+            state = self.__game.get_state()
+            while True:
+                if self.__stopped.is_set():
+                    self.__unsent = state
+                    return
+                try:
+                    self.__states.put(state, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
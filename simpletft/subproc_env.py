@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+from .random_stream import spawn_seeds
+from .tft import SimpleTFT
+from multiprocessing import shared_memory
+import multiprocessing as mp
+import numpy as np
+import time
+import traceback
+
+def _attach(shm_name: str, shape: tuple, dtype) -> (shared_memory.SharedMemory, np.ndarray):
+    """
+    Attach to a shared memory block and view it as an array.
+
+    :param shm_name: Name of the shared memory block.
+    :param shape: Shape of the array.
+    :param dtype: Data type of the array.
+    :return: Tuple of the SharedMemory handle and the array view.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+def _worker(remote, parent_remote, config: dict, layout: dict, games: range, seeds: list):
+    """
+    Worker process loop. Steps its games on command, writing observations, rewards, acting players,
+    dones and action masks straight into the shared arrays.
+
+    :param remote: The worker end of the command pipe.
+    :param parent_remote: The parent end of the command pipe, closed in the worker.
+    :param config: The SimpleTFT configuration.
+    :param layout: Mapping of array name to (shared memory name, shape, dtype).
+    :param games: The game indices handled by this worker.
+    :param seeds: The seed of each game.
+    """
+    parent_remote.close()
+    handles, arrays = [], {}
+    for name, (shm_name, shape, dtype) in layout.items():
+        shm, arrays[name] = _attach(shm_name, shape, dtype)
+        handles.append(shm)
+
+    envs = {}
+    for g, seed in zip(games, seeds):
+        envs[g] = SimpleTFT(dict(config, observation_mode='buffer', seed=seed))
+        envs[g].set_observation_buffer(arrays['observations'][g])
+    player_ids = ['player_{}'.format(i) for i in range(arrays['actions'].shape[1])]
+
+    def write(g, acting, masks):
+        for i, p in enumerate(player_ids):
+            arrays['acting'][g, i] = acting[p]
+            arrays['masks'][g, i] = masks[p]
+
+    def reset(g, seed=None):
+        _, acting, masks = envs[g].reset(seed=seed)
+        write(g, acting, masks)
+
+    try:
+        while True:
+            cmd, data = remote.recv()
+            try:
+                if cmd == 'step':
+                    for g, env in envs.items():
+                        actions = {p: int(a) for p, a in zip(player_ids, arrays['actions'][g])}
+                        _, rewards, acting, dones, masks = env.step(actions)
+                        for i, p in enumerate(player_ids):
+                            arrays['rewards'][g, i] = rewards[p]
+                            arrays['dones'][g, i] = dones[p]
+                        write(g, acting, masks)
+                        if all(dones.values()):
+                            reset(g)
+                elif cmd == 'reset':
+                    for g, seed in zip(envs, data):
+                        reset(g, seed)
+                        arrays['rewards'][g] = 0
+                        arrays['dones'][g] = False
+                elif cmd == 'close':
+                    remote.send(('ok', None))
+                    break
+                remote.send(('ok', None))
+            except Exception:
+                remote.send(('error', traceback.format_exc()))
+    finally:
+        for shm in handles:
+            shm.close()
+
+class SubprocVectorEnv(object):
+    def __init__(self,
+                 config: dict = {},
+                 num_workers: int = 1,
+                 games_per_worker: int = 1,
+                 observation_dtype=np.float64,
+                 start_method: str = None):
+        """
+        Initialize SimpleTFT games spread across worker processes. Observations, action masks,
+        rewards, acting players and dones live in shared memory arrays written by the workers,
+        so stepping only sends a command to each worker. Finished games are reset automatically.
+
+        :param config: A dictionary containing game configuration settings (see SimpleTFT).
+                       Each game gets an independent stream spawned from the optional 'seed'.
+        :param num_workers: Number of worker processes.
+        :param games_per_worker: Number of games run sequentially by each worker.
+        :param observation_dtype: Floating point type of the shared observation array.
+        :param start_method: Optional multiprocessing start method (e.g. 'fork', 'spawn').
+        :raises ValueError: If any configuration values are invalid.
+        """
+        if not all(isinstance(x, int) and x > 0 for x in [num_workers, games_per_worker]):
+            raise ValueError("num_workers and games_per_worker must be positive integers")
+
+        template = SimpleTFT(config)
+        self.__config = template.config
+        self.__num_games = num_workers * games_per_worker
+        self.__num_players = template.num_players
+        self.__observation_shape = template.observation_shape
+        self.__action_space_size = template.action_space_size()
+        self.__games_per_worker = games_per_worker
+        seeds = spawn_seeds(config.get('seed'), self.__num_games)
+
+        G, P = self.__num_games, self.__num_players
+        specs = {'observations': ((G, P) + self.__observation_shape, observation_dtype),
+                 'masks': ((G, P, self.__action_space_size), np.float64),
+                 'rewards': ((G, P), np.float64),
+                 'acting': ((G, P), bool),
+                 'dones': ((G, P), bool),
+                 'actions': ((G, P), np.int64)}
+        self.__handles = []
+        self.__arrays = {}
+        layout = {}
+        for name, (shape, dtype) in specs.items():
+            nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+            shm = shared_memory.SharedMemory(create=True, size=nbytes)
+            self.__handles.append(shm)
+            self.__arrays[name] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            self.__arrays[name].fill(0)
+            layout[name] = (shm.name, shape, dtype)
+
+        ctx = mp.get_context(start_method)
+        self.__remotes = []
+        self.__processes = []
+        for w in range(num_workers):
+            remote, worker_remote = ctx.Pipe()
+            games = range(w * games_per_worker, (w + 1) * games_per_worker)
+            process = ctx.Process(target=_worker,
+                                  args=(worker_remote, remote, self.__config, layout, games,
+                                        seeds[games.start:games.stop]),
+                                  daemon=True)
+            process.start()
+            worker_remote.close()
+            self.__remotes.append(remote)
+            self.__processes.append(process)
+        self.__closed = False
+
+    @property
+    def num_games(self):
+        """
+        Get the total number of games across workers.
+
+        :return: int
+        """
+        return self.__num_games
+
+    @property
+    def num_players(self):
+        """
+        Get the number of players in each game.
+
+        :return: int
+        """
+        return self.__num_players
+
+    @property
+    def observation_shape(self):
+        """
+        Get the shape of a single player's observation in a single game.
+
+        :return: A tuple representing the shape of the observation space.
+        """
+        return self.__observation_shape
+
+    def action_space_size(self):
+        return self.__action_space_size
+
+    def _command(self, cmd: str, data: list = None):
+        """
+        Send a command to every worker and wait until all of them finished it.
+
+        :param cmd: The command name.
+        :param data: Optional per-worker command arguments.
+        :raises RuntimeError: If a worker failed to execute the command.
+        """
+        if self.__closed:
+            raise RuntimeError("SubprocVectorEnv is closed")
+        for w, remote in enumerate(self.__remotes):
+            remote.send((cmd, None if data is None else data[w]))
+        errors = [message for status, message in (remote.recv() for remote in self.__remotes) if status == 'error']
+        if errors:
+            raise RuntimeError(f"Worker failed to {cmd}:\n{errors[0]}")
+
+    def _results(self, with_rewards: bool) -> tuple:
+        """
+        Collect the shared arrays returned by step and reset. They are views that the next call overwrites.
+        """
+        arrays = self.__arrays
+        if with_rewards:
+            return arrays['observations'], arrays['rewards'], arrays['acting'], arrays['dones'], arrays['masks']
+        return arrays['observations'], arrays['acting'], arrays['masks']
+
+    def reset(self, seed=None) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Reset every game to its initial state.
+
+        :param seed: Optional integer, SeedSequence, or numpy Generator from which independent
+                     per-game seeds are spawned. Otherwise every game's stream continues.
+        :return: Tuple containing stacked player observations, acting players, and action masks.
+        """
+        seeds = [None] * self.__num_games if seed is None else spawn_seeds(seed, self.__num_games)
+        n = self.__games_per_worker
+        self._command('reset', [seeds[w * n:(w + 1) * n] for w in range(len(self.__remotes))])
+        return self._results(False)
+
+    def step(self, actions: np.ndarray) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+        """
+        Process a game step in every game given the actions of each player. Games that finished
+        during the step are reset; their rewards and dones describe the final step and their
+        observations, acting players and action masks describe the new game.
+
+        :param actions: An integer array of shape (num_games, num_players).
+        :return: Tuple containing stacked player observations, rewards, acting players, dones, and action masks.
+        :raises ValueError: If the actions have the wrong shape.
+        """
+        actions = np.asarray(actions)
+        if actions.shape != self.__arrays['actions'].shape:
+            raise ValueError(f"Actions must have shape {self.__arrays['actions'].shape}")
+        self.__arrays['actions'][:] = actions
+        self._command('step')
+        return self._results(True)
+
+    def close(self):
+        """
+        Stop the workers and release the shared memory.
+        """
+        if self.__closed:
+            return
+        self.__closed = True
+        for remote in self.__remotes:
+            try:
+                remote.send(('close', None))
+                remote.recv()
+            except (BrokenPipeError, EOFError):
+                pass
+            remote.close()
+        for process in self.__processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.__arrays = {}
+        for shm in self.__handles:
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def benchmark_scaling(config: dict = {},
+                      worker_counts: list = (1, 2, 4, 8),
+                      games_per_worker: int = 16,
+                      num_steps: int = 200,
+                      seed: int = 0) -> dict:
+    """
+    Measure SubprocVectorEnv throughput with random valid actions for several worker counts.
+
+    :param config: A dictionary containing game configuration settings.
+    :param worker_counts: The numbers of workers to measure.
+    :param games_per_worker: Number of games run by each worker.
+    :param num_steps: Number of steps to time for each worker count.
+    :param seed: Seed of the games and of the random actions, reused for every worker count.
+    :return: A dictionary mapping worker count to game steps per second.
+    """
+    config = dict(config, seed=seed)
+    results = {}
+    for num_workers in worker_counts:
+        rng = np.random.default_rng(seed)
+        with SubprocVectorEnv(config, num_workers, games_per_worker) as env:
+            _, _, masks = env.reset()
+            start = time.perf_counter()
+            for _ in range(num_steps):
+                actions = (rng.random(masks.shape) * masks).argmax(-1)
+                _, _, _, _, masks = env.step(actions)
+            results[num_workers] = num_steps * env.num_games / (time.perf_counter() - start)
+    return results
+
+if __name__ == "__main__":
+    scaling = benchmark_scaling()
+    baseline = scaling[min(scaling)]
+    for num_workers, steps_per_second in scaling.items():
+        print(f"{num_workers} workers: {steps_per_second:,.0f} steps/sec ({steps_per_second / baseline:.2f}x)")
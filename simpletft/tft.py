@@ -1,16 +1,67 @@
 # -*- coding: utf-8 -*-
-from .champion import SimpleTFTChampion
+from .action_spec import SimpleTFTActionSpec, IDLE
+from .battle_log import encode_matchup, make_header, read_header, render_matchup
+from .board_power import SimpleTFTBoardPowerCache
 from .champion_pool import SimpleTFTChampionPool
+from .log_writer import SimpleTFTLogWriter
 from .player import SimpleTFTPlayer
+from .profiler import SimpleTFTProfiler
+from .random_stream import SimpleTFTRandomStream, spawn_seeds
+from .reset_pregenerator import SimpleTFTResetPregenerator
+from collections import namedtuple
+import copy
 import numpy as np
 import os
 
+# Snapshot of a game returned by SimpleTFT.get_state. Arrays are read-only.
+SimpleTFTState = namedtuple('SimpleTFTState', ['pool', 'slots', 'gold', 'hp', 'killed', 'live_agents',
+                                               'actions_until_combat', 'random_state'])
+
+# Observations returned in 'shared' observation mode. public and private hold each player's public and
+# private view once, and row (observer, k) of index is the player whose view fills block k of the observer's
+# observation: the private view for k = 0, public views otherwise.
+SimpleTFTSharedObservation = namedtuple('SimpleTFTSharedObservation', ['public', 'private', 'index'])
+
+def gather_observations(shared: SimpleTFTSharedObservation) -> np.ndarray:
+    """
+    Expand shared observations into the per-player observation tensor of 'buffer' observation mode.
+
+    :param shared: A SimpleTFTSharedObservation.
+    :return: A numpy array of shape (num_players,) + observation_shape.
+    """
+    return np.concatenate((shared.private[:, None], shared.public[shared.index[:, 1:]]), axis=1)
+
+def win_matrix(powers: np.ndarray) -> np.ndarray:
+    """
+    Compute the outcome of every board against every other board from board powers.
+
+    :param powers: An array of board powers with shape (..., num_boards).
+    :return: An int8 array of shape (..., num_boards, num_boards) where entry (i, j) is +1 if board i beats
+             board j, -1 if it loses, and 0 for a draw. In combat, draws damage both players like losses.
+    """
+    powers = np.asarray(powers)
+    return np.sign(powers[..., :, None] - powers[..., None, :]).astype(np.int8)
+
 class SimpleTFT(object):
+    # Methods timed when profiling, and the phase each one is recorded as
+    PROFILED_METHODS = {'_apply_actions': 'take_action',
+                        'combat': 'combat',
+                        'post_combat': 'post_combat',
+                        'make_player_observations': 'observations',
+                        'write_observation_buffer': 'observations',
+                        'write_shared_observation': 'observations',
+                        'make_action_masks': 'masks',
+                        'log_matchup': 'logging',
+                        '_dump_logs': 'logging'}
+    # Player methods whose calls are counted when profiling
+    PROFILED_PLAYER_METHODS = ['calculate_board_power', 'find_matches']
+
     def __init__(self, config: dict = {}):
         """
         Initialize the SimpleTFT game with configurable settings.
 
-        :param config: A dictionary containing game configuration settings.
+        :param config: A dictionary containing game configuration settings. The optional 'seed'
+                       (an integer, SeedSequence, or numpy Generator) seeds the game's random stream.
         :raises ValueError: If any configuration values are invalid.
         """
         # Default values can be set here or obtained from the config
@@ -25,12 +76,30 @@ class SimpleTFT(object):
         self.__gold_per_round = config.get('gold_per_round', 3)
         self.__interest_increment = config.get('interest_increment', 5)
         self.__debug = config.get('debug', False)
+        self.__board_power_cache_size = config.get('board_power_cache_size', 4096)
+        self.__board_power_table = config.get('board_power_table', False)
+        self.__log_flush_size = config.get('log_flush_size', 1000)
+        self.__log_flush_interval = config.get('log_flush_interval', 1.0)
+        self.__profile = config.get('profile', False)
+        self.__reset_pregeneration = config.get('reset_pregeneration', 0)
         
         valid_reward_structures = ['game_placement', 'damage', 'mixed', 'power']
         self.__reward_structure = config.get('reward_structure', 'game_placement')  # Default to 'game_placement'
         if self.__reward_structure not in valid_reward_structures:
             raise ValueError(f"Invalid reward structure. Must be one of {valid_reward_structures}")
             
+        valid_log_formats = ['text', 'binary']
+        self.__log_format = config.get('log_format', 'text')  # Default to 'text'
+        if self.__log_format not in valid_log_formats:
+            raise ValueError(f"Invalid log format. Must be one of {valid_log_formats}")
+        if self.__log_format == 'binary' and self.__debug:
+            raise ValueError("Debug logs cannot be written in the binary log format")
+            
+        valid_observation_modes = ['dict', 'buffer', 'shared']
+        self.__observation_mode = config.get('observation_mode', 'dict')  # Default to 'dict'
+        if self.__observation_mode not in valid_observation_modes:
+            raise ValueError(f"Invalid observation mode. Must be one of {valid_observation_modes}")
+            
         # Validate configuration
         if not all(isinstance(value, int) and value > 0 for value in [
             self.__num_players, self.__board_size, self.__bench_size, 
@@ -38,6 +107,14 @@ class SimpleTFT(object):
             self.__champ_copies, self.__actions_per_round, 
             self.__gold_per_round, self.__interest_increment]):
             raise ValueError("All configuration values must be positive integers")
+        if not isinstance(self.__reset_pregeneration, int) or self.__reset_pregeneration < 0:
+            raise ValueError("reset_pregeneration must be a non-negative integer")
+        if self.__reset_pregeneration and self.__debug:
+            raise ValueError("Reset states cannot be pre-generated in debug mode")
+        if not isinstance(self.__log_flush_size, int) or self.__log_flush_size <= 0:
+            raise ValueError("log_flush_size must be a positive integer")
+        if not isinstance(self.__log_flush_interval, (int, float)) or self.__log_flush_interval <= 0:
+            raise ValueError("log_flush_interval must be a positive number")
 
         # Calculate the maximum attainable champion level
         self.__max_champ_level = int(np.log2(self.__champ_copies))
@@ -61,6 +138,7 @@ class SimpleTFT(object):
         self.__max_board_power = self.__board_size * self.__max_champ_power 
                
         self.__action_space_size = SimpleTFTPlayer.calculate_action_space_size(self.__board_size, self.__bench_size, self.__shop_size)
+        self.__idle_actions = SimpleTFTActionSpec.get(self.__board_size, self.__bench_size, self.__shop_size).kind == IDLE
         
         self.__observation_shape = (self.__num_players, 
                                     self.__board_size 
@@ -70,12 +148,76 @@ class SimpleTFT(object):
                                     self.__num_teams + self.__board_size + int(np.log2(self.__champ_copies)) + 2
                                     )
         
+        self.__config = {'num_players': self.__num_players,
+                         'board_size': self.__board_size,
+                         'bench_size': self.__bench_size,
+                         'shop_size': self.__shop_size,
+                         'num_teams': self.__num_teams,
+                         'team_size': self.__team_size,
+                         'champ_copies': self.__champ_copies,
+                         'actions_per_round': self.__actions_per_round,
+                         'gold_per_round': self.__gold_per_round,
+                         'interest_increment': self.__interest_increment,
+                         'reward_structure': self.__reward_structure,
+                         'observation_mode': self.__observation_mode,
+                         'board_power_cache_size': self.__board_power_cache_size,
+                         'board_power_table': self.__board_power_table,
+                         'log_format': self.__log_format,
+                         'log_flush_size': self.__log_flush_size,
+                         'log_flush_interval': self.__log_flush_interval,
+                         'profile': self.__profile,
+                         'reset_pregeneration': self.__reset_pregeneration,
+                         'debug': self.__debug}
+        
+        self.__board_power_cache = SimpleTFTBoardPowerCache(self.__board_size,
+                                                            self.__num_teams,
+                                                            self.__max_champ_level,
+                                                            maxsize=self.__board_power_cache_size,
+                                                            precompute=self.__board_power_table)
+        self.__random_stream = SimpleTFTRandomStream(config.get('seed'))
+        self.__reset_pregenerator = None
+        if self.__reset_pregeneration:
+            # Initial states come from their own stream, so they can be generated ahead of time
+            self.__reset_pregenerator = SimpleTFTResetPregenerator(self.__config,
+                                                                   spawn_seeds(config.get('seed'), 1)[0],
+                                                                   capacity=self.__reset_pregeneration)
         self.__champion_pool = None
         self.__live_agents = ['player_{}'.format(i) for i in range(self.__num_players)]
         self.__players = {}
         self.__actions_until_combat = 0
+        self.__observation_cache = {}
+        self.__observation_rebuilds = 0
+        self.__rebuilt_players = []
+        
+        # Which player's observation fills each (observer, row) block of the observation tensor
+        self.__observation_index = np.array([[p] + [q for q in range(self.__num_players) if q != p]
+                                             for p in range(self.__num_players)])
+        self.__observation_index.flags.writeable = False
+
+        # Opponent of each position in a shuffle of n live players: consecutive players are paired,
+        # and an unpaired last player faces the first player
+        self.__opponents = []
+        for n in range(self.__num_players + 1):
+            opponents = np.arange(n) ^ 1
+            opponents[opponents >= n] = 0
+            self.__opponents.append(opponents)
+        self.__observation_buffer = None
+        self.__observation_buffer_stale = True
+        if self.__observation_mode == 'buffer':
+            self.set_observation_buffer(np.zeros((self.__num_players,) + self.__observation_shape))
+        self.__shared_observation = None
+        if self.__observation_mode == 'shared':
+            self.__shared_observation = self._make_shared_observation()
         self.__log = []
         self.__log_file_path = ""
+        self.__log_writer = None
+        self.__player_ids = ['player_{}'.format(i) for i in range(self.__num_players)]
+        self.__player_indices = {p: i for i, p in enumerate(self.__player_ids)}
+        self.__game_index = -1
+        self.__combat_round = 0
+        self.__profiler = None
+        if self.__profile:
+            self._instrument()
         
     @property
     def live_agents(self):
@@ -86,6 +228,15 @@ class SimpleTFT(object):
         """
         return self.__live_agents.copy()
     
+    @property
+    def config(self):
+        """
+        Get the validated game configuration, with defaults filled in.
+
+        :return: A copy of the configuration dictionary.
+        """
+        return self.__config.copy()
+    
     @property
     def observation_shape(self):
         """
@@ -104,6 +255,61 @@ class SimpleTFT(object):
         """
         return self.__num_players
     
+    @property
+    def board_power_cache(self):
+        """
+        Get the board power cache shared by the players, which exposes hit and miss statistics.
+    
+        :return: A SimpleTFTBoardPowerCache instance.
+        """
+        return self.__board_power_cache
+    
+    @property
+    def observation_rebuilds(self):
+        """
+        Get the number of player observations (public or private) rebuilt by the last observation update.
+        Observations of players whose state did not change are reused.
+    
+        :return: int 
+        """
+        return self.__observation_rebuilds
+    
+    @property
+    def observation_buffer(self):
+        """
+        Get the preallocated observation tensor written in place by step and reset in 'buffer' observation mode.
+        Row i holds the observation of player_i. The tensor supports the buffer protocol.
+    
+        :return: A numpy array of shape (num_players,) + observation_shape, or None in 'dict' observation mode.
+        """
+        return self.__observation_buffer
+    
+    def _make_shared_observation(self) -> SimpleTFTSharedObservation:
+        """
+        Allocate the public and private views written in place in 'shared' observation mode.
+
+        :return: A SimpleTFTSharedObservation.
+        """
+        views_shape = (self.__num_players,) + self.__observation_shape[1:]
+        return SimpleTFTSharedObservation(np.zeros(views_shape), np.zeros(views_shape), self.__observation_index)
+
+    def set_observation_buffer(self, buffer: np.ndarray):
+        """
+        Supply the tensor that step and reset write observations into in 'buffer' observation mode.
+
+        :param buffer: A writeable floating point numpy array of shape (num_players,) + observation_shape.
+        :raises ValueError: If the environment is not in 'buffer' observation mode, or the buffer is unsuitable.
+        """
+        if self.__observation_mode != 'buffer':
+            raise ValueError("Observation buffers are only used in 'buffer' observation mode")
+        expected_shape = (self.__num_players,) + self.__observation_shape
+        if not isinstance(buffer, np.ndarray) or buffer.shape != expected_shape:
+            raise ValueError(f"Observation buffer must be a numpy array of shape {expected_shape}")
+        if not np.issubdtype(buffer.dtype, np.floating) or not buffer.flags.writeable:
+            raise ValueError("Observation buffer must be a writeable floating point array")
+        self.__observation_buffer = buffer
+        self.__observation_buffer_stale = True
+    
     def step(self, action: dict) -> (dict, dict, dict, dict, dict):
         """
         Process a game step given the actions of each player.
@@ -111,10 +317,103 @@ class SimpleTFT(object):
         :param action: A dictionary mapping player identifiers to their actions.
         :return: Tuple containing player observations, rewards, acting players, game state, and action masks.
         """
-        for p, a in action.items():
+        rewards = self.advance(action)
+        return (self._make_observations(), rewards, self.make_acting_player_dict(), 
+                self.make_dones(), self.make_action_masks())
+
+    def step_round(self, action_sequences: dict, fast_forward: bool = False) -> (dict, dict, dict, dict, dict):
+        """
+        Play the rest of the current preparation round, up to and including combat, in one call.
+        The k-th step applies the k-th action of each player's sequence. Players whose sequence is shorter,
+        or who are missing, stay idle. Observations and action masks are only built after combat.
+        Every action is validated before the first step, and if a step still fails, for example when
+        refreshing a shop without gold, the game is restored to its state before the round, logs aside.
+
+        :param action_sequences: A dictionary mapping player identifiers to sequences of actions,
+                                 at most as many as the steps left in the round.
+        :param fast_forward: Skip steps before combat in which every live player stays idle. Such steps
+                             change nothing, so only debug logs differ from playing them.
+        :return: Tuple containing player observations after combat, rewards accumulated over the round,
+                 acting players, game state, and action masks.
+        :raises ValueError: If a player is not part of the game, a sequence is longer than the round,
+                            or an action is invalid.
+        """
+        num_steps = self.__actions_until_combat + 1
+        for p, sequence in action_sequences.items():
             if p not in self.__players:
                 raise ValueError(f"Player {p} is not part of the game.")
-            self.__players[p].take_action(a)
+            if len(sequence) > num_steps:
+                raise ValueError(f"{p} has {len(sequence)} actions but only {num_steps} steps are left in the round")
+
+        # Validate every action before the first step, and find the steps in which every live player stays idle
+        idle_steps = [True] * num_steps
+        refresh = self.__action_space_size - 2
+        refreshes = False
+        for p, sequence in action_sequences.items():
+            alive = self.__players[p].is_alive()
+            for k, a in enumerate(sequence):
+                if not self._is_idle(a) and alive:
+                    idle_steps[k] = False
+                    refreshes = refreshes or a == refresh
+
+        # Valid actions only fail when refreshing a shop without gold, so other rounds are not snapshotted
+        idle = self.__action_space_size - 1
+        rewards = dict.fromkeys(self.__players, 0)
+        state = self.get_state() if refreshes else None
+        try:
+            for k in range(num_steps):
+                if fast_forward and k < num_steps - 1 and idle_steps[k]:
+                    self.__actions_until_combat -= 1
+                    continue
+
+                action = {}
+                for p in self.__players:
+                    sequence = action_sequences.get(p, ())
+                    action[p] = sequence[k] if k < len(sequence) else idle
+                for p, reward in self.advance(action).items():
+                    rewards[p] += reward
+        except Exception:
+            if state is not None:
+                self.set_state(state)
+            raise
+
+        return (self._make_observations(), rewards, self.make_acting_player_dict(),
+                self.make_dones(), self.make_action_masks())
+
+    def _is_idle(self, action: int) -> bool:
+        """
+        Check whether an action leaves a player unchanged. Indices beyond the action space decode as idle.
+
+        :param action: The action index.
+        :return: bool
+        :raises ValueError: If the action is not an integer or is out of the range SimpleTFTPlayer.take_action accepts.
+        """
+        if not isinstance(action, (int, np.integer)):
+            raise ValueError("Action must be an integer")
+        if not 0 <= action < self.__action_space_size * self.__action_space_size:
+            raise ValueError(f"Action must be within the range 0 to {self.__action_space_size * self.__action_space_size - 1}")
+        return action >= self.__action_space_size or bool(self.__idle_actions[action])
+
+    def simulate(self, action: dict) -> (dict, dict):
+        """
+        Process a game step like step, without building observations, action masks, or acting players.
+        They are computed on demand by make_player_observations (or write_observation_buffer),
+        make_action_masks, and make_acting_player_dict, reusing whatever did not change.
+
+        :param action: A dictionary mapping player identifiers to their actions.
+        :return: Tuple containing rewards and game state.
+        """
+        rewards = self.advance(action)
+        return rewards, self.make_dones()
+
+    def advance(self, action: dict) -> dict:
+        """
+        Apply the actions of each player, then run combat and post-combat when the round ends.
+
+        :param action: A dictionary mapping player identifiers to their actions.
+        :return: A dictionary containing the rewards for each player.
+        """
+        self._apply_actions(action)
 
         if self.__debug:
             self._log_player_states()
@@ -138,38 +437,27 @@ class SimpleTFT(object):
             for p, reward in rewards.items():
                 self.log(f"{p}: received {reward} reward")
 
-        return (self.make_player_observations(), rewards, self.make_acting_player_dict(), 
-                self.make_dones(), self.make_action_masks())
+        return rewards
                 
-    def reset(self, log_file_path: str = "") -> (dict, dict, dict):
+    def reset(self, log_file_path: str = "", seed=None) -> (dict, dict, dict):
         """
         Reset the game to its initial state.
 
         :param log_file_path: Optional path for a log file.
+        :param seed: Optional integer, SeedSequence, or numpy Generator to reseed the game's random stream with.
+                     Otherwise the stream continues where the previous game left off.
         :return: Tuple containing initial player observations, acting players, and action masks.
         """
-        self.__champion_pool = SimpleTFTChampionPool(self.__champ_copies,
-                                                     self.__num_teams,
-                                                     self.__board_size,
-                                                     debug=self.__debug)
-        self.__live_agents = ['player_{}'.format(i) for i in range(self.__num_players)]
-        self.__players = {p: SimpleTFTPlayer(self.__champion_pool, 
-                                             self.__board_size,
-                                             self.__bench_size,
-                                             self.__shop_size,
-                                             debug=self.__debug)
-                          for p in self.__live_agents}
-        self.__actions_until_combat = self.__actions_per_round - 1
+        if seed is not None:
+            self.seed(seed)
+        if self.__reset_pregenerator is not None:
+            self._set_game_state(self.__reset_pregenerator.get())
+        else:
+            self._initialize_game()
+        self.__observation_cache = {}
+        self.__game_index += 1
+        self.__combat_round = 0
 
-        for p, player in self.__players.items():
-            champ = self.__champion_pool.sample(1)[0]
-            if not player.add_champion(champ):
-                player.add_gold(1)
-                self.__champion_pool.add(champ)
-            player.add_gold(self.__gold_per_round + 1)
-            player.refresh_shop()
-            player.update_board_state()
-            
         if self.__reward_structure == "power":
             self.update_player_powers()
             
@@ -178,14 +466,223 @@ class SimpleTFT(object):
                 self._dump_logs()
             self._log_player_states()
 
+        if self.__log_writer is not None:
+            self.__log_writer.flush()
+
         if log_file_path:
             if os.path.exists(os.path.dirname(log_file_path)) or os.path.isdir(os.path.dirname(log_file_path)):
+                if log_file_path != self.__log_file_path:
+                    self._close_log()
+                    self.__log_writer = self._make_log_writer(log_file_path)
                 self.__log_file_path = log_file_path
             else:
                 raise ValueError(f"Provided log_file_path is not a valid directory: {log_file_path}")
 
-        return self.make_player_observations(), self.make_acting_player_dict(), self.make_action_masks()
+        return self._make_observations(), self.make_acting_player_dict(), self.make_action_masks()
         
+    def seed(self, seed):
+        """
+        Reseed the game's random stream, and the stream of pre-generated reset states if enabled.
+
+        :param seed: An integer, SeedSequence, or numpy Generator.
+        """
+        self.__random_stream.seed(seed)
+        if self.__reset_pregenerator is not None:
+            self.__reset_pregenerator.seed(spawn_seeds(seed, 1)[0])
+
+    def _initialize_game(self):
+        """
+        Set up the initial game state: a full pool, and players with one champion, starting gold, and a shop.
+        Existing pool and players are reinitialized in place.
+        """
+        if self.__champion_pool is None:
+            self._create_game()
+        else:
+            self.__champion_pool.refill()
+            for player in self.__players.values():
+                player.clear()
+            self.__live_agents = list(self.__players)
+        self.__actions_until_combat = self.__actions_per_round - 1
+
+        for p, player in self.__players.items():
+            champ = self.__champion_pool.sample_slots(1)[0]
+            if not player.add_slot(champ):
+                player.add_gold(1)
+                self.__champion_pool.add_slots(champ[None])
+            player.add_gold(self.__gold_per_round + 1)
+            player.refresh_shop()
+            player.update_board_state()
+
+    def _apply_actions(self, action: dict):
+        """
+        Apply the action of each player.
+
+        :param action: A dictionary mapping player identifiers to their actions.
+        """
+        for p, a in action.items():
+            if p not in self.__players:
+                raise ValueError(f"Player {p} is not part of the game.")
+            self.__players[p].take_action(a)
+
+    def _make_log_writer(self, log_file_path: str) -> SimpleTFTLogWriter:
+        """
+        Create the writer of a log file in the configured log format.
+
+        :param log_file_path: Path of the log file.
+        :return: A SimpleTFTLogWriter instance.
+        :raises ValueError: If a binary log is appended to a file that is not a binary log of the same sizes.
+        """
+        if self.__log_format == 'text':
+            return SimpleTFTLogWriter(log_file_path,
+                                      flush_size=self.__log_flush_size,
+                                      flush_interval=self.__log_flush_interval)
+
+        if os.path.exists(log_file_path) and os.path.getsize(log_file_path):
+            if read_header(log_file_path) != (self.__board_size, self.__bench_size):
+                raise ValueError(f"{log_file_path} is a binary battle log of a different board or bench size")
+        return SimpleTFTLogWriter(log_file_path,
+                                  flush_size=self.__log_flush_size,
+                                  flush_interval=self.__log_flush_interval,
+                                  binary=True,
+                                  header=make_header(self.__board_size, self.__bench_size))
+
+    def _create_game(self):
+        """
+        Create a full champion pool and players with empty boards, benches, and shops.
+        """
+        self.__champion_pool = SimpleTFTChampionPool(self.__champ_copies,
+                                                     self.__num_teams,
+                                                     self.__board_size,
+                                                     debug=self.__debug,
+                                                     random_stream=self.__random_stream)
+        self.__live_agents = ['player_{}'.format(i) for i in range(self.__num_players)]
+        self.__players = {p: SimpleTFTPlayer(self.__champion_pool, 
+                                             self.__board_size,
+                                             self.__bench_size,
+                                             self.__shop_size,
+                                             debug=self.__debug,
+                                             board_power_cache=self.__board_power_cache)
+                          for p in self.__live_agents}
+        if self.__profiler is not None:
+            for player in self.__players.values():
+                for name in self.PROFILED_PLAYER_METHODS:
+                    self.__profiler.count_method(player, name)
+
+    def _instrument(self):
+        """
+        Enable profiling by replacing the profiled methods of this game with timing wrappers.
+        Players created afterwards get call counting wrappers.
+        """
+        self.__profiler = SimpleTFTProfiler()
+        for name, phase in self.PROFILED_METHODS.items():
+            self.__profiler.time_method(self, name, phase)
+
+    @property
+    def profiler(self):
+        """
+        Get the profiler recording phase timings and call counts, enabled with 'profile' in the config.
+
+        :return: A SimpleTFTProfiler instance, or None when profiling is disabled.
+        """
+        return self.__profiler
+
+    def stats(self) -> dict:
+        """
+        Get performance statistics of the game. Phase timings and call counts are only
+        recorded with 'profile' enabled in the config.
+
+        :return: A dictionary with 'profiling', 'board_power_cache' statistics, the last number of 'observation_rebuilds',
+                 and when profiling, 'phases' timings and method 'calls' (see SimpleTFTProfiler.stats).
+        """
+        stats = {'profiling': self.__profiler is not None,
+                 'board_power_cache': self.__board_power_cache.stats(),
+                 'observation_rebuilds': self.__observation_rebuilds}
+        if self.__profiler is not None:
+            stats.update(self.__profiler.stats())
+        return stats
+
+    def get_state(self) -> SimpleTFTState:
+        """
+        Capture the full game state: pool counts, player slots, gold, hp, the round timer, and the random stream.
+        Logs are not part of the state.
+
+        :return: An immutable SimpleTFTState.
+        :raises ValueError: If the game has not been reset.
+        """
+        if self.__champion_pool is None:
+            raise ValueError("The game must be reset before its state can be captured")
+        players = self.__players.values()
+        slots = np.stack([player.slots for player in players])
+        slots.flags.writeable = False
+        return SimpleTFTState(self.__champion_pool.get_state(),
+                              slots,
+                              tuple(player.gold for player in players),
+                              tuple(player.hp for player in players),
+                              tuple(player.killed for player in players),
+                              tuple(self.__live_agents),
+                              self.__actions_until_combat,
+                              self.__random_stream.get_state())
+
+    def set_state(self, state: SimpleTFTState):
+        """
+        Restore a state captured with get_state, from this game or another game with the same configuration.
+        Observations and action masks can be rebuilt with make_player_observations and make_action_masks.
+
+        :param state: A SimpleTFTState.
+        """
+        self._set_game_state(state)
+        self.__random_stream.set_state(state.random_state)
+
+    def _set_game_state(self, state: SimpleTFTState):
+        """
+        Restore everything in a state captured with get_state except the random stream.
+
+        :param state: A SimpleTFTState.
+        """
+        if self.__champion_pool is None:
+            self._create_game()
+        self.__champion_pool.set_state(state.pool)
+        for i, player in enumerate(self.__players.values()):
+            player.set_state((state.slots[i], state.gold[i], state.hp[i], state.killed[i]))
+        self.__live_agents = list(state.live_agents)
+        self.__actions_until_combat = state.actions_until_combat
+
+        if self.__reward_structure == "power":
+            self.update_player_powers()
+
+    def clone(self) -> 'SimpleTFT':
+        """
+        Create an independent copy of the game in its current state. The copy shares the
+        configuration and board power cache but continues its own random stream.
+        Copies do not pre-generate resets: they reset from their own random stream like games
+        without pre-generation, rather than each starting a background thread.
+
+        :return: A SimpleTFT instance.
+        """
+        env = copy.copy(self)
+        env.__random_stream = SimpleTFTRandomStream()
+        env.__champion_pool = None
+        env.__observation_cache = {}
+        env.__rebuilt_players = []
+        env.__log = []
+        env.__log_file_path = ""
+        env.__log_writer = None
+        if self.__reset_pregenerator is not None:
+            env.__reset_pregenerator = None
+            env.__reset_pregeneration = 0
+            env.__config = dict(self.__config, reset_pregeneration=0)
+        if self.__profiler is not None:
+            for name in self.PROFILED_METHODS:
+                del env.__dict__[name]
+            env._instrument()
+        if self.__observation_buffer is not None:
+            env.set_observation_buffer(np.zeros_like(self.__observation_buffer))
+        if self.__shared_observation is not None:
+            env.__shared_observation = env._make_shared_observation()
+            env.__observation_buffer_stale = True
+        env.set_state(self.get_state())
+        return env
+
     def post_combat(self):
         """
         Perform post-combat actions for each player, including cleanup and adding gold.
@@ -201,116 +698,108 @@ class SimpleTFT(object):
     def combat(self) -> dict:
         """
         Conduct combat between players and assign rewards.
+        Live players are shuffled and paired consecutively; with an odd number of players,
+        the last player also faces the first player, who takes no damage from that matchup.
 
         :return: A dictionary containing the rewards for each player.
         """
-        self.__live_agents = [p for p, player in self.__players.items() if player.is_alive()]
-        rewards = {p: 0 for p in self.__players}
-        combat_results = {}
+        players = list(self.__players.values())
+        live = [i for i, player in enumerate(players) if player.is_alive()]
+        self.__live_agents = [self.__player_ids[i] for i in live]
+        num_live = len(live)
+        if num_live < 2:
+            self.__combat_round += 1
+            return dict.fromkeys(self.__player_ids, 0)
 
-        if len(self.__live_agents) > 1:
-            shuffle = np.random.choice(self.__live_agents, len(self.__live_agents), replace=False).tolist() if len(self.__live_agents) > 2 else self.__live_agents.copy()
-            prev = None
+        if num_live > 2:
+            live = [live[i] for i in np.argsort(self.__random_stream.uniforms(num_live), kind='stable').tolist()]
+        powers = np.array([players[i].calculate_board_power() for i in live])
 
-            for p in shuffle:
-                if prev:
-                    self._resolve_combat(prev, p, combat_results)
-                    prev = None
-                else:
-                    prev = p
+        # Losses and draws both cost one hp
+        damaged = (powers <= powers[self.__opponents[num_live]]).tolist()
+        combat_results = np.zeros(self.__num_players, dtype=np.int64)
+        combat_results[live] = np.where(damaged, -1, 1)
 
-            # Resolve combat for the last agent if odd number of agents
-            if prev:
-                self._resolve_last_combat(prev, shuffle[0], combat_results)
+        num_paired = num_live & ~1
+        if self.__log_file_path:
+            for k in range(0, num_paired, 2):
+                self._log_combat(live[k], powers[k], live[k + 1], powers[k + 1])
+        for k in range(num_paired):
+            if damaged[k]:
+                players[live[k]].take_damage()
 
-            self._update_live_agents()
-            self._assign_rewards_based_on_structure(rewards, combat_results)
+        # The ghost matchup is logged after the first player took damage from its own matchup
+        if num_paired < num_live:
+            if self.__log_file_path:
+                self._log_combat(live[-1], powers[-1], live[0], powers[0], ghost=True)
+            if damaged[-1]:
+                players[live[-1]].take_damage()
 
-        return rewards
+        survivors = [player.is_alive() for player in players]
+        self.__live_agents = [p for p, alive in zip(self.__player_ids, survivors) if alive]
+        rewards = self._assign_rewards_based_on_structure(combat_results, np.array(survivors))
 
-    def _resolve_last_combat(self, last_player, first_player, combat_results):
-        """
-        Resolve combat for the last player in case of an odd number of players.
+        self.__combat_round += 1
+        return dict(zip(self.__player_ids, rewards.tolist()))
 
-        :param last_player: Identifier for the last player.
-        :param first_player: Identifier for the first player in the shuffle.
-        :param rewards: The dictionary to update with combat results.
+    def win_matrix(self) -> np.ndarray:
         """
-        last_player_power = self.__players[last_player].calculate_board_power()
-        first_player_power = self.__players[first_player].calculate_board_power()
+        Compute the outcome of every player's current board against every other player's board,
+        without fighting. Dead players have empty boards.
 
-        if self.__log_file_path:
-            self.log_matchup(last_player, last_player_power, self.__players[last_player],
-                             first_player, first_player_power, self.__players[first_player])
-            
-        # Only the last player takes damage if they lose or draw
-        if last_player_power <= first_player_power:
-            self.__players[last_player].take_damage()
-            combat_results[last_player] = -1
-        else:
-            combat_results[last_player] = +1
-
-    def _resolve_combat(self, player1, player2, combat_results):
+        :return: An int8 array of shape (num_players, num_players), indexed in player order, where entry (i, j)
+                 is +1 if player i's board beats player j's, -1 if it loses, and 0 for a draw.
         """
-        Resolve combat between two players and update rewards.
+        return win_matrix([player.calculate_board_power() for player in self.__players.values()])
 
-        :param player1: Identifier for the first player.
-        :param player2: Identifier for the second player.
-        :param rewards: The dictionary to update with combat results.
+    def batch_win_matrix(self, boards: np.ndarray) -> np.ndarray:
         """
-        player1_power = self.__players[player1].calculate_board_power()
-        player2_power = self.__players[player2].calculate_board_power()
+        Compute the outcome matrices of stacks of boards, for example the boards of many games.
 
-        if self.__log_file_path:
-            self.log_matchup(player1, player1_power, self.__players[player1],
-                             player2, player2_power, self.__players[player2])
-
-        # Resolve combat outcome
-        if player1_power == player2_power:
-            self.__players[player1].take_damage()
-            combat_results[player1] = -1
-            self.__players[player2].take_damage()
-            combat_results[player2] = -1
-        elif player1_power > player2_power:
-            self.__players[player2].take_damage()
-            combat_results[player2] = -1
-            combat_results[player1] = +1
-        else:
-            self.__players[player1].take_damage()
-            combat_results[player1] = -1
-            combat_results[player2] = +1
+        :param boards: An array of (team, preferred_position, level) rows with shape
+                       (..., num_boards, board_size, 3), with -1 marking empty positions.
+        :return: An int8 array of shape (..., num_boards, num_boards), as returned by win_matrix.
+        """
+        return win_matrix(self.__board_power_cache.batch_champion_powers(boards).sum(-1))
 
-    def _update_live_agents(self):
+    def _log_combat(self, player1: int, player1_power: int, player2: int, player2_power: int, ghost: bool = False):
         """
-        Update the list of live agents after combat.
+        Log the matchup between two players given by index.
+
+        :param player1: Index of the first player.
+        :param player1_power: Combat power of the first player.
+        :param player2: Index of the second player.
+        :param player2_power: Combat power of the second player.
+        :param ghost: Whether the second player is the unpaired opponent of an odd matchup, which takes no damage.
         """
-        self.__live_agents = [p for p, player in self.__players.items() if player.is_alive()]
+        player1_name, player2_name = self.__player_ids[player1], self.__player_ids[player2]
+        self.log_matchup(player1_name, int(player1_power), self.__players[player1_name],
+                         player2_name, int(player2_power), self.__players[player2_name], ghost=ghost)
 
-    def _assign_rewards_based_on_structure(self, rewards, combat_results):
+    def _assign_rewards_based_on_structure(self, combat_results: np.ndarray, survivors: np.ndarray) -> np.ndarray:
             """
             Assign rewards to players based on the selected reward structure.
     
-            :param rewards: The rewards dictionary to be updated.
-            :param combat_results: The combat results for reward calculation.
+            :param combat_results: Per-player combat results: +1 for a win, -1 for a loss or draw, 0 for no combat.
+            :param survivors: Per-player boolean array of the players alive after combat.
+            :return: The per-player rewards array.
             """
+            rewards = np.zeros(self.__num_players, dtype=np.int64)
             if self.__reward_structure in ('damage', 'mixed'):
-                for p, result in combat_results.items():
-                    rewards[p] += result
+                rewards += combat_results
             if self.__reward_structure in ('game_placement', 'mixed'):
-                loss_penalty = (len(self.__live_agents) >= self.__num_players // 2) * -1
-                for p in combat_results.keys():
-                    if p not in self.__live_agents:
-                        rewards[p] += loss_penalty
-                    elif len(self.__live_agents) == 1:
-                        rewards[p] += 1
+                num_survivors = int(survivors.sum())
+                loss_penalty = (num_survivors >= self.__num_players // 2) * -1
+                rewards += (combat_results != 0) * np.where(survivors, num_survivors == 1, loss_penalty)
+            return rewards
             
     def action_space_size(self):
         return self.__action_space_size
     
     def log_matchup(self, player1_name: str, player1_power: int, player1: SimpleTFTPlayer, 
-                    player2_name: str, player2_power: int, player2: SimpleTFTPlayer):
+                    player2_name: str, player2_power: int, player2: SimpleTFTPlayer, ghost: bool = False):
         """
-        Log the matchup details between two players.
+        Log the matchup details between two players, as a text table or a binary battle log record.
 
         :param player1_name: Name of the first player.
         :param player1_power: Combat power of the first player.
@@ -318,59 +807,36 @@ class SimpleTFT(object):
         :param player2_name: Name of the second player.
         :param player2_power: Combat power of the second player.
         :param player2: Second player object.
+        :param ghost: Whether the second player is the unpaired opponent of an odd matchup, which takes no damage.
         """
         # Ensure the log file path is set
         if not self.__log_file_path:
             print("Log file path is not set. Cannot log matchup.")
             return
 
-        # Building the log entry
-        log_entry = self._build_log_entry(player1_name, player1_power, player1, player2_name, player2_power, player2)
+        # Entries are formatted by the log writer from snapshots of both players
+        if self.__log_format == 'binary':
+            self.__log_writer.write(encode_matchup, self.__game_index, self.__combat_round, ghost,
+                                    self._snapshot_player(self.__player_indices[player1_name], player1_power, player1),
+                                    self._snapshot_player(self.__player_indices[player2_name], player2_power, player2))
+        else:
+            self.__log_writer.write(render_matchup,
+                                    self._snapshot_player(player1_name, player1_power, player1),
+                                    self._snapshot_player(player2_name, player2_power, player2))
+
+    def _snapshot_player(self, name, power: int, player: SimpleTFTPlayer) -> tuple:
+        """
+        Capture what a matchup log entry shows about a player.
+
+        :param name: Name (text logs) or index (binary logs) of the player.
+        :param power: Combat power of the player.
+        :param player: The player object.
+        :return: Tuple of (name, power, hp, gold, board rows, bench rows), with rows as
+                 (team, preferred_position, level) lists and -1 marking empty slots.
+        """
+        roster = player.slots[:self.__board_size + self.__bench_size].tolist()
+        return name, power, player.hp, player.gold, roster[:self.__board_size], roster[self.__board_size:]
 
-        # Writing to the log file
-        try:
-            with open(self.__log_file_path, 'a') as file:
-                file.write(log_entry + "\n")
-        except IOError as e:
-            print(f"Failed to write to log file: {e}")
-
-    def _build_log_entry(self, player1_name, player1_power, player1, player2_name, player2_power, player2):                 
-        header = f"\t{player1_name} - Power: {player1_power} - HP: {player1.hp} - Gold: {player1.gold}\t\t\t{player2_name} - Power: {player2_power} - HP: {player2.hp} - Gold: {player2.gold}\n"
-        p1_teams = [c.team for c in player1.bench if c]
-        p1_pos = [c.preferred_position for c in player1.bench if c]
-        p1_level = [c.level for c in player1.bench if c]
-        p2_teams = [c.team for c in player2.bench if c]
-        p2_pos = [c.preferred_position for c in player2.bench if c]
-        p2_level = [c.level for c in player2.bench if c]
-        p1 = zip(p1_teams, p1_pos, p1_level)
-        p2 = zip(p2_teams, p2_pos, p2_level)
-        p1 = [i for i in p1]
-        p2 = [i for i in p2]
-        ts = 6 - int(1.4 * len(p1))
-        bench_header = f"\t Bench: {p1}" + "\t" * ts + f" Bench: {p2}\n"
-        sub_header = f"{'Position':^10} | {'Team':^10} | {'Preferred Pos':^15} | {'Level':^10}\t|||\t"
-        sub_header += f"{'Position':^10} | {'Team':^10} | {'Preferred Pos':^15} | {'Level':^10}\n"
-        divider = '-' * (10 + 1 + 10 + 1 + 15 + 1 + 10 + 1) * 2 + "\n"
-    
-        log_entry = header + bench_header + sub_header + divider
-    
-        for position, champ in enumerate(player1.board):
-            team, pref_pos, level = "None", "None", "None"
-            if champ:
-                team = champ.team
-                pref_pos = champ.preferred_position
-                level = champ.level
-            log_entry += f"{position:^10} | {team:^10} | {pref_pos:^15} | {level:^10}\t|||\t"
-            team, pref_pos, level = "None", "None", "None"
-            champ = player2.board[position]
-            if champ:
-                team = champ.team
-                pref_pos = champ.preferred_position
-                level = champ.level
-            log_entry += f"{position:^10} | {team:^10} | {pref_pos:^15} | {level:^10}\n"
-           
-        return log_entry
-    
     def make_dones(self) -> dict:
         """
         Create a dictionary indicating whether each player is done with the game.
@@ -396,22 +862,91 @@ class SimpleTFT(object):
         """
         return {p: (p in self.__live_agents) for p in self.__players}
     
+    def _make_observations(self):
+        """
+        Generate observations in the configured observation mode.
+
+        :return: A dictionary of observations for each player, the observation buffer in 'buffer' mode,
+                 or a SimpleTFTSharedObservation in 'shared' mode.
+        """
+        if self.__observation_mode == 'buffer':
+            return self.write_observation_buffer()
+        if self.__observation_mode == 'shared':
+            return self.write_shared_observation()
+        return self.make_player_observations()
+    
+    def write_observation_buffer(self) -> np.ndarray:
+        """
+        Write observations for each player into the observation buffer. Only the rows of players whose
+        observation was rebuilt are copied; the round timer is refreshed in place for the others.
+
+        :return: The observation buffer.
+        """
+        self._update_observation_cache()
+        buffer = self.__observation_buffer
+        player_ids = list(self.__players)
+        if self.__observation_buffer_stale:
+            updated = range(self.__num_players)
+            self.__observation_buffer_stale = False
+        else:
+            updated = [player_ids.index(p) for p in self.__rebuilt_players]
+
+        for p in updated:
+            _, public_obs, private_obs = self.__observation_cache[player_ids[p]]
+            observers, rows = np.nonzero(self.__observation_index[:, 1:] == p)
+            buffer[p, 0] = private_obs
+            buffer[observers, rows + 1] = public_obs
+
+        alive = np.array([player.is_alive() for player in self.__players.values()])
+        if alive.any():
+            timer = self.__actions_until_combat / (self.__actions_per_round - 1)
+            buffer[:, :, -1, 2] = np.where(alive[self.__observation_index], timer, 0)
+        return buffer
+    
+    def write_shared_observation(self) -> SimpleTFTSharedObservation:
+        """
+        Write the public and private view of each player once, for 'shared' observation mode.
+        Only the views of players whose observation was rebuilt are copied, so the cost grows with the
+        number of players rather than its square. Per-player observations can be gathered with index,
+        or expanded with gather_observations.
+
+        :return: The SimpleTFTSharedObservation, updated in place.
+        """
+        self._update_observation_cache()
+        shared = self.__shared_observation
+        if self.__observation_buffer_stale:
+            updated = list(self.__players)
+            self.__observation_buffer_stale = False
+        else:
+            updated = self.__rebuilt_players
+
+        for player_id in updated:
+            p = self.__player_indices[player_id]
+            _, shared.public[p], shared.private[p] = self.__observation_cache[player_id]
+
+        alive = np.array([player.is_alive() for player in self.__players.values()])
+        if alive.any():
+            timer = self.__actions_until_combat / (self.__actions_per_round - 1)
+            shared.public[alive, -1, 2] = timer
+            shared.private[alive, -1, 2] = timer
+        return shared
+
     def make_player_observations(self) -> dict:
         """
         Generate observations for each player, including both their own and others' publicly visible states.
 
         :return: A dictionary of observations for each player.
         """
+        self._update_observation_cache()
         observations = {}
-        public_observations = self.make_public_observations()
         for player_id, player in self.__players.items():
             player_obs = np.zeros(self.__observation_shape)
-            player_obs[0, :, :] = self.observe_player(player, False)
+            player_obs[0, :, :] = self.__observation_cache[player_id][2]
 
             ax1 = 1
             for other_player_id, _ in self.__players.items():
                 if other_player_id != player_id:
-                    player_obs[ax1, :, :] = public_observations[other_player_id]
+                    player_obs[ax1, :, :] = self.__observation_cache[other_player_id][1]
                     ax1 += 1
 
             observations[player_id] = player_obs
@@ -423,7 +958,25 @@ class SimpleTFT(object):
 
         :return: A dictionary of public observations for each player.
         """
-        return {player_id: self.observe_player(player) for player_id, player in self.__players.items()}
+        self._update_observation_cache()
+        return {player_id: cached[1].copy() for player_id, cached in self.__observation_cache.items()}
+    
+    def _update_observation_cache(self):
+        """
+        Rebuild the cached public and private observations of players whose board, bench, shop,
+        gold or hp changed since they were last observed, and refresh the round timer of the others.
+        """
+        self.__rebuilt_players = []
+        for player_id, player in self.__players.items():
+            cached = self.__observation_cache.get(player_id)
+            if cached is None or cached[0] != player.version:
+                self.__observation_cache[player_id] = (player.version,) + self._build_player_views(player)
+                self.__rebuilt_players.append(player_id)
+            elif player.is_alive():
+                timer = self.__actions_until_combat / (self.__actions_per_round - 1)
+                cached[1][-1, 2] = timer
+                cached[2][-1, 2] = timer
+        self.__observation_rebuilds = 2 * len(self.__rebuilt_players)
         
     def observe_player(self, player: SimpleTFTPlayer, public=True) -> np.array:
         """
@@ -433,52 +986,49 @@ class SimpleTFT(object):
         :param public: Flag to determine if the observation is public or private.
         :return: An array representing the player's state.
         """
-        observation = np.zeros(self.__observation_shape[1:])
-        if player.is_alive():
-            observation = self._build_player_observation(player, public)
-        return observation
-
-
-    def _build_player_observation(self, player: SimpleTFTPlayer, public=True) -> np.array:
-        observation = np.zeros(self.observation_shape[1:])
-        if player.is_alive():
-            ax1 = 0
-            for i, pos in enumerate(player.board):
-                if pos:
-                    observation[ax1, :] = self._observe_champion(pos)
-                ax1 += 1
-            for i, pos in enumerate(player.bench):
-                if pos:
-                    observation[ax1, :] = self._observe_champion(pos)
-                ax1 += 1
-            for i, pos in enumerate(player.shop):
-                if not public and pos:
-                    observation[ax1, :] = self._observe_champion(pos)
-                ax1 += 1      
-            if not public:              
-                observation[ax1, 0] = np.clip(player.gold / 30, 0, 1)
-            observation[ax1, 1] = player.hp / 10
-            observation[ax1, 2] = self.__actions_until_combat / (self.__actions_per_round - 1)
-            observation[ax1, 3] = player.calculate_board_power() / self.__max_board_power
-        return observation 
-        
-    def _observe_champion(self, champ: SimpleTFTChampion) -> np.array:
+        public_obs, private_obs = self._build_player_views(player)
+        return public_obs if public else private_obs
+
+    def _build_player_views(self, player: SimpleTFTPlayer) -> (np.array, np.array):
         """
-        Observe the state of a champion.
-        
-        :param champ: The champion to observe.
-        :return: An array representing the champion's state.
-        """
-        observation = np.zeros(self.observation_shape[-1])
-        if champ:
-            observation[champ.team] = 1
-            ax = self.__num_teams
-            observation[ax + champ.preferred_position] = 1
-            ax += self.__board_size
-            observation[ax + champ.level] = 1
-            ax += self.__max_champ_level + 1
-            observation[ax] = champ.power / self.__max_champ_power
-        return observation 
+        Build the public and private view of a player in one pass. The private view is written first,
+        and the public view is a copy of it without the shop rows and gold.
+
+        :param player: The player to observe.
+        :return: Tuple of (public, private) observations.
+        """
+        private_obs = np.zeros(self.__observation_shape[1:])
+        if not player.is_alive():
+            return private_obs.copy(), private_obs
+
+        # One scattered write sets every champion's team, position, level and power, and the player's state
+        slots = player.slots.tolist()
+        powers = player.champion_powers.tolist()
+        width = self.__observation_shape[-1]
+        position_column = self.__num_teams
+        level_column = position_column + self.__board_size
+        power_column = level_column + self.__max_champ_level + 1
+        indices, values = [], []
+        offset = 0
+        for i, (team, position, level) in enumerate(slots):
+            if team >= 0:
+                indices += (offset + team, offset + position_column + position, offset + level_column + level)
+                values += (1, 1, 1)
+                if i < self.__board_size:
+                    indices.append(offset + power_column)
+                    values.append(powers[i] / self.__max_champ_power)
+            offset += width
+        indices += (offset + 1, offset + 2, offset + 3)
+        values += (player.hp / 10,
+                   self.__actions_until_combat / (self.__actions_per_round - 1),
+                   player.calculate_board_power() / self.__max_board_power)
+        private_obs.put(indices, values)
+
+        ax1 = len(slots)
+        public_obs = private_obs.copy()
+        public_obs[self.__board_size + self.__bench_size:ax1] = 0
+        private_obs[ax1, 0] = min(max(player.gold / 30, 0), 1)
+        return public_obs, private_obs
     
     def calculate_power_rewards(self, rewards: dict):
         """
@@ -543,13 +1093,24 @@ class SimpleTFT(object):
             print("Log file path is not set. Cannot log matchup.")
             return
 
-        # Writing to the log file
-        try:
-            with open(self.__log_file_path, 'a') as file:
-                for line in self.__log:
-                    file.write(line + "\n")
-        except IOError as e:
-            print(f"Failed to write to log file: {e}")
-        finally:
-            self.__log = [] # Reset the log regardless of success or failure
+        # The writer takes the pending lines; formatting and file access happen in its background thread
+        self.__log_writer.write_lines(self.__log)
+        self.__log = []
 
+    def close(self):
+        """
+        Flush and close the log file, if any. Logging stops until a later reset with a log_file_path.
+        Pre-generation of reset states pauses until the next reset.
+        """
+        if self.__reset_pregenerator is not None:
+            self.__reset_pregenerator.close()
+        self._close_log()
+
+    def _close_log(self):
+        """
+        Flush and close the log file, if any, leaving pre-generation of reset states running.
+        """
+        if self.__log_writer is not None:
+            self.__log_writer.close()
+            self.__log_writer = None
+        self.__log_file_path = ""
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+from .tft import SimpleTFT
+from statistics import NormalDist
+import argparse
+import json
+import multiprocessing as mp
+import numpy as np
+
+def random_policy(observation: np.ndarray, action_mask: np.ndarray, rng: np.random.Generator) -> int:
+    """
+    Pick a valid action uniformly at random.
+
+    :param observation: The player's observation.
+    :param action_mask: The player's action mask.
+    :param rng: The numpy Generator of the player's seat.
+    :return: The action index.
+    """
+    valid = np.flatnonzero(action_mask)
+    return int(valid[rng.integers(len(valid))]) if len(valid) else len(action_mask) - 1
+
+def idle_policy(observation: np.ndarray, action_mask: np.ndarray, rng: np.random.Generator) -> int:
+    """
+    Always stay idle, the last action of the action space.
+    """
+    return len(action_mask) - 1
+
+def game_seed(seed: np.random.SeedSequence, game: int) -> np.random.SeedSequence:
+    """
+    Get the seed of one game of a tournament, without deriving the seeds of earlier games.
+    It is the game-th child that seed.spawn would return, so tournaments seeded by different
+    children of the same SeedSequence play different games.
+
+    :param seed: The tournament's SeedSequence.
+    :param game: Index of the game.
+    :return: A SeedSequence.
+    """
+    return np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key + (game,), pool_size=seed.pool_size)
+
+def play_games(policies: list, config: dict, seed: np.random.SeedSequence, first_game: int,
+               num_games: int) -> (np.ndarray, np.ndarray):
+    """
+    Play full games, seating policies at random.
+
+    Placements follow elimination order: players eliminated in the same combat share the best
+    placement left, and the last player standing places first.
+
+    :param policies: List of policy callables, called as policy(observation, action_mask, rng).
+    :param config: A dictionary containing game configuration settings (see SimpleTFT).
+    :param seed: The tournament's SeedSequence.
+    :param first_game: Index of the first game, which determines its seed.
+    :param num_games: Number of games.
+    :return: Tuple of (seats, placements), integer arrays of shape (num_games, num_players) holding
+             the policy index and the placement of each seat.
+    """
+    env = SimpleTFT(dict(config, seed=None, debug=False, observation_mode='dict'))
+    num_players = env.num_players
+    seats = np.zeros((num_games, num_players), dtype=np.int32)
+    placements = np.zeros((num_games, num_players), dtype=np.int32)
+
+    for k in range(num_games):
+        env_seed, seating_seed, policy_seed = game_seed(seed, first_game + k).spawn(3)
+        rng = np.random.default_rng(seating_seed)
+        if len(policies) >= num_players:
+            seats[k] = rng.choice(len(policies), num_players, replace=False)
+        else:
+            seats[k] = rng.permutation(np.resize(np.arange(len(policies)), num_players))
+        rngs = [np.random.default_rng(s) for s in policy_seed.spawn(num_players)]
+
+        observations, _, masks = env.reset(seed=env_seed)
+        player_ids = list(masks)
+        done = dict.fromkeys(player_ids, False)
+        while not all(done.values()):
+            actions = {p: policies[seats[k, i]](observations[p], masks[p], rngs[i]) if not done[p] else 0
+                       for i, p in enumerate(player_ids)}
+            observations, _, _, dones, masks = env.step(actions)
+            live_agents = env.live_agents
+            for i, p in enumerate(player_ids):
+                if dones[p] and not done[p]:
+                    placements[k, i] = 1 if p in live_agents else len(live_agents) + 1
+            done = dones
+    env.close()
+    return seats, placements
+
+# Policies of the worker processes, set once by the pool initializer
+_worker_policies = None
+_worker_config = None
+
+def _init_worker(policies: list, config: dict):
+    global _worker_policies, _worker_config
+    _worker_policies, _worker_config = policies, config
+
+def _play_task(task: tuple) -> (np.ndarray, np.ndarray):
+    return play_games(_worker_policies, _worker_config, *task)
+
+class SimpleTFTTournamentStats(object):
+    def __init__(self, policy_names: list):
+        """
+        Initialize an online aggregator of tournament results. Memory only depends on the number of
+        policies: per-policy placement sums and a matrix of pairwise scores, where a better placement
+        in a game scores a win against every other policy's seat in it and an equal placement a draw.
+
+        :param policy_names: Names of the policies, in the order of the policy indices of the results.
+        """
+        self.__names = list(policy_names)
+        P = len(self.__names)
+        self.__games = 0
+        self.__seats = np.zeros(P, dtype=np.int64)
+        self.__wins = np.zeros(P, dtype=np.int64)
+        self.__placement_sum = np.zeros(P)
+        self.__placement_sq_sum = np.zeros(P)
+        self.__pair_scores = np.zeros((P, P))
+
+    @property
+    def games(self):
+        return self.__games
+
+    @property
+    def policy_names(self):
+        return self.__names.copy()
+
+    @property
+    def pair_scores(self):
+        """
+        Get the pairwise score matrix: entry (i, j) counts seats of policy i that placed better than
+        a seat of policy j in the same game, with draws counting half.
+
+        :return: A read-only array of shape (num_policies, num_policies).
+        """
+        scores = self.__pair_scores.view()
+        scores.flags.writeable = False
+        return scores
+
+    def update(self, seats: np.ndarray, placements: np.ndarray):
+        """
+        Add the results of games.
+
+        :param seats: Integer array of shape (num_games, num_players) with the policy index of each seat.
+        :param placements: Integer array of shape (num_games, num_players) with the placement of each seat.
+        """
+        seats, placements = np.asarray(seats), np.asarray(placements)
+        P = len(self.__names)
+        self.__games += len(seats)
+        self.__seats += np.bincount(seats.ravel(), minlength=P)
+        self.__wins += np.bincount(seats.ravel(), weights=(placements == 1).ravel(), minlength=P).astype(np.int64)
+        self.__placement_sum += np.bincount(seats.ravel(), weights=placements.ravel(), minlength=P)
+        self.__placement_sq_sum += np.bincount(seats.ravel(), weights=placements.ravel() ** 2.0, minlength=P)
+
+        num_players = seats.shape[1]
+        for i in range(num_players):
+            for j in range(i + 1, num_players):
+                a, b = seats[:, i], seats[:, j]
+                score = (placements[:, i] < placements[:, j]) + 0.5 * (placements[:, i] == placements[:, j])
+                other = a != b
+                np.add.at(self.__pair_scores, (a[other], b[other]), score[other])
+                np.add.at(self.__pair_scores, (b[other], a[other]), 1 - score[other])
+
+    def merge(self, other: 'SimpleTFTTournamentStats'):
+        """
+        Add the results aggregated by another instance for the same policies.
+
+        :param other: A SimpleTFTTournamentStats instance.
+        :raises ValueError: If the policies differ.
+        """
+        if other.policy_names != self.__names:
+            raise ValueError("Cannot merge tournament statistics of different policies")
+        self.__games += other.__games
+        self.__seats += other.__seats
+        self.__wins += other.__wins
+        self.__placement_sum += other.__placement_sum
+        self.__placement_sq_sum += other.__placement_sq_sum
+        self.__pair_scores += other.__pair_scores
+
+    def ratings(self, num_iterations: int = 1000, tolerance: float = 1e-9) -> (np.ndarray, np.ndarray):
+        """
+        Fit Bradley-Terry strengths to the pairwise scores, with one virtual draw between every pair of
+        policies so that unbeaten or winless policies get finite ratings, and express them as Elo ratings
+        averaging 1500.
+
+        :param num_iterations: Maximum number of minorization-maximization iterations.
+        :param tolerance: Largest change in log strength at which iterations stop.
+        :return: Tuple of (ratings, standard errors), arrays of shape (num_policies,). Seats of one game are
+                 counted as independent pairings, so standard errors are optimistic.
+        """
+        P = len(self.__names)
+        scores = self.__pair_scores + 0.5 * (1 - np.eye(P))
+        pairings = scores + scores.T
+        wins = scores.sum(1)
+        strengths = np.ones(P)
+        for _ in range(num_iterations):
+            updated = wins / (pairings / (strengths[:, None] + strengths[None, :])).sum(1)
+            updated /= np.exp(np.log(updated).mean())
+            converged = np.abs(np.log(updated) - np.log(strengths)).max() < tolerance
+            strengths = updated
+            if converged:
+                break
+
+        # Fisher information of the log strengths; the pseudo-inverse fixes the free offset at zero mean
+        weights = pairings * strengths[:, None] * strengths[None, :] / (strengths[:, None] + strengths[None, :]) ** 2
+        information = np.diag(weights.sum(1)) - weights
+        variances = np.clip(np.diag(np.linalg.pinv(information)), 0, None)
+
+        scale = 400 / np.log(10)
+        log_strengths = np.log(strengths)
+        return 1500 + scale * (log_strengths - log_strengths.mean()), scale * np.sqrt(variances)
+
+    def summary(self, confidence: float = 0.95) -> dict:
+        """
+        Summarize the results of each policy.
+
+        :param confidence: Confidence level of the intervals.
+        :return: A dictionary mapping policy name to its number of seats played, win rate with a Wilson
+                 score interval, average placement with a normal interval, and Elo rating with a normal interval.
+        """
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        ratings, errors = self.ratings()
+        summary = {}
+        for i, name in enumerate(self.__names):
+            n = int(self.__seats[i])
+            result = {'seats': n, 'elo': float(ratings[i]),
+                      'elo_ci': (float(ratings[i] - z * errors[i]), float(ratings[i] + z * errors[i]))}
+            if n:
+                win_rate = self.__wins[i] / n
+                center = (win_rate + z ** 2 / (2 * n)) / (1 + z ** 2 / n)
+                margin = z / (1 + z ** 2 / n) * np.sqrt(win_rate * (1 - win_rate) / n + z ** 2 / (4 * n ** 2))
+                mean = self.__placement_sum[i] / n
+                sd = np.sqrt(max(self.__placement_sq_sum[i] / n - mean ** 2, 0) * n / max(n - 1, 1))
+                result.update({'win_rate': float(win_rate),
+                               'win_rate_ci': (float(center - margin), float(center + margin)),
+                               'mean_placement': float(mean),
+                               'mean_placement_ci': (float(mean - z * sd / np.sqrt(n)), float(mean + z * sd / np.sqrt(n)))})
+            summary[name] = result
+        return summary
+
+def run_tournament(policies: dict,
+                   num_games: int,
+                   config: dict = {},
+                   num_workers: int = 0,
+                   games_per_task: int = 64,
+                   seed=None,
+                   first_game: int = 0,
+                   stats: SimpleTFTTournamentStats = None,
+                   progress=None,
+                   start_method: str = None) -> SimpleTFTTournamentStats:
+    """
+    Play seeded games between policies and stream their placements into an online aggregator.
+    Games are played in tasks of games_per_task games, and each task's results are aggregated and
+    discarded as it finishes, in game order, so results only depend on the seed.
+
+    :param policies: A dictionary mapping policy name to a callable policy(observation, action_mask, rng)
+                     returning an action. With worker processes started by 'spawn', policies must be picklable.
+    :param num_games: Number of games.
+    :param config: A dictionary containing game configuration settings (see SimpleTFT).
+    :param num_workers: Number of worker processes, or 0 to play in this process.
+    :param games_per_task: Number of games played per task.
+    :param seed: None, an integer, or a SeedSequence. Game g is seeded by the g-th spawned child.
+    :param first_game: Index of the first game, to continue an earlier tournament with the same seed.
+    :param stats: Optional SimpleTFTTournamentStats to add the results to.
+    :param progress: Optional callable called with the stats after each task.
+    :param start_method: Optional multiprocessing start method (e.g. 'fork', 'spawn').
+    :return: The SimpleTFTTournamentStats.
+    :raises ValueError: If there are no policies, or the stats were aggregated for other policies.
+    """
+    if not policies:
+        raise ValueError("A tournament needs at least one policy")
+    if not all(isinstance(x, int) and x >= 0 for x in [num_games, num_workers, first_game]):
+        raise ValueError("num_games, num_workers and first_game must be non-negative integers")
+    if not isinstance(games_per_task, int) or games_per_task <= 0:
+        raise ValueError("games_per_task must be a positive integer")
+
+    names, callables = list(policies), list(policies.values())
+    if stats is None:
+        stats = SimpleTFTTournamentStats(names)
+    elif stats.policy_names != names:
+        raise ValueError("stats were aggregated for other policies")
+    config = SimpleTFT(config).config
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    tasks = ((seed, start, min(games_per_task, first_game + num_games - start))
+             for start in range(first_game, first_game + num_games, games_per_task))
+
+    def aggregate(results):
+        for seats, placements in results:
+            stats.update(seats, placements)
+            if progress is not None:
+                progress(stats)
+
+    if num_workers == 0:
+        aggregate(play_games(callables, config, *task) for task in tasks)
+    else:
+        with mp.get_context(start_method).Pool(num_workers, _init_worker, (callables, config)) as pool:
+            aggregate(pool.imap(_play_task, tasks))
+    return stats
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Play a tournament between the random and idle policies "
+                                                 "and print a JSON summary.")
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=0)
+    parser.add_argument('--num-players', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    config = {'num_players': args.num_players, 'num_teams': max(3, 2 * args.num_players)}
+    stats = run_tournament({'random': random_policy, 'idle': idle_policy}, args.games, config,
+                           num_workers=args.workers, seed=args.seed)
+    print(json.dumps({'games': stats.games, 'policies': stats.summary()}, indent=2))
+
+if __name__ == "__main__":
+    main()
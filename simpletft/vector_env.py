@@ -0,0 +1,511 @@
+# -*- coding: utf-8 -*-
+from .action_spec import (SimpleTFTActionSpec, IDLE, BOARD_TO_BOARD, BENCH_TO_BENCH,
+                          SELL_FROM_BOARD, SELL_FROM_BENCH, PURCHASE, REFRESH)
+from .champion_pool import SimpleTFTChampionPool
+from .random_stream import SimpleTFTRandomStream, spawn_seeds
+from .tft import SimpleTFT, win_matrix
+import numpy as np
+
+class SimpleTFTVectorEnv(object):
+    def __init__(self, config: dict = {}, num_games: int = 1):
+        """
+        Initialize K independent SimpleTFT games stored as batched NumPy state.
+
+        Every champion slot is encoded as a (team, preferred_position, level) triple,
+        with -1 marking an empty slot. Slots are laid out per player as board, bench, shop.
+
+        Each game draws from its own random stream, spawned from the optional 'seed' with SeedSequence.spawn
+        like in SubprocVectorEnv, so a game's trajectory does not depend on the number of games or on when
+        other games are reset. Game k follows the same trajectory as a SimpleTFT seeded with the k-th
+        spawned seed, given the same actions.
+
+        :param config: A dictionary containing game configuration settings (see SimpleTFT).
+        :param num_games: The number of games (K) stepped together.
+        :raises ValueError: If any configuration values are invalid.
+        """
+        if not isinstance(num_games, int) or num_games <= 0:
+            raise ValueError("num_games must be a positive integer")
+
+        # Validate the configuration and fill in defaults using the single game environment
+        template = SimpleTFT(config)
+        settings = template.config
+        if settings['debug']:
+            raise ValueError("debug logging is not supported by SimpleTFTVectorEnv")
+
+        self.__num_games = num_games
+        self.__num_players = settings['num_players']
+        self.__board_size = settings['board_size']
+        self.__bench_size = settings['bench_size']
+        self.__shop_size = settings['shop_size']
+        self.__num_teams = settings['num_teams']
+        self.__champ_copies = settings['champ_copies']
+        self.__actions_per_round = settings['actions_per_round']
+        self.__gold_per_round = settings['gold_per_round']
+        self.__interest_increment = settings['interest_increment']
+        self.__reward_structure = settings['reward_structure']
+        self.__board_power_cache = template.board_power_cache
+        self.__observation_shape = template.observation_shape
+        self.__action_space_size = template.action_space_size()
+
+        self.__max_champ_level = int(np.log2(self.__champ_copies))
+        self.__max_champ_power = self.__max_champ_level + 3
+        self.__max_board_power = self.__board_size * self.__max_champ_power
+        self.__roster_size = self.__board_size + self.__bench_size
+        self.__num_slots = self.__roster_size + self.__shop_size
+
+        self.__random_streams = [SimpleTFTRandomStream(seed) for seed in spawn_seeds(config.get('seed'), num_games)]
+        self.__spec = SimpleTFTActionSpec.get(self.__board_size, self.__bench_size, self.__shop_size)
+
+        # Index of every other player, in observation order, for each observer
+        self.__others = np.array([[q for q in range(self.__num_players) if q != p]
+                                  for p in range(self.__num_players)], dtype=np.intp).reshape(self.__num_players, -1)
+
+        K, P = self.__num_games, self.__num_players
+        self.__pool = np.zeros((K, self.__num_teams, self.__board_size), dtype=np.int64)
+        self.__slots = np.full((K, P, self.__num_slots, 3), -1, dtype=np.int16)
+        self.__gold = np.zeros((K, P), dtype=np.int64)
+        self.__hp = np.zeros((K, P), dtype=np.int64)
+        self.__killed = np.zeros((K, P), dtype=bool)
+        self.__live = np.zeros((K, P), dtype=bool)
+        self.__actions_until_combat = np.zeros(K, dtype=np.int64)
+        self.__player_power = np.zeros((K, P), dtype=np.int64)
+
+    @property
+    def num_games(self):
+        """
+        Get the number of games stepped together.
+
+        :return: int
+        """
+        return self.__num_games
+
+    @property
+    def num_players(self):
+        """
+        Get the number of players in each game.
+
+        :return: int
+        """
+        return self.__num_players
+
+    @property
+    def observation_shape(self):
+        """
+        Get the shape of a single player's observation in a single game.
+
+        :return: A tuple representing the shape of the observation space.
+        """
+        return self.__observation_shape
+
+    def action_space_size(self):
+        return self.__action_space_size
+
+    def step(self, actions: np.ndarray) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+        """
+        Process a game step in every game given the actions of each player.
+
+        :param actions: An integer array of shape (num_games, num_players).
+        :return: Tuple containing stacked player observations, rewards, acting players, dones, and action masks.
+        :raises ValueError: If the actions have the wrong shape, type, or range.
+        """
+        actions = np.asarray(actions)
+        if actions.shape != (self.__num_games, self.__num_players):
+            raise ValueError(f"Actions must have shape {(self.__num_games, self.__num_players)}")
+        if not np.issubdtype(actions.dtype, np.integer):
+            raise ValueError("Action must be an integer")
+        if actions.size and (actions.min() < 0 or actions.max() >= self.__action_space_size ** 2):
+            raise ValueError(f"Action must be within the range 0 to {self.__action_space_size ** 2 - 1}")
+
+        for p in range(self.__num_players):
+            self._take_actions(p, actions[:, p])
+
+        rewards = np.zeros((self.__num_games, self.__num_players))
+        combat_games = self.__actions_until_combat == 0
+        if combat_games.any():
+            self.combat(combat_games, rewards)
+            self.__actions_until_combat[combat_games] = self.__actions_per_round
+            self.post_combat(combat_games)
+
+        self.__actions_until_combat -= 1
+
+        if self.__reward_structure == "power":
+            self.calculate_power_rewards(rewards)
+
+        return (self.make_player_observations(), rewards, self.make_acting_players(),
+                self.make_dones(), self.make_action_masks())
+
+    def reset(self, games: np.ndarray = None, seed=None) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Reset games to their initial state.
+
+        :param games: Optional boolean mask or index array of the games to reset. Defaults to all games.
+        :param seed: Optional integer, SeedSequence, or numpy Generator from which per-game seeds are spawned.
+                     Each reset game k is reseeded with the k-th spawned seed, the other games' streams continue.
+        :return: Tuple containing stacked player observations, acting players, and action masks.
+        """
+        g = np.arange(self.__num_games) if games is None else np.asarray(games)
+        if g.dtype == bool:
+            g = np.flatnonzero(g)
+        if seed is not None:
+            seeds = spawn_seeds(seed, self.__num_games)
+            for k in g:
+                self.__random_streams[k].seed(seeds[k])
+        if not g.size:
+            return self.make_player_observations(), self.make_acting_players(), self.make_action_masks()
+
+        self.__pool[g] = self.__champ_copies
+        self.__slots[g] = -1
+        self.__gold[g] = 0
+        self.__hp[g] = 10
+        self.__killed[g] = False
+        self.__live[g] = True
+        self.__actions_until_combat[g] = self.__actions_per_round - 1
+
+        for p in range(self.__num_players):
+            champs = self._sample(g, 1)[:, 0]
+            added = self._add_champions(g, p, champs)
+            self.__gold[g[~added], p] += 1
+            self._return_to_pool(g[~added], champs[~added, None])
+            self.__gold[g, p] += self.__gold_per_round + 1
+            self._refresh_shops(g, p)
+
+        if self.__reward_structure == "power":
+            self.__player_power[g] = self.calculate_board_powers()[g]
+
+        return self.make_player_observations(), self.make_acting_players(), self.make_action_masks()
+
+    def _take_actions(self, p: int, actions: np.ndarray):
+        """
+        Apply one action per game for a single player seat.
+
+        :param p: The player index.
+        :param actions: An integer array of shape (num_games,).
+        """
+        actions = np.minimum(actions, self.__action_space_size - 1)
+        kind = np.where(self.__hp[:, p] > 0, self.__spec.kind[actions], IDLE)
+        first = self.__spec.action_from[actions]
+        second = self.__spec.action_to[actions]
+
+        # Moves swap two board or bench slots
+        g = np.flatnonzero((kind >= BOARD_TO_BOARD) & (kind <= BENCH_TO_BENCH))
+        if g.size:
+            i, j = first[g], second[g]
+            from_champ = self.__slots[g, p, i]
+            self.__slots[g, p, i] = self.__slots[g, p, j]
+            self.__slots[g, p, j] = from_champ
+
+        g = np.flatnonzero((kind == SELL_FROM_BOARD) | (kind == SELL_FROM_BENCH))
+        if g.size:
+            i = first[g]
+            champs = self.__slots[g, p, i]
+            occupied = champs[:, 0] >= 0
+            g, i, champs = g[occupied], i[occupied], champs[occupied]
+            self._return_to_pool(g, champs[:, None])
+            self.__gold[g, p] += 1 << champs[:, 2].astype(np.int64)
+            self.__slots[g, p, i] = -1
+
+        g = np.flatnonzero(kind == PURCHASE)
+        if g.size:
+            i = first[g]
+            champs = self.__slots[g, p, i]
+            if (self.__gold[g, p] <= 0).any():
+                raise ValueError("Insufficient gold to make a purchase")
+            if (champs[:, 0] < 0).any():
+                raise ValueError("No champion at the specified shop position")
+            added = self._add_champions(g, p, champs)
+            self.__gold[g[added], p] -= 1
+            self.__slots[g[added], p, i[added]] = -1
+
+        g = np.flatnonzero(kind == REFRESH)
+        if g.size:
+            if (self.__gold[g, p] <= 0).any():
+                raise ValueError("Insufficient gold to refresh shop")
+            self._refresh_shops(g, p)
+
+    def _add_champions(self, g: np.ndarray, p: int, champs: np.ndarray) -> np.ndarray:
+        """
+        Attempt to add one champion per game to a player's board or bench,
+        leveling up a matching champion if one exists.
+
+        :param g: Indices of the games.
+        :param p: The player index.
+        :param champs: Champion triples of shape (len(g), 3).
+        :return: A boolean array, True where the champion was added or matched.
+        """
+        roster = self.__slots[g, p, :self.__roster_size]
+        matches = (roster == champs[:, None, :]).all(-1)
+        matched = matches.any(1)
+
+        # Place unmatched champions on the first empty bench position
+        empty = roster[:, self.__board_size:, 0] < 0
+        placed = ~matched & empty.any(1)
+        bench_i = self.__board_size + empty.argmax(1)
+        self.__slots[g[placed], p, bench_i[placed]] = champs[placed]
+
+        # Level up the matching champion and resolve any cascaded merges
+        gm, i = g[matched], matches[matched].argmax(1)
+        self.__slots[gm, p, i, 2] += 1
+        self._resolve_merges(gm, p, i)
+        return matched | placed
+
+    def _resolve_merges(self, g: np.ndarray, p: int, i: np.ndarray):
+        """
+        Merge a freshly leveled champion with an identical champion on the board or bench,
+        repeating while merges produce new matches. The champion earlier in board-then-bench
+        order is leveled and the other is removed.
+
+        :param g: Indices of the games.
+        :param p: The player index.
+        :param i: The roster position of the freshly leveled champion in each game.
+        """
+        for _ in range(self.__max_champ_level):
+            if not g.size:
+                return
+            champs = self.__slots[g, p, i]
+            matches = (self.__slots[g, p, :self.__roster_size] == champs[:, None, :]).all(-1)
+            matches[np.arange(g.size), i] = False
+            matched = matches.any(1)
+            g, i, j = g[matched], i[matched], matches[matched].argmax(1)
+            keep, drop = np.minimum(i, j), np.maximum(i, j)
+            self.__slots[g, p, keep, 2] += 1
+            self.__slots[g, p, drop] = -1
+            i = keep
+
+    def _refresh_shops(self, g: np.ndarray, p: int):
+        """
+        Return a player's shop to the pool and draw a new one, spending one gold.
+
+        :param g: Indices of the games.
+        :param p: The player index.
+        """
+        self._return_to_pool(g, self.__slots[g, p, self.__roster_size:])
+        self.__slots[g, p, self.__roster_size:] = self._sample(g, self.__shop_size)
+        self.__gold[g, p] -= 1
+
+    def _return_to_pool(self, g: np.ndarray, champs: np.ndarray):
+        """
+        Add champions back to the pool, decomposing leveled champions into base level copies.
+
+        :param g: Indices of the games.
+        :param champs: Champion triples of shape (len(g), M, 3). Empty slots are ignored.
+        """
+        occupied = champs[..., 0] >= 0
+        games = np.broadcast_to(g[:, None], occupied.shape)[occupied]
+        champs = champs[occupied]
+        np.add.at(self.__pool, (games, champs[:, 0], champs[:, 1]), 1 << champs[:, 2].astype(np.int64))
+
+    def _sample(self, g: np.ndarray, num: int) -> np.ndarray:
+        """
+        Sample base level champions from each game's pool without replacement.
+
+        :param g: Indices of the games.
+        :param num: Number of champions to sample per game.
+        :return: Champion triples of shape (len(g), num, 3).
+        """
+        counts = self.__pool[g].reshape(g.size, -1)
+        if (counts.sum(1) < num).any():
+            raise Exception(f"Cannot sample {num} champions from a depleted pool")
+
+        uniforms = self._uniforms(g, num)
+        sample = np.zeros((g.size, num, 3), dtype=np.int16)
+        for n in range(num):
+            idx = SimpleTFTChampionPool.draw_from_counts(counts, uniforms[:, n])
+            sample[:, n, 0] = idx // self.__board_size
+            sample[:, n, 1] = idx % self.__board_size
+        self.__pool[g] = counts.reshape(g.size, self.__num_teams, self.__board_size)
+        return sample
+
+    def _uniforms(self, g: np.ndarray, num: int) -> np.ndarray:
+        """
+        Draw the next uniforms of the random stream of each game.
+
+        :param g: Indices of the games.
+        :param num: Number of uniforms per game.
+        :return: A float array of shape (len(g), num).
+        """
+        streams = self.__random_streams
+        return np.array([streams[k].uniforms(num) for k in g.tolist()]).reshape(len(g), num)
+
+    def combat(self, games: np.ndarray, rewards: np.ndarray):
+        """
+        Conduct combat between the live players of the selected games and assign rewards.
+
+        :param games: Boolean mask of the games entering combat.
+        :param rewards: The (num_games, num_players) rewards array to update.
+        """
+        alive = self.__hp > 0
+        self.__live[games] = alive[games]
+        num_live = alive.sum(1)
+        g = np.flatnonzero(games & (num_live > 1))
+        if not g.size:
+            return
+
+        live, num_live = alive[g], num_live[g]
+        powers = self.calculate_board_powers()[g]
+
+        # Shuffle the live players when more than two remain, drawing one uniform per live player
+        # like SimpleTFT.combat; dead players sort last
+        keys = np.broadcast_to(np.arange(self.__num_players, dtype=float), live.shape).copy()
+        for row in np.flatnonzero(num_live > 2).tolist():
+            keys[row, live[row]] = self.__random_streams[g[row]].uniforms(num_live[row])
+        order = np.argsort(np.where(live, keys, np.inf), axis=1, kind='stable')
+        rank = np.empty_like(order)
+        np.put_along_axis(rank, order, np.arange(self.__num_players)[None, :], axis=1)
+
+        # Pair consecutive players; an unpaired last player faces the first player
+        opponent_rank = rank ^ 1
+        opponent_rank = np.where(opponent_rank < num_live[:, None], opponent_rank, 0)
+        opponent = np.take_along_axis(order, opponent_rank, axis=1)
+        opponent_power = np.take_along_axis(powers, opponent, axis=1)
+
+        # Losses and draws both cost one hp
+        damaged = live & (powers <= opponent_power)
+        self.__hp[g] -= damaged
+        combat_results = np.where(damaged, -1, 1) * live
+
+        self.__live[g] = self.__hp[g] > 0
+
+        if self.__reward_structure in ('damage', 'mixed'):
+            rewards[g] += combat_results
+        if self.__reward_structure in ('game_placement', 'mixed'):
+            survivors = self.__live[g]
+            num_survivors = survivors.sum(1, keepdims=True)
+            loss_penalty = (num_survivors >= self.__num_players // 2) * -1
+            rewards[g] += live * np.where(survivors, num_survivors == 1, loss_penalty)
+
+    def post_combat(self, games: np.ndarray):
+        """
+        Perform post-combat actions for each player in the selected games,
+        including cleanup and adding gold.
+
+        :param games: Boolean mask of the games that finished combat.
+        """
+        for p in range(self.__num_players):
+            alive = self.__hp[:, p] > 0
+
+            g = np.flatnonzero(games & ~alive & ~self.__killed[:, p])
+            if g.size:
+                self._return_to_pool(g, self.__slots[g, p])
+                self.__slots[g, p] = -1
+                self.__killed[g, p] = True
+
+            g = np.flatnonzero(games & alive)
+            if g.size:
+                gold = self.__gold[g, p]
+                self.__gold[g, p] += self.__gold_per_round + np.minimum(gold // self.__interest_increment, 5) + 1
+                self._refresh_shops(g, p)
+
+    def calculate_power_rewards(self, rewards: np.ndarray):
+        """
+        Add the change in each player's board power to their rewards.
+
+        :param rewards: The (num_games, num_players) rewards array to update.
+        """
+        powers = self.calculate_board_powers()
+        rewards += powers - self.__player_power
+        self.__player_power = powers
+
+    def calculate_champion_powers(self) -> np.ndarray:
+        """
+        Calculate the power of every board champion.
+
+        :return: An integer array of shape (num_games, num_players, board_size).
+        """
+        return self.__board_power_cache.batch_champion_powers(self.__slots[:, :, :self.__board_size])
+
+    def calculate_board_powers(self) -> np.ndarray:
+        """
+        Calculate the total board power of every player.
+
+        :return: An integer array of shape (num_games, num_players).
+        """
+        return self.calculate_champion_powers().sum(-1)
+
+    def win_matrices(self) -> np.ndarray:
+        """
+        Compute the outcome of every player's current board against every other board of the same game.
+
+        :return: An int8 array of shape (num_games, num_players, num_players), as returned by SimpleTFT.win_matrix.
+        """
+        return win_matrix(self.calculate_board_powers())
+
+    def make_dones(self) -> np.ndarray:
+        """
+        Create an array indicating whether each player is done with the game.
+
+        :return: A boolean array of shape (num_games, num_players).
+        """
+        return (self.__live.sum(1, keepdims=True) <= 1) | (self.__hp <= 0)
+
+    def make_acting_players(self) -> np.ndarray:
+        """
+        Create an array indicating the active (live) players in each game.
+
+        :return: A boolean array of shape (num_games, num_players).
+        """
+        return self.__live.copy()
+
+    def make_action_masks(self) -> np.ndarray:
+        """
+        Generate action masks for each player in each game.
+
+        :return: An array of shape (num_games, num_players, action_space_size).
+        """
+        R = self.__roster_size
+        occupied = self.__slots[..., 0] >= 0
+        has_gold = self.__gold > 0
+        bench_full = occupied[..., self.__board_size:R].all(-1)
+
+        roster, shop = self.__slots[:, :, None, :R], self.__slots[:, :, R:, None]
+        has_match = (roster == shop).all(-1).any(-1)
+        can_buy = occupied[..., R:] & has_gold[..., None] & (~bench_full[..., None] | has_match)
+
+        available = np.concatenate([occupied[..., :R],
+                                    can_buy,
+                                    has_gold[..., None],
+                                    np.ones_like(has_gold)[..., None]], axis=-1)
+        available &= (self.__hp > 0)[..., None]
+        return self.__spec.make_action_masks(available)
+
+    def make_player_observations(self) -> np.ndarray:
+        """
+        Generate observations for each player in each game. Each player's own private
+        view comes first, followed by the public views of the other players in order.
+
+        :return: An array of shape (num_games, num_players) + observation_shape.
+        """
+        private = self._observe_players(public=False)
+        public = self._observe_players(public=True)
+        observations = np.empty((self.__num_games, self.__num_players) + self.__observation_shape)
+        observations[:, :, 0] = private
+        observations[:, :, 1:] = public[:, self.__others]
+        return observations
+
+    def _observe_players(self, public=True) -> np.ndarray:
+        """
+        Observe the state of every player.
+
+        :param public: Flag to determine if the observation is public or private.
+        :return: An array of shape (num_games, num_players) + observation_shape[1:].
+        """
+        T, B, L = self.__num_teams, self.__board_size, self.__max_champ_level + 1
+        slots = self.__slots
+        if public:
+            slots = slots[:, :, :self.__roster_size]
+
+        observation = np.zeros((self.__num_games, self.__num_players) + self.__observation_shape[1:])
+        champions = observation[:, :, :slots.shape[2]]
+        champions[..., :T] = slots[..., 0, None] == np.arange(T)
+        champions[..., T:T + B] = slots[..., 1, None] == np.arange(B)
+        champions[..., T + B:T + B + L] = slots[..., 2, None] == np.arange(L)
+        champion_powers = self.calculate_champion_powers()
+        champions[:, :, :B, T + B + L] = champion_powers / self.__max_champ_power
+
+        if not public:
+            observation[:, :, -1, 0] = np.clip(self.__gold / 30, 0, 1)
+        observation[:, :, -1, 1] = self.__hp / 10
+        observation[:, :, -1, 2] = (self.__actions_until_combat / (self.__actions_per_round - 1))[:, None]
+        observation[:, :, -1, 3] = champion_powers.sum(-1) / self.__max_board_power
+
+        observation[self.__hp <= 0] = 0
+        return observation
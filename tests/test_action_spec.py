@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+from simpletft.action_spec import (SimpleTFTActionSpec, IDLE, BOARD_TO_BOARD, BOARD_TO_BENCH, BENCH_TO_BOARD,
+                                   BENCH_TO_BENCH, SELL_FROM_BOARD, SELL_FROM_BENCH, PURCHASE, REFRESH)
+from simpletft.player import SimpleTFTPlayer
+import numpy as np
+import pytest
+
+SIZES = [(3, 2, 2), (3, 3, 5), (1, 1, 1), (5, 1, 3), (2, 4, 2), (7, 9, 6)]
+
+def expected_decode(action_from: int, action_to: int, board_size: int, bench_size: int, shop_size: int) -> tuple:
+    """
+    Decode an action the way SimpleTFTPlayer dispatched it from (action_from, action_to) before the tables existed.
+    """
+    roster_size = board_size + bench_size
+    if action_from < board_size:
+        if action_to < board_size:
+            return BOARD_TO_BOARD, action_from, action_to
+        if action_to < roster_size:
+            return BOARD_TO_BENCH, action_from, action_to - board_size
+        if action_to == roster_size:
+            return SELL_FROM_BOARD, action_from, 0
+    elif action_from < roster_size:
+        if action_to < board_size:
+            return BENCH_TO_BOARD, action_from - board_size, action_to
+        if action_to < roster_size:
+            return BENCH_TO_BENCH, action_from - board_size, action_to - board_size
+        if action_to == roster_size:
+            return SELL_FROM_BENCH, action_from - board_size, 0
+    elif action_from < roster_size + shop_size:
+        return PURCHASE, action_from - roster_size, 0
+    elif action_from == roster_size + shop_size:
+        return REFRESH, 0, 0
+    return IDLE, 0, 0
+
+def expected_mask(available: list, board_size: int, bench_size: int, shop_size: int) -> list:
+    """
+    Build a mask slot by slot: each occupied board slot enables its board_size + bench_size actions,
+    each occupied bench slot its board_size + 1 actions, then shop, refresh and idle enable one action each.
+    """
+    mask = []
+    for i, a in enumerate(available):
+        if i < board_size:
+            mask += [a] * (board_size + bench_size)
+        elif i < board_size + bench_size:
+            mask += [a] * (board_size + 1)
+        else:
+            mask.append(a)
+    return mask
+
+@pytest.mark.parametrize('sizes', SIZES)
+def test_tables_match_index_mapping(sizes):
+    spec = SimpleTFTActionSpec.get(*sizes)
+    A = SimpleTFTPlayer.calculate_action_space_size(*sizes)
+    assert spec.action_space_size == A
+    assert spec.num_fragments == sum(sizes) + 2
+    assert SimpleTFTActionSpec.get(*sizes) is spec
+
+    for a in range(A):
+        action_from, action_to = SimpleTFTPlayer.map_action_index_to_from_to(a, *sizes)
+        assert (spec.action_from[a], spec.action_to[a]) == (action_from, action_to)
+        assert spec.decode(a) == expected_decode(action_from, action_to, *sizes)
+        assert spec.kind[a] == spec.decode(a)[0]
+    assert spec.decode(A - 1)[0] == IDLE
+
+    # Indices beyond the action space decode as idle
+    for a in (A, A + 1, A * A - 1):
+        assert spec.decode(a)[0] == IDLE
+
+    for table in (spec.kind, spec.action_from, spec.action_to):
+        assert not table.flags.writeable
+
+@pytest.mark.parametrize('sizes', SIZES)
+def test_masks_match_slot_by_slot_construction(sizes):
+    spec = SimpleTFTActionSpec.get(*sizes)
+    rng = np.random.default_rng(sum(sizes))
+    available = rng.random((4, 3, spec.num_fragments)) < 0.5
+
+    masks = spec.make_action_masks(available)
+    assert masks.shape == (4, 3, spec.action_space_size) and masks.dtype == np.float64
+    for index in np.ndindex(available.shape[:-1]):
+        expected = expected_mask(available[index].tolist(), *sizes)
+        np.testing.assert_array_equal(masks[index], expected)
+        np.testing.assert_array_equal(spec.make_action_masks(available[index].tolist()), expected)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+from simpletft.battle_log import SimpleTFTBattleLogReader
+from simpletft.tft import SimpleTFT
+import numpy as np
+import pytest
+
+CONFIG = {'num_players': 5, 'num_teams': 10, 'seed': 4}
+
+def play_logged(config: dict, log_file_path: str, num_steps: int = 400):
+    env = SimpleTFT(config)
+    rng = np.random.default_rng(0)
+    _, _, masks = env.reset(log_file_path)
+    for _ in range(num_steps):
+        action = {p: int(rng.choice(np.flatnonzero(mask))) if mask.any() else 0 for p, mask in masks.items()}
+        _, _, _, dones, masks = env.step(action)
+        if all(dones.values()):
+            _, _, masks = env.reset()
+    env.close()
+
+def test_binary_log_renders_like_text_log(tmp_path):
+    text_path, binary_path = str(tmp_path / "battle.txt"), str(tmp_path / "battle.bin")
+    play_logged(CONFIG, text_path)
+    play_logged(dict(CONFIG, log_format='binary'), binary_path)
+
+    reader = SimpleTFTBattleLogReader(binary_path)
+    assert len(reader) and len(reader.games()) > 1
+    assert reader.records()['ghost'].any()
+    rendered = ''.join(reader.render(record) + "\n" for record in reader.iter_records(chunk_size=7))
+    with open(text_path) as file:
+        assert rendered == file.read()
+
+    # Filtering by game keeps the records of that game, in order
+    game = int(reader.games()[1])
+    records = reader.records(game)
+    assert len(records) == sum(1 for _ in reader.iter_records(game=game))
+    assert (records['game'] == game).all()
+
+def test_binary_log_rejects_other_sizes(tmp_path):
+    binary_path = str(tmp_path / "battle.bin")
+    play_logged(dict(CONFIG, log_format='binary'), binary_path, num_steps=20)
+    env = SimpleTFT({'log_format': 'binary', 'bench_size': 3, 'num_teams': 8})
+    with pytest.raises(ValueError):
+        env.reset(binary_path)
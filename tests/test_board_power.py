@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+from simpletft.board_power import SimpleTFTBoardPowerCache
+from simpletft.player import SimpleTFTPlayer
+from simpletft.tft import SimpleTFT
+import numpy as np
+import pytest
+
+def random_boards(rng, num, board_size=3, num_teams=3, num_levels=3):
+    boards = np.stack([rng.integers(num_teams, size=(num, board_size)),
+                       rng.integers(board_size, size=(num, board_size)),
+                       rng.integers(num_levels, size=(num, board_size))], axis=-1).astype(np.int16)
+    boards[rng.random((num, board_size)) < 0.3] = -1
+    return boards
+
+@pytest.mark.parametrize('precompute', [False, True])
+def test_champion_powers_match_direct_computation(precompute):
+    cache = SimpleTFTBoardPowerCache(3, 3, 2, maxsize=8, precompute=precompute)
+    boards = random_boards(np.random.default_rng(0), 200)
+    expected = SimpleTFTPlayer.calculate_champion_powers(boards)
+
+    for board, powers in zip(boards, expected):
+        result = cache.champion_powers(board)
+        assert result.dtype == expected.dtype
+        assert not result.flags.writeable
+        np.testing.assert_array_equal(result, powers)
+
+    batch = cache.batch_champion_powers(boards)
+    assert batch.dtype == expected.dtype
+    np.testing.assert_array_equal(batch, expected)
+
+def test_table_and_cache_agree():
+    boards = random_boards(np.random.default_rng(1), 100)
+    cached = SimpleTFTBoardPowerCache(3, 3, 2)
+    table = SimpleTFTBoardPowerCache(3, 3, 2, precompute=True)
+    for board in boards:
+        a, b = cached.champion_powers(board), table.champion_powers(board)
+        assert a.dtype == b.dtype
+        assert int(a.sum()) == int(b.sum())
+
+def test_least_recently_used_boards_are_evicted():
+    cache = SimpleTFTBoardPowerCache(3, 3, 2, maxsize=2)
+    a, b, c = random_boards(np.random.default_rng(2), 3)
+    cache.champion_powers(a)
+    cache.champion_powers(b)
+    cache.champion_powers(a)  # a becomes the most recently used board
+    cache.champion_powers(c)  # evicts b
+    assert cache.stats() == {'hits': 1, 'misses': 3, 'size': 2, 'maxsize': 2, 'table': False}
+    cache.champion_powers(a, a.tobytes())
+    cache.champion_powers(b)
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 4
+
+    cache.clear()
+    assert cache.stats() == {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 2, 'table': False}
+
+    uncached = SimpleTFTBoardPowerCache(3, 3, 2, maxsize=0)
+    uncached.champion_powers(a)
+    uncached.champion_powers(a)
+    assert uncached.stats()['misses'] == 2 and uncached.stats()['size'] == 0
+
+def test_invalid_caches_are_rejected():
+    with pytest.raises(ValueError):
+        SimpleTFTBoardPowerCache(3, 3, 2, maxsize=-1)
+    with pytest.raises(ValueError):
+        SimpleTFTBoardPowerCache(8, 16, 2, precompute=True)
+
+@pytest.mark.parametrize('cache_config', [{'board_power_cache_size': 0}, {'board_power_cache_size': 3},
+                                          {'board_power_table': True}])
+def test_games_do_not_depend_on_the_cache(cache_config):
+    config = {'num_players': 4, 'num_teams': 8, 'reward_structure': 'power', 'seed': 6}
+    env, reference = SimpleTFT(dict(config, **cache_config)), SimpleTFT(config)
+    rng = np.random.default_rng(0)
+    env.reset()
+    _, _, masks = reference.reset()
+    for _ in range(300):
+        action = {p: int(rng.choice(np.flatnonzero(mask))) if mask.any() else len(mask) - 1
+                  for p, mask in masks.items()}
+        observations, rewards, _, dones, _ = env.step(action)
+        expected, expected_rewards, _, _, masks = reference.step(action)
+        assert rewards == expected_rewards
+        for p in observations:
+            np.testing.assert_array_equal(observations[p], expected[p])
+        if all(dones.values()):
+            env.reset()
+            _, _, masks = reference.reset()
+    stats = env.board_power_cache.stats()
+    assert stats['size'] <= stats['maxsize'] and stats['hits'] + stats['misses'] > 0
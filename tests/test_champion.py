@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from simpletft.benchmark import benchmark_champions
+from simpletft.champion import SimpleTFTChampion
+from simpletft.champion_pool import SimpleTFTChampionPool
+from simpletft.player import SimpleTFTPlayer
+from simpletft.random_stream import SimpleTFTRandomStream
+import numpy as np
+import pytest
+
+@pytest.mark.parametrize('power, error', [(-1, ValueError), (1.0, TypeError), ('1', TypeError), (None, TypeError)])
+def test_set_power_is_validated_in_debug_mode(power, error):
+    champ = SimpleTFTChampion(1, 2, debug=True)
+    with pytest.raises(error):
+        champ.set_power(power)
+    assert champ.power == 0
+    champ.set_power(3)
+    assert champ.power == 3
+
+    # Outside debug mode powers are trusted
+    champ = SimpleTFTChampion(1, 2)
+    champ.set_power(power)
+    assert champ.power is power
+
+@pytest.mark.parametrize('debug', [True, False])
+def test_players_pass_debug_mode_to_champions(debug):
+    pool = SimpleTFTChampionPool(5, 4, 3, random_stream=SimpleTFTRandomStream(0))
+    player = SimpleTFTPlayer(pool, 3, 2, 3, debug=debug)
+    player.add_gold(1)
+    player.refresh_shop()
+    for champ in player.shop:
+        if debug:
+            with pytest.raises(ValueError):
+                champ.set_power(-1)
+        else:
+            champ.set_power(-1)
+            assert champ.power == -1
+
+@pytest.mark.parametrize('key', [(np.int64(1), 2, 0), (1, np.int16(2), 0), (1, 2, np.int64(0)),
+                                 (1.0, 2, 0), (1, 2.0, 0), (1, 2, -1), (1, 2, None)])
+def test_keys_are_validated_after_interning(key):
+    # The valid key is interned first, so invalid keys that compare equal to it hit the cache
+    champ = SimpleTFTChampion(1, 2, 0)
+    with pytest.raises(ValueError):
+        SimpleTFTChampion(*key)
+    with pytest.raises(ValueError):
+        SimpleTFTChampion.intern(key[1], key[0], key[2])
+    assert champ.key == (2, 1, 0)
+
+def test_equal_keys_are_shared():
+    a, b, c = SimpleTFTChampion(1, 2, 0), SimpleTFTChampion(1, 2, 0), SimpleTFTChampion(1, 2, 1)
+    assert a.key is b.key and a.match(b)
+    assert not a.match(c)
+    a.level_up()
+    assert a.key is c.key and a.match(c)
+
+def test_benchmark_compares_against_reference():
+    result = benchmark_champions(num=300)
+    assert result['champions'] == 300
+    measurements = ['construct_ns', 'set_power_ns', 'match_ns', 'bytes_per_champion']
+    for name in measurements:
+        assert result[name] > 0 and result['reference'][name] > 0
+        assert result['speedup'][name] == pytest.approx(result['reference'][name] / result[name])
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+from simpletft.champion_pool import SimpleTFTChampionPool
+from simpletft.random_stream import SimpleTFTRandomStream
+import numpy as np
+import pytest
+
+def reference_sample(counts: np.ndarray, uniforms: np.ndarray) -> list:
+    """
+    Draw champions one at a time with draw_from_counts, one cumulative sum per draw.
+    """
+    flat = counts.reshape(-1)
+    return [divmod(int(SimpleTFTChampionPool.draw_from_counts(flat, u)), counts.shape[1]) for u in uniforms]
+
+@pytest.mark.parametrize('num_teams, num_positions, champ_copies', [(8, 3, 5), (16, 8, 2), (2, 2, 1)])
+def test_sample_matches_draw_by_draw_reference(num_teams, num_positions, champ_copies):
+    rng = np.random.default_rng(num_teams)
+    pool = SimpleTFTChampionPool(champ_copies, num_teams, num_positions, random_stream=SimpleTFTRandomStream(0))
+    uniforms = SimpleTFTRandomStream(0)
+    counts = pool.get_state().copy()
+
+    while len(pool):
+        num = int(rng.integers(1, min(len(pool), 6) + 1))
+        sample = pool.sample_slots(num)
+        expected = reference_sample(counts, uniforms.uniforms(num))
+        assert sample.dtype == np.int16 and sample.shape == (num, 3)
+        assert [tuple(row) for row in sample[:, :2].tolist()] == expected
+        assert not sample[:, 2].any()
+        np.testing.assert_array_equal(pool.counts, counts)
+
+        # Return some champions, leveled ones as several base level copies
+        if rng.random() < 0.3:
+            returned = sample[:1].copy()
+            returned[0, 2] = rng.integers(2)
+            pool.add_slots(np.concatenate((returned, np.full((1, 3), -1, dtype=np.int16))))
+            counts[returned[0, 0], returned[0, 1]] += 1 << int(returned[0, 2])
+            np.testing.assert_array_equal(pool.counts, counts)
+
+def test_sample_from_a_too_small_pool_raises():
+    pool = SimpleTFTChampionPool(1, 2, 2, random_stream=SimpleTFTRandomStream(0))
+    pool.sample_slots(3)
+    with pytest.raises(Exception):
+        pool.sample_slots(2)
+    assert len(pool) == 1
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+from simpletft.player import SimpleTFTPlayer
+from simpletft.random_stream import SimpleTFTRandomStream, spawn_seeds
+from simpletft.tft import SimpleTFT
+from simpletft.vector_env import SimpleTFTVectorEnv
+import numpy as np
+import pytest
+
+def reference_combat(state, board_size: int, num_players: int, reward_structure: str) -> (np.ndarray, np.ndarray):
+    """
+    Resolve combat one matchup at a time: live players are shuffled and paired in order,
+    the loser of a pair and both players of a draw take one damage, and an unpaired last
+    player faces the first player in a ghost matchup where only the last player can take damage.
+
+    :return: Tuple of (hp after combat, rewards), in player order.
+    """
+    hp = np.array(state.hp)
+    rewards = np.zeros(num_players, dtype=np.int64)
+    live = [i for i in range(num_players) if hp[i] > 0]
+    if len(live) < 2:
+        return hp, rewards
+    if len(live) > 2:
+        stream = SimpleTFTRandomStream()
+        stream.set_state(state.random_state)
+        live = [live[i] for i in np.argsort(stream.uniforms(len(live)), kind='stable')]
+    powers = SimpleTFTPlayer.calculate_champion_powers(np.asarray(state.slots)[:, :board_size]).sum(-1)
+
+    results = {}
+    for a, b in zip(live[0:-1:2], live[1::2]):
+        if powers[a] == powers[b]:
+            results[a], results[b] = -1, -1
+        elif powers[a] > powers[b]:
+            results[a], results[b] = 1, -1
+        else:
+            results[a], results[b] = -1, 1
+    if len(live) % 2:
+        results[live[-1]] = -1 if powers[live[-1]] <= powers[live[0]] else 1
+    for p, result in results.items():
+        hp[p] -= result < 0
+
+    survivors = [p for p in range(num_players) if hp[p] > 0]
+    loss_penalty = -1 if len(survivors) >= num_players // 2 else 0
+    for p, result in results.items():
+        if reward_structure in ('damage', 'mixed'):
+            rewards[p] += result
+        if reward_structure in ('game_placement', 'mixed'):
+            if p not in survivors:
+                rewards[p] += loss_penalty
+            elif len(survivors) == 1:
+                rewards[p] += 1
+    return hp, rewards
+
+@pytest.mark.parametrize('num_players', [2, 3, 5, 8])
+@pytest.mark.parametrize('reward_structure', ['damage', 'game_placement', 'mixed'])
+def test_combat_matches_reference(num_players, reward_structure):
+    config = {'num_players': num_players, 'num_teams': 2 * num_players, 'reward_structure': reward_structure,
+              'seed': num_players}
+    env = SimpleTFT(config)
+    board_size = env.config['board_size']
+    player_ids = env.live_agents
+    rng = np.random.default_rng(0)
+    ghost_matchups = 0
+
+    _, _, masks = env.reset()
+    for _ in range(300):
+        # Resolve combat on a copy of every state, whether or not the round is over
+        state = env.get_state()
+        expected_hp, expected_rewards = reference_combat(state, board_size, num_players, reward_structure)
+        num_live = int((np.array(state.hp) > 0).sum())
+        ghost_matchups += num_live % 2 and num_live > 1
+        clone = env.clone()
+        rewards = clone.combat()
+        np.testing.assert_array_equal(clone.get_state().hp, expected_hp)
+        assert [rewards[p] for p in player_ids] == expected_rewards.tolist()
+        assert clone.live_agents == [p for p, hp in zip(player_ids, expected_hp) if hp > 0]
+
+        action = {p: int(rng.choice(np.flatnonzero(mask))) if mask.any() else len(mask) - 1
+                  for p, mask in masks.items()}
+        _, _, _, dones, masks = env.step(action)
+        if all(dones.values()):
+            _, _, masks = env.reset()
+
+    if num_players % 2:
+        assert ghost_matchups
+
+def pairwise_outcomes(state, config: dict) -> np.ndarray:
+    """
+    Fight every pair of boards of a state in a two player game, dead players fielding their empty boards.
+
+    :return: An array of shape (num_players, num_players) where entry (i, j) is -1 if player i takes damage
+             fighting player j, and +1 otherwise.
+    """
+    num_players = len(state.hp)
+    duel = SimpleTFT(dict(config, num_players=2))
+    duel.reset()
+    start = duel.get_state()
+    outcomes = np.zeros((num_players, num_players), dtype=np.int8)
+    for i in range(num_players):
+        for j in range(i + 1, num_players):
+            duel.set_state(start._replace(slots=np.asarray(state.slots)[[i, j]]))
+            duel.combat()
+            outcomes[i, j], outcomes[j, i] = np.where(np.array(duel.get_state().hp) < start.hp, -1, 1)
+    return outcomes
+
+def assert_win_matrix_matches_combat(matrix: np.ndarray, outcomes: np.ndarray):
+    # Draws damage both players, like losses
+    assert matrix.dtype == np.int8
+    np.testing.assert_array_equal(matrix, -matrix.T)
+    np.testing.assert_array_equal(np.diag(matrix), 0)
+    off_diagonal = ~np.eye(len(matrix), dtype=bool)
+    np.testing.assert_array_equal(np.where(matrix > 0, 1, -1)[off_diagonal], outcomes[off_diagonal])
+    np.testing.assert_array_equal((matrix == 0)[off_diagonal], (outcomes == outcomes.T)[off_diagonal])
+
+@pytest.mark.parametrize('num_players', [2, 3, 5])
+def test_win_matrix_matches_pairwise_combat(num_players):
+    config = {'num_players': num_players, 'num_teams': 2 * num_players, 'seed': num_players}
+    env = SimpleTFT(config)
+    board_size = env.config['board_size']
+    rng = np.random.default_rng(0)
+    boards, matrices = [], []
+    draws = 0
+
+    _, _, masks = env.reset()
+    for t in range(200):
+        state = env.get_state()
+        matrix = env.win_matrix()
+        if t % 4 == 0:
+            assert_win_matrix_matches_combat(matrix, pairwise_outcomes(state, config))
+        # The matrix is computed without fighting
+        np.testing.assert_equal(env.get_state(), state)
+        draws += int((matrix == 0).sum()) > num_players
+        boards.append(np.asarray(state.slots)[:, :board_size])
+        matrices.append(matrix)
+
+        action = {p: int(rng.choice(np.flatnonzero(mask))) if mask.any() else len(mask) - 1
+                  for p, mask in masks.items()}
+        _, _, _, dones, masks = env.step(action)
+        if all(dones.values()):
+            _, _, masks = env.reset()
+    assert draws
+
+    # Stacks of boards, here of many states, give the matrix of each state
+    boards = np.stack(boards).reshape((10, 20) + boards[0].shape)
+    np.testing.assert_array_equal(env.batch_win_matrix(boards), np.stack(matrices).reshape(10, 20, num_players, num_players))
+
+def test_vector_win_matrices_match_games():
+    config, num_games, seed = {'num_players': 3, 'num_teams': 6}, 3, 7
+    games = [SimpleTFT(dict(config, seed=s)) for s in spawn_seeds(seed, num_games)]
+    venv = SimpleTFTVectorEnv(dict(config, seed=seed), num_games)
+    player_ids = games[0].live_agents
+    rng = np.random.default_rng(0)
+
+    for game in games:
+        game.reset()
+    masks = venv.reset()[-1]
+    for t in range(100):
+        matrices = venv.win_matrices()
+        assert matrices.shape == (num_games, 3, 3) and matrices.dtype == np.int8
+        for k, game in enumerate(games):
+            np.testing.assert_array_equal(matrices[k], game.win_matrix())
+            if t % 10 == 0:
+                assert_win_matrix_matches_combat(matrices[k], pairwise_outcomes(game.get_state(), config))
+
+        actions = np.array([[int(rng.choice(np.flatnonzero(mask))) if mask.any() else len(mask) - 1
+                             for mask in game_masks] for game_masks in masks])
+        outputs = venv.step(actions)
+        for k, game in enumerate(games):
+            game.step(dict(zip(player_ids, actions[k].tolist())))
+        masks = outputs[-1]
+        finished = outputs[3].all(1)
+        if finished.any():
+            masks = venv.reset(finished)[-1]
+            for k in np.flatnonzero(finished):
+                games[k].reset()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from simpletft.log_writer import SimpleTFTLogWriter
+from simpletft.tft import SimpleTFT
+import numpy as np
+import os
+import pytest
+import time
+
+# Nothing is flushed by the background thread while a test runs
+CONFIG = {'num_players': 4, 'num_teams': 8, 'seed': 0, 'log_flush_size': 10 ** 6, 'log_flush_interval': 3600}
+
+def play_rounds(env: SimpleTFT, num_rounds: int, rng: np.random.Generator):
+    masks = env.make_action_masks()
+    for _ in range(num_rounds * env.config['actions_per_round']):
+        action = {p: int(rng.choice(np.flatnonzero(mask))) if mask.any() else len(mask) - 1
+                  for p, mask in masks.items()}
+        _, _, _, dones, masks = env.step(action)
+        if all(dones.values()):
+            break
+
+def test_logs_are_flushed_on_reset_and_close(tmp_path):
+    path = str(tmp_path / "battle.log")
+    env = SimpleTFT(CONFIG)
+    rng = np.random.default_rng(0)
+    env.reset(path)
+
+    play_rounds(env, 3, rng)
+    assert not os.path.exists(path) or not os.path.getsize(path)
+    env.reset()
+    size = os.path.getsize(path)
+    assert size
+
+    play_rounds(env, 3, rng)
+    assert os.path.getsize(path) == size
+    env.close()
+    assert os.path.getsize(path) > size
+
+def test_writer_flush_writes_in_order(tmp_path):
+    path = str(tmp_path / "entries.log")
+    writer = SimpleTFTLogWriter(path, flush_size=10 ** 6, flush_interval=3600)
+    writer.write("first")
+    writer.write("{} {}".format, "second", 2)
+    writer.write_lines(["third", "fourth"])
+    assert not os.path.exists(path)
+    writer.flush()
+    with open(path) as f:
+        assert f.read() == "first\nsecond 2\nthird\nfourth\n"
+    writer.write("fifth")
+    writer.close()
+    with open(path) as f:
+        assert f.read().endswith("fourth\nfifth\n")
+    with pytest.raises(ValueError):
+        writer.write("after close")
+
+def test_errors_are_raised_on_the_callers_thread(tmp_path):
+    path = str(tmp_path / "entries.log")
+
+    # A failure in the background thread surfaces at the next write
+    writer = SimpleTFTLogWriter(path, flush_size=1, flush_interval=3600)
+    writer.write(lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        for _ in range(500):
+            time.sleep(0.01)
+            writer.write("pending")
+    writer.write("kept")
+    writer.close()
+    with open(path) as f:
+        assert f.read().endswith("kept\n")
+
+    # A failure while flushing on the caller's thread is raised by flush, and by close
+    for finish in ('flush', 'close'):
+        writer = SimpleTFTLogWriter(path, flush_size=10 ** 6, flush_interval=3600)
+        writer.write(lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            getattr(writer, finish)()
+        writer.close()
+
+    # So is a file that cannot be opened
+    writer = SimpleTFTLogWriter(str(tmp_path / "missing" / "entries.log"), flush_size=10 ** 6, flush_interval=3600)
+    writer.write("lost")
+    with pytest.raises(OSError):
+        writer.close()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from simpletft.tft import SimpleTFT
+import numpy as np
+import pytest
+
+CONFIG = {'num_players': 4, 'num_teams': 8, 'seed': 5}
+
+def random_action(masks: dict, rng: np.random.Generator) -> dict:
+    return {p: int(rng.choice(np.flatnonzero(mask))) if mask.any() else len(mask) - 1 for p, mask in masks.items()}
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_supplied_buffer_is_written_in_place(dtype):
+    env = SimpleTFT(dict(CONFIG, observation_mode='buffer'))
+    reference = SimpleTFT(CONFIG)
+    player_ids = reference.live_agents
+    shape = (len(player_ids),) + env.observation_shape
+
+    # The buffer is a view into a larger array, whose other half must stay untouched
+    backing = np.full((2,) + shape, -1, dtype=dtype)
+    buffer = backing[1]
+    env.set_observation_buffer(buffer)
+    assert env.observation_buffer is buffer
+
+    rng = np.random.default_rng(0)
+    observations, _, _ = env.reset()
+    expected, _, masks = reference.reset()
+    old_contents = None
+    for step in range(200):
+        assert observations is buffer
+        np.testing.assert_allclose(buffer, np.stack([expected[p] for p in player_ids]), rtol=1e-6)
+        assert (backing[0] == -1).all()
+
+        if step == 100:
+            # A new buffer is filled completely on the next step, and the old one is left alone
+            old_contents = backing[1].copy()
+            buffer = np.zeros(shape, dtype=dtype)
+            env.set_observation_buffer(buffer)
+        if old_contents is not None:
+            np.testing.assert_array_equal(backing[1], old_contents)
+
+        action = random_action(masks, rng)
+        observations, _, _, dones, _ = env.step(action)
+        expected, _, _, _, masks = reference.step(action)
+        if all(dones.values()):
+            observations, _, _ = env.reset()
+            expected, _, masks = reference.reset()
+
+def test_unsuitable_buffers_are_rejected():
+    env = SimpleTFT(dict(CONFIG, observation_mode='buffer'))
+    shape = (CONFIG['num_players'],) + env.observation_shape
+    read_only = np.zeros(shape)
+    read_only.flags.writeable = False
+    for buffer in (np.zeros(shape[1:]), np.zeros(shape, dtype=np.int64), read_only, [[0.0]]):
+        with pytest.raises(ValueError):
+            env.set_observation_buffer(buffer)
+    with pytest.raises(ValueError):
+        SimpleTFT(CONFIG).set_observation_buffer(np.zeros(shape))
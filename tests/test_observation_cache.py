@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from simpletft.tft import SimpleTFT
+import numpy as np
+
+CONFIG = {'num_players': 4, 'num_teams': 8, 'seed': 3}
+
+def changed_players(state, other) -> int:
+    """
+    Count the players whose slots, gold or hp differ between two states.
+    """
+    return sum(not np.array_equal(state.slots[i], other.slots[i]) or state.gold[i] != other.gold[i]
+               or state.hp[i] != other.hp[i] for i in range(len(state.hp)))
+
+def test_only_changed_players_are_rebuilt():
+    env = SimpleTFT(CONFIG)
+    player_ids = env.live_agents
+    idle = env.action_space_size() - 1
+    rng = np.random.default_rng(0)
+
+    _, _, masks = env.reset()
+    assert env.observation_rebuilds == 2 * len(player_ids)
+
+    for _ in range(300):
+        # A random subset of players acts, the others stay idle
+        acting = [p for p in player_ids if masks[p].any() and rng.random() < 0.5]
+        action = {p: int(rng.choice(np.flatnonzero(masks[p]))) if p in acting else idle for p in player_ids}
+        before = env.get_state()
+        observations, _, _, dones, masks = env.step(action)
+        after = env.get_state()
+
+        rebuilds = env.observation_rebuilds
+        assert rebuilds == env.stats()['observation_rebuilds']
+        assert rebuilds % 2 == 0
+        assert rebuilds >= 2 * changed_players(before, after)
+        if after.actions_until_combat != env.config['actions_per_round'] - 1:
+            assert rebuilds <= 2 * len(acting)
+
+        # Cached views, with the round timer refreshed in place, match views built from scratch
+        fresh = SimpleTFT(CONFIG)
+        fresh.set_state(after)
+        expected = fresh.make_player_observations()
+        for p in player_ids:
+            np.testing.assert_array_equal(observations[p], expected[p])
+
+        if all(dones.values()):
+            _, _, masks = env.reset()
+            assert env.observation_rebuilds == 2 * len(player_ids)
+
+def test_idle_steps_rebuild_nothing():
+    env = SimpleTFT(CONFIG)
+    idle = env.action_space_size() - 1
+    env.reset()
+    env.make_player_observations()
+    for _ in range(env.config['actions_per_round'] - 1):
+        env.step(dict.fromkeys(env.live_agents, idle))
+        assert env.observation_rebuilds == 0
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+from simpletft.tft import SimpleTFT, gather_observations
+import numpy as np
+import pytest
+
+CONFIGS = [{'num_players': 4, 'num_teams': 8, 'reward_structure': 'power'},
+           {'num_players': 3, 'num_teams': 6, 'bench_size': 1, 'shop_size': 3},
+           {'num_players': 8, 'num_teams': 16, 'reward_structure': 'mixed'}]
+
+def as_tensor(observations, player_ids: list) -> np.ndarray:
+    """
+    Stack the observations of any observation mode into the 'buffer' tensor.
+    """
+    if isinstance(observations, dict):
+        return np.stack([observations[p] for p in player_ids])
+    if isinstance(observations, np.ndarray):
+        return observations.copy()
+    return gather_observations(observations)
+
+@pytest.mark.parametrize('config', CONFIGS)
+def test_observation_modes_match_dict_mode(config):
+    envs = {mode: SimpleTFT(dict(config, seed=2, observation_mode=mode)) for mode in ('dict', 'buffer', 'shared')}
+    rng = np.random.default_rng(0)
+    player_ids = envs['dict'].live_agents
+
+    outputs = {mode: env.reset() for mode, env in envs.items()}
+    for _ in range(300):
+        expected = as_tensor(outputs['dict'][0], player_ids)
+        for mode in ('buffer', 'shared'):
+            np.testing.assert_array_equal(as_tensor(outputs[mode][0], player_ids), expected)
+
+        masks = outputs['dict'][-1]
+        action = {p: int(rng.choice(np.flatnonzero(mask))) if mask.any() else len(mask) - 1
+                  for p, mask in masks.items()}
+        outputs = {mode: env.step(action) for mode, env in envs.items()}
+        if all(outputs['dict'][3].values()):
+            outputs = {mode: env.reset() for mode, env in envs.items()}
+
+def test_shared_observation_index_selects_views():
+    env = SimpleTFT({'num_players': 4, 'num_teams': 8, 'seed': 0, 'observation_mode': 'shared'})
+    shared, _, _ = env.reset()
+    observations = gather_observations(shared)
+    for observer in range(4):
+        np.testing.assert_array_equal(observations[observer, 0], shared.private[observer])
+        for row in range(1, 4):
+            np.testing.assert_array_equal(observations[observer, row], shared.public[shared.index[observer, row]])
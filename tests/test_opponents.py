@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from simpletft.opponents import SimpleTFTOpponentEnv
+from simpletft.vector_env import SimpleTFTVectorEnv
+import numpy as np
+import pytest
+
+CONFIG = {'num_players': 4, 'num_teams': 8, 'reward_structure': 'mixed', 'seed': 9}
+
+def seat_policy(observation: np.ndarray, mask: np.ndarray) -> int:
+    """
+    A deterministic policy for one seat, picking a valid action from the observation.
+    """
+    valid = np.flatnonzero(mask)
+    return int(valid[int(observation.sum() * 1000) % len(valid)])
+
+def batched_policy(observations: np.ndarray, masks: np.ndarray) -> np.ndarray:
+    return np.array([seat_policy(observation, mask) for observation, mask in zip(observations, masks)])
+
+@pytest.mark.parametrize('opponent_seats', [[1, 2, 3], [0, 2]])
+def test_wrapper_matches_seat_by_seat_actions(opponent_seats):
+    env = SimpleTFTOpponentEnv(SimpleTFTVectorEnv(CONFIG, 3), batched_policy, opponent_seats)
+    reference = SimpleTFTVectorEnv(CONFIG, 3)
+    learner = env.learner_seats
+    rng = np.random.default_rng(0)
+
+    outputs = env.reset()
+    expected = reference.reset()
+    for output, expected_output in zip(outputs, expected):
+        np.testing.assert_array_equal(output, expected_output[:, learner])
+
+    for step in range(1, 200):
+        masks = outputs[-1]
+        actions = np.array([[rng.choice(np.flatnonzero(mask)) if mask.any() else 0 for mask in game_masks]
+                            for game_masks in masks])
+        all_actions = np.zeros((3, 4), dtype=np.int64)
+        all_actions[:, learner] = actions
+        observations, reference_masks = expected[0], expected[-1]
+        for k in range(3):
+            for p in opponent_seats:
+                if reference_masks[k, p].any():
+                    all_actions[k, p] = seat_policy(observations[k, p], reference_masks[k, p])
+
+        outputs = env.step(actions)
+        expected = reference.step(all_actions)
+        for output, expected_output in zip(outputs, expected):
+            np.testing.assert_array_equal(output, expected_output[:, learner])
+        # One batched call per step while any opponent can act
+        assert env.policy_calls == step
+
+        finished = expected[3].all(1)
+        if finished.any():
+            break
+
+def test_invalid_seats_are_rejected():
+    with pytest.raises(ValueError):
+        SimpleTFTOpponentEnv(SimpleTFTVectorEnv(CONFIG, 1), batched_policy, [0, 1, 2, 3])
+    with pytest.raises(ValueError):
+        SimpleTFTOpponentEnv(SimpleTFTVectorEnv(CONFIG, 1), batched_policy, [1, 1])
+    with pytest.raises(ValueError):
+        SimpleTFTOpponentEnv(SimpleTFTVectorEnv(CONFIG, 1), batched_policy, [4])
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+from simpletft.player import SimpleTFTPlayer
+import numpy as np
+import pytest
+
+NUM_TEAMS = 3
+
+class ScriptedPool(object):
+    """
+    A champion pool handing out a seeded script of base level champions and recording what is returned to it.
+    """
+    def __init__(self, seed: int, num_positions: int):
+        self.rng = np.random.default_rng(seed)
+        self.num_positions = num_positions
+        self.returned = []
+
+    def sample_slots(self, num: int) -> np.ndarray:
+        rows = [(self.rng.integers(NUM_TEAMS), self.rng.integers(self.num_positions), 0) for _ in range(num)]
+        return np.array(rows, dtype=np.int16)
+
+    def add_slots(self, slots: np.ndarray):
+        self.returned += [tuple(row) for row in slots.tolist() if row[0] >= 0]
+
+class ReferencePlayer(object):
+    """
+    The list based player the slot array replaced: board, bench and shop hold (team, position, level)
+    tuples or None, and every rule is applied by scanning the lists.
+    """
+    def __init__(self, pool: ScriptedPool, board_size: int, bench_size: int, shop_size: int):
+        self.pool = pool
+        self.board_size, self.bench_size, self.shop_size = board_size, bench_size, shop_size
+        self.roster = [None] * (board_size + bench_size)
+        self.shop = [None] * shop_size
+        self.gold = 0
+        self.hp = 10
+
+    def slots(self) -> list:
+        return [list(champ) if champ else [-1, -1, -1] for champ in self.roster + self.shop]
+
+    def champion_powers(self) -> list:
+        board = self.roster[:self.board_size]
+        teams = {}
+        for champ in board:
+            if champ:
+                teams.setdefault(champ[0], set()).add(champ[1])
+        return [champ[2] + 1 + (i == champ[1]) + (len(teams[champ[0]]) > 1) if champ else 0
+                for i, champ in enumerate(board)]
+
+    def mask(self) -> list:
+        mask = []
+        if self.hp <= 0:
+            return [0] * SimpleTFTPlayer.calculate_action_space_size(self.board_size, self.bench_size, self.shop_size)
+        for champ in self.roster[:self.board_size]:
+            mask += [int(champ is not None)] * (self.board_size + self.bench_size)
+        for champ in self.roster[self.board_size:]:
+            mask += [int(champ is not None)] * (self.board_size + 1)
+        bench_full = all(self.roster[self.board_size:])
+        for champ in self.shop:
+            mask.append(int(champ is not None and self.gold > 0 and (not bench_full or champ in self.roster)))
+        return mask + [int(self.gold > 0), 1]
+
+    def add(self, champ: tuple) -> bool:
+        if champ in self.roster:
+            i = self.roster.index(champ)
+            self.roster[i] = champ[:2] + (champ[2] + 1,)
+            self.find_matches()
+            return True
+        for i in range(self.board_size, len(self.roster)):
+            if self.roster[i] is None:
+                self.roster[i] = champ
+                return True
+        return False
+
+    def find_matches(self):
+        for i, champ in enumerate(self.roster):
+            if champ and champ in self.roster[i + 1:]:
+                self.roster[self.roster.index(champ, i + 1)] = None
+                self.roster[i] = champ[:2] + (champ[2] + 1,)
+                return self.find_matches()
+
+    def refresh(self):
+        self.return_to_pool(self.shop)
+        self.shop = [tuple(row) for row in self.pool.sample_slots(self.shop_size).tolist()]
+        self.gold -= 1
+
+    def return_to_pool(self, champs: list):
+        self.pool.returned += [champ for champ in champs if champ]
+        champs[:] = [None] * len(champs)
+
+    def sell(self, i: int):
+        if self.roster[i]:
+            self.gold += 2 ** self.roster[i][2]
+            self.pool.returned.append(self.roster[i])
+            self.roster[i] = None
+
+    def take_action(self, action: int):
+        if self.hp <= 0:
+            return
+        B, N, S = self.board_size, self.bench_size, self.shop_size
+        action_from, action_to = SimpleTFTPlayer.map_action_index_to_from_to(action, B, N, S)
+        if action_from < B + N:
+            if action_to < B + N:
+                self.roster[action_from], self.roster[action_to] = self.roster[action_to], self.roster[action_from]
+            elif action_to == B + N:
+                self.sell(action_from)
+        elif action_from < B + N + S:
+            shop_from = action_from - B - N
+            if self.add(self.shop[shop_from]):
+                self.gold -= 1
+                self.shop[shop_from] = None
+        elif action_from == B + N + S:
+            self.refresh()
+
+def assert_players_match(player: SimpleTFTPlayer, reference: ReferencePlayer, pool: ScriptedPool,
+                         reference_pool: ScriptedPool):
+    np.testing.assert_array_equal(player.slots, reference.slots())
+    np.testing.assert_array_equal(player.champion_powers, reference.champion_powers())
+    assert player.calculate_board_power() == sum(reference.champion_powers())
+    np.testing.assert_array_equal(player.make_action_mask(), reference.mask())
+    assert (player.gold, player.hp) == (reference.gold, reference.hp)
+    assert pool.returned == reference_pool.returned
+
+@pytest.mark.parametrize('sizes', [(3, 3, 3), (4, 2, 5), (2, 4, 2), (5, 1, 1)])
+@pytest.mark.parametrize('seed', [0, 1])
+def test_player_matches_reference(sizes, seed):
+    pool, reference_pool = ScriptedPool(seed, sizes[0]), ScriptedPool(seed, sizes[0])
+    player = SimpleTFTPlayer(pool, *sizes)
+    reference = ReferencePlayer(reference_pool, *sizes)
+    rng = np.random.default_rng(seed)
+
+    champ = pool.sample_slots(1)[0]
+    assert player.add_slot(champ) and reference.add(tuple(reference_pool.sample_slots(1)[0].tolist()))
+    player.add_gold(4)
+    reference.gold += 4
+    player.refresh_shop()
+    reference.refresh()
+    assert_players_match(player, reference, pool, reference_pool)
+
+    for step in range(400):
+        valid = np.flatnonzero(reference.mask())
+        action = int(rng.choice(valid))
+        player.take_action(action)
+        reference.take_action(action)
+        if step % 25 == 0:
+            player.add_gold(3)
+            reference.gold += 3
+        assert_players_match(player, reference, pool, reference_pool)
+
+    # Dying returns board, bench and shop to the pool and leaves no valid action
+    player.take_damage(10)
+    player.death_cleanup()
+    reference.hp = 0
+    reference.return_to_pool(reference.roster)
+    reference.return_to_pool(reference.shop)
+    assert_players_match(player, reference, pool, reference_pool)
+
+@pytest.mark.parametrize('sizes', [(3, 3, 3), (4, 2, 5), (2, 4, 2), (5, 1, 1)])
+def test_merge_index_matches_brute_force(sizes):
+    board_size, bench_size, shop_size = sizes
+    roster_size = board_size + bench_size
+    pool, reference_pool = ScriptedPool(0, board_size), ScriptedPool(0, board_size)
+    player = SimpleTFTPlayer(pool, *sizes)
+    reference = ReferencePlayer(reference_pool, *sizes)
+    rng = np.random.default_rng(sum(sizes))
+
+    def random_champ() -> tuple:
+        # Few distinct champions, at several levels, so most additions merge and merges cascade
+        return int(rng.integers(2)), int(rng.integers(2)), int(rng.integers(3))
+
+    for _ in range(300):
+        # Start from an arbitrary roster, duplicates included, which the index is rebuilt from
+        roster = [random_champ() if rng.random() < 0.7 else None for _ in range(roster_size)]
+        shop = [random_champ() if rng.random() < 0.7 else None for _ in range(shop_size)]
+        slots = np.array([champ or (-1, -1, -1) for champ in roster + shop], dtype=np.int16)
+        player.set_state((slots, 0, 10, False))
+        reference.roster, reference.shop = roster, shop
+
+        assert player._shop_matches() == [champ is not None and champ in roster for champ in shop]
+        player.find_matches()
+        reference.find_matches()
+        np.testing.assert_array_equal(player.slots, reference.slots())
+
+        for _ in range(3):
+            champ = random_champ()
+            assert player.add_slot(np.array(champ, dtype=np.int16)) == reference.add(champ)
+            np.testing.assert_array_equal(player.slots, reference.slots())
+            assert player._shop_matches() == [c is not None and c in reference.roster for c in reference.shop]
+
+        # Moves and sales keep the index in step with the slots
+        i, j = (int(x) for x in rng.integers(roster_size, size=2))
+        player._swap(i, j)
+        reference.roster[i], reference.roster[j] = reference.roster[j], reference.roster[i]
+        if i < board_size:
+            player.sell_from_board(i)
+        else:
+            player.sell_from_bench(i - board_size)
+        reference.sell(i)
+        np.testing.assert_array_equal(player.slots, reference.slots())
+        champ = random_champ()
+        assert player.add_slot(np.array(champ, dtype=np.int16)) == reference.add(champ)
+        np.testing.assert_array_equal(player.slots, reference.slots())
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from simpletft.profiler import SimpleTFTProfiler
+from simpletft.tft import SimpleTFT
+import numpy as np
+import time
+
+def play(env: SimpleTFT, num_steps: int, rng: np.random.Generator):
+    masks = env.make_action_masks()
+    for _ in range(num_steps):
+        action = {p: int(rng.choice(np.flatnonzero(mask))) if mask.any() else len(mask) - 1
+                  for p, mask in masks.items()}
+        _, _, _, dones, masks = env.step(action)
+        if all(dones.values()):
+            _, _, masks = env.reset()
+
+def test_stats_are_recorded_after_clear(tmp_path):
+    env = SimpleTFT({'num_players': 4, 'num_teams': 8, 'seed': 0, 'profile': True})
+    rng = np.random.default_rng(0)
+    env.reset(str(tmp_path / "battle.log"))
+    play(env, 50, rng)
+    assert env.stats()['calls']['calculate_board_power']
+
+    env.profiler.clear()
+    assert env.stats()['phases'] == {} and env.stats()['calls'] == {}
+    play(env, 50, rng)
+    stats = env.stats()
+    assert stats['calls']['calculate_board_power'] > 0
+    assert stats['phases']['take_action']['calls'] == 50
+    for phase in ('combat', 'observations', 'masks', 'logging'):
+        assert stats['phases'][phase]['calls'] > 0
+    env.close()
+
+class Nested(object):
+    def outer(self):
+        self.inner()
+
+    def inner(self):
+        time.sleep(0.05)
+
+def test_nested_time_is_only_recorded_in_the_inner_phase():
+    profiler = SimpleTFTProfiler()
+    obj = Nested()
+    profiler.time_method(obj, 'inner')
+    profiler.time_method(obj, 'outer')
+    start = time.perf_counter()
+    obj.outer()
+    elapsed = time.perf_counter() - start
+
+    phases = profiler.stats()['phases']
+    assert phases['inner']['total_s'] >= 0.05
+    assert phases['outer']['total_s'] < 0.01
+    assert phases['inner']['total_s'] + phases['outer']['total_s'] <= elapsed
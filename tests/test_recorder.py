@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+from simpletft.recorder import SimpleTFTTrajectoryRecorder, SimpleTFTTrajectoryLoader
+from simpletft.tft import SimpleTFT
+import numpy as np
+import pytest
+
+CONFIG = {'num_players': 4, 'num_teams': 8, 'reward_structure': 'mixed', 'seed': 0}
+
+def play(env: SimpleTFT, num_steps: int, rng: np.random.Generator, record):
+    """
+    Play random valid actions, passing each transition to record and keeping a copy of it.
+    """
+    transitions = []
+    observations, _, masks = env.reset()
+    for _ in range(num_steps):
+        actions = {p: int(rng.choice(np.flatnonzero(mask))) if mask.any() else len(mask) - 1
+                   for p, mask in masks.items()}
+        next_observations, rewards, _, dones, next_masks = env.step(actions)
+        record(observations, actions, rewards, masks, dones)
+        for p in observations:
+            transitions.append((observations[p], actions[p], rewards[p], masks[p], dones[p]))
+        observations, masks = next_observations, next_masks
+        if all(dones.values()):
+            observations, _, masks = env.reset()
+    return transitions
+
+def assert_buffer_holds(directory: str, transitions: list, capacity: int):
+    """
+    Check that the buffer holds the last capacity transitions, each in its ring position.
+    """
+    loader = SimpleTFTTrajectoryLoader(directory)
+    assert len(loader) == min(len(transitions), capacity)
+    for t in range(max(len(transitions) - capacity, 0), len(transitions)):
+        row = loader.get(np.array([t % capacity]))
+        observation, action, reward, mask, done = transitions[t]
+        np.testing.assert_allclose(row['observations'][0], observation, rtol=1e-6)
+        assert row['actions'][0] == action
+        assert row['rewards'][0] == reward
+        np.testing.assert_array_equal(row['masks'][0], mask.astype(bool))
+        assert row['dones'][0] == done
+
+@pytest.mark.parametrize('capacity', [1000, 150])
+def test_resume_continues_recording(tmp_path, capacity):
+    directory = str(tmp_path / "trajectories")
+    env = SimpleTFT(CONFIG)
+    rng = np.random.default_rng(0)
+
+    with SimpleTFTTrajectoryRecorder.for_env(env, directory, capacity) as recorder:
+        transitions = play(env, 30, rng, recorder.record)
+    assert_buffer_holds(directory, transitions, capacity)
+
+    with SimpleTFTTrajectoryRecorder.for_env(env, directory, capacity, resume=True) as recorder:
+        assert len(recorder) == min(len(transitions), capacity)
+        transitions += play(env, 30, rng, recorder.record)
+    assert_buffer_holds(directory, transitions, capacity)
+
+def test_resume_rejects_a_different_schema(tmp_path):
+    directory = str(tmp_path / "trajectories")
+    env = SimpleTFT(CONFIG)
+    SimpleTFTTrajectoryRecorder.for_env(env, directory, 100).close()
+    with pytest.raises(ValueError):
+        SimpleTFTTrajectoryRecorder.for_env(env, directory, 200, resume=True)
+
+def test_loader_samples_recorded_rows(tmp_path):
+    directory = str(tmp_path / "trajectories")
+    env = SimpleTFT(CONFIG)
+    with SimpleTFTTrajectoryRecorder.for_env(env, directory, 500) as recorder:
+        play(env, 20, np.random.default_rng(0), recorder.record)
+    loader = SimpleTFTTrajectoryLoader(directory)
+    batch = loader.sample(64, np.random.default_rng(1))
+    assert batch['observations'].shape == (64,) + env.observation_shape
+    assert batch['masks'].shape == (64, env.action_space_size())
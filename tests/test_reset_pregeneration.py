@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from simpletft.tft import SimpleTFT
+import numpy as np
+import os
+import threading
+
+CONFIG = {'num_players': 4, 'num_teams': 8, 'reward_structure': 'power', 'reset_pregeneration': 4}
+
+def pregenerator_threads() -> list:
+    return [t for t in threading.enumerate() if t.name == "SimpleTFTResetPregenerator"]
+
+def initial_states(env: SimpleTFT, num_games: int, log_dir: str = None) -> list:
+    states = []
+    for i in range(num_games):
+        env.reset(os.path.join(log_dir, f"{i}.txt") if log_dir else "")
+        states.append(env.get_state())
+    return states
+
+def assert_same_states(states, other_states):
+    assert len(states) == len(other_states)
+    for state, other in zip(states, other_states):
+        np.testing.assert_array_equal(state.pool, other.pool)
+        np.testing.assert_array_equal(state.slots, other.slots)
+        np.testing.assert_array_equal(state.gold, other.gold)
+
+def test_log_switch_keeps_pregeneration_running(tmp_path):
+    env = SimpleTFT(dict(CONFIG, seed=0))
+    env.reset(str(tmp_path / "first.txt"))
+    threads = pregenerator_threads()
+    assert len(threads) == 1
+
+    for i in range(5):
+        env.reset(str(tmp_path / f"{i}.txt"))
+        assert pregenerator_threads() == threads
+    env.close()
+    assert not pregenerator_threads()
+
+def test_pregenerated_states_do_not_depend_on_logging(tmp_path):
+    logged = initial_states(SimpleTFT(dict(CONFIG, seed=1)), 6, str(tmp_path))
+    unlogged = initial_states(SimpleTFT(dict(CONFIG, seed=1)), 6)
+    assert_same_states(logged, unlogged)
+
+def test_clones_reset_without_pregeneration():
+    existing = pregenerator_threads()
+    env = SimpleTFT(dict(CONFIG, seed=2))
+    env.reset()
+    threads = pregenerator_threads()
+    clones = [env.clone() for _ in range(3)]
+    assert clones[0].config['reset_pregeneration'] == 0
+    assert pregenerator_threads() == threads
+
+    # A copy resets from its own copy of the random stream, like a game without pre-generation
+    plain = SimpleTFT(dict(CONFIG, seed=2, reset_pregeneration=0))
+    plain.set_state(env.get_state())
+    expected = initial_states(plain, 4)
+    for clone in clones:
+        assert_same_states(initial_states(clone, 4), expected)
+    assert pregenerator_threads() == threads
+
+    # The original keeps serving pre-generated states
+    fresh = SimpleTFT(dict(CONFIG, seed=2))
+    assert_same_states(initial_states(env, 3), initial_states(fresh, 4)[1:])
+    for game in [env, fresh, plain] + clones:
+        game.close()
+    assert pregenerator_threads() == existing
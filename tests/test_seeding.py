@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+from simpletft.tft import SimpleTFT
+import numpy as np
+import pytest
+
+CONFIG = {'num_players': 4, 'num_teams': 8, 'reward_structure': 'mixed'}
+
+def play(env: SimpleTFT, num_steps: int, action_seed: int, seed=None) -> list:
+    """
+    Play random valid actions and record every step's observations and rewards.
+    """
+    rng = np.random.default_rng(action_seed)
+    observations, _, masks = env.reset(seed=seed)
+    trajectory = [observations]
+    for _ in range(num_steps):
+        action = {p: int(rng.choice(np.flatnonzero(mask))) if mask.any() else len(mask) - 1
+                  for p, mask in masks.items()}
+        observations, rewards, _, dones, masks = env.step(action)
+        trajectory.append((observations, rewards))
+        if all(dones.values()):
+            observations, _, masks = env.reset()
+            trajectory.append(observations)
+    return trajectory
+
+def assert_same_trajectories(trajectory, other):
+    assert len(trajectory) == len(other)
+    for entry, other_entry in zip(trajectory, other):
+        if isinstance(entry, tuple):
+            (entry, rewards), (other_entry, other_rewards) = entry, other_entry
+            assert rewards == other_rewards
+        for p in entry:
+            np.testing.assert_array_equal(entry[p], other_entry[p])
+
+@pytest.mark.parametrize('seed', [0, np.random.SeedSequence(1)])
+def test_identical_seeds_give_identical_trajectories(seed):
+    assert_same_trajectories(play(SimpleTFT(dict(CONFIG, seed=seed)), 300, 0),
+                             play(SimpleTFT(dict(CONFIG, seed=seed)), 300, 0))
+
+def test_reset_seed_restarts_the_stream():
+    env = SimpleTFT(CONFIG)
+    first = play(env, 200, 0, seed=3)
+    assert_same_trajectories(play(env, 200, 0, seed=3), first)
+    assert_same_trajectories(play(SimpleTFT(dict(CONFIG, seed=3)), 200, 0), first)
+
+def test_different_seeds_give_different_games():
+    first = SimpleTFT(dict(CONFIG, seed=0)).reset()[0]
+    second = SimpleTFT(dict(CONFIG, seed=1)).reset()[0]
+    assert any(not np.array_equal(first[p], second[p]) for p in first)
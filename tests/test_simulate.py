@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+from simpletft.tft import SimpleTFT
+import numpy as np
+import pytest
+
+CONFIGS = [{'num_players': 4, 'num_teams': 8, 'reward_structure': 'mixed'},
+           {'num_players': 3, 'num_teams': 6, 'reward_structure': 'power', 'observation_mode': 'buffer'},
+           {'num_players': 2, 'reward_structure': 'game_placement'}]
+
+@pytest.mark.parametrize('config', CONFIGS)
+def test_simulate_and_advance_match_step(config):
+    config = dict(config, seed=4)
+    stepped, simulated, advanced = SimpleTFT(config), SimpleTFT(config), SimpleTFT(config)
+    rng = np.random.default_rng(0)
+
+    _, _, masks = stepped.reset()
+    simulated.reset()
+    advanced.reset()
+    for t in range(400):
+        action = {p: int(rng.choice(np.flatnonzero(mask))) if mask.any() else len(mask) - 1
+                  for p, mask in masks.items()}
+        observations, rewards, acting, dones, masks = stepped.step(action)
+        simulated_rewards, simulated_dones = simulated.simulate(action)
+        assert simulated_rewards == rewards
+        assert simulated_dones == dones
+        assert advanced.advance(action) == rewards
+
+        # Observations and masks are built on demand, here only every few steps
+        if t % 3 == 0:
+            if isinstance(observations, dict):
+                simulated_observations = simulated.make_player_observations()
+                for p in observations:
+                    np.testing.assert_array_equal(simulated_observations[p], observations[p])
+            else:
+                np.testing.assert_array_equal(simulated.write_observation_buffer(), observations)
+            simulated_masks = simulated.make_action_masks()
+            for p in masks:
+                np.testing.assert_array_equal(simulated_masks[p], masks[p])
+            assert simulated.make_acting_player_dict() == acting
+
+        np.testing.assert_equal(simulated.get_state(), stepped.get_state())
+        np.testing.assert_equal(advanced.get_state(), stepped.get_state())
+
+        if all(dones.values()):
+            _, _, masks = stepped.reset()
+            simulated.reset()
+            advanced.reset()
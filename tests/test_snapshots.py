@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+from simpletft.tft import SimpleTFT
+import numpy as np
+import pytest
+
+CONFIGS = [{'num_players': 4, 'num_teams': 8, 'reward_structure': 'mixed'},
+           {'num_players': 3, 'num_teams': 6, 'reward_structure': 'power', 'observation_mode': 'buffer'},
+           {'num_players': 4, 'num_teams': 8, 'observation_mode': 'shared', 'profile': True}]
+
+def random_actions(num_steps: int, env: SimpleTFT, seed: int) -> list:
+    """
+    Draw valid actions for a number of steps by playing them on a copy of the game.
+    """
+    scratch, rng = env.clone(), np.random.default_rng(seed)
+    actions = []
+    for _ in range(num_steps):
+        action = {p: int(rng.choice(np.flatnonzero(mask))) if mask.any() else len(mask) - 1
+                  for p, mask in scratch.make_action_masks().items()}
+        scratch.step(action)
+        actions.append(action)
+    return actions
+
+def replay(env: SimpleTFT, actions: list) -> list:
+    """
+    Play actions, recording rewards, dones, observations and masks after each step.
+    """
+    trajectory = []
+    for action in actions:
+        rewards, dones = env.simulate(action)
+        observations = {p: observation.copy() for p, observation in env.make_player_observations().items()}
+        trajectory.append((rewards, dones, observations, env.make_action_masks()))
+    return trajectory
+
+def assert_same_trajectories(trajectory, other):
+    for (rewards, dones, observations, masks), (other_rewards, other_dones, other_observations, other_masks) \
+            in zip(trajectory, other):
+        assert rewards == other_rewards
+        assert dones == other_dones
+        for p in observations:
+            np.testing.assert_array_equal(observations[p], other_observations[p])
+            np.testing.assert_array_equal(masks[p], other_masks[p])
+
+def play_until_combat_passed(env: SimpleTFT, seed: int):
+    for action in random_actions(25, env, seed):
+        env.step(action)
+
+@pytest.mark.parametrize('config', CONFIGS)
+def test_set_state_replays_the_game(config):
+    env = SimpleTFT(dict(config, seed=0))
+    env.reset()
+    play_until_combat_passed(env, 1)
+    state = env.get_state()
+    actions = random_actions(60, env, 2)
+    expected = replay(env, actions)
+
+    env.set_state(state)
+    assert_same_trajectories(replay(env, actions), expected)
+
+    # A state restores into any game with the same configuration
+    other = SimpleTFT(dict(config, seed=5))
+    other.reset()
+    other.set_state(state)
+    assert_same_trajectories(replay(other, actions), expected)
+
+@pytest.mark.parametrize('config', CONFIGS)
+def test_clone_replays_the_game_independently(config):
+    env = SimpleTFT(dict(config, seed=0))
+    env.reset()
+    play_until_combat_passed(env, 1)
+    actions = random_actions(60, env, 2)
+
+    clone = env.clone()
+    expected = replay(clone, actions)
+    assert_same_trajectories(replay(env, actions), expected)
+
+    # Playing on a clone leaves the original untouched
+    state = env.get_state()
+    clone = env.clone()
+    replay(clone, random_actions(30, clone, 3))
+    after = env.get_state()
+    np.testing.assert_array_equal(after.slots, state.slots)
+    np.testing.assert_array_equal(after.pool, state.pool)
+    np.testing.assert_array_equal(after.hp, state.hp)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+from simpletft.tft import SimpleTFT
+import numpy as np
+import pytest
+
+CONFIG = {'num_players': 4, 'num_teams': 8, 'actions_per_round': 5, 'reward_structure': 'mixed'}
+ROUND = CONFIG['actions_per_round']
+
+def random_sequences(env: SimpleTFT, rng: np.random.Generator, idle_rate: float) -> dict:
+    """
+    Draw up to a round of valid actions for every player, playing them on a copy of the game.
+    """
+    scratch = env.clone()
+    idle = env.action_space_size() - 1
+    lengths = {p: rng.integers(ROUND + 1) for p in env.make_action_masks()}
+    sequences = {p: [] for p in lengths}
+    for k in range(ROUND):
+        action = {}
+        for p, mask in scratch.make_action_masks().items():
+            valid = np.flatnonzero(mask[:-1])
+            action[p] = int(valid[rng.integers(len(valid))]) if len(valid) and rng.random() > idle_rate else idle
+            if k < lengths[p]:
+                sequences[p].append(action[p])
+            else:
+                action[p] = idle
+        scratch.step(action)
+    return sequences
+
+@pytest.mark.parametrize('fast_forward', [False, True])
+def test_step_round_matches_steps(fast_forward):
+    rounds, stepped = SimpleTFT(dict(CONFIG, seed=4)), SimpleTFT(dict(CONFIG, seed=4))
+    rounds.reset()
+    stepped.reset()
+    rng = np.random.default_rng(0)
+    idle = rounds.action_space_size() - 1
+
+    # Every round starts right after a reset or a combat, so it lasts ROUND steps
+    for _ in range(40):
+        sequences = random_sequences(rounds, rng, idle_rate=0.7)
+        observations, rewards, acting, dones, masks = rounds.step_round(sequences, fast_forward=fast_forward)
+
+        expected_rewards = dict.fromkeys(rewards, 0)
+        for k in range(ROUND):
+            expected = stepped.step({p: sequence[k] if k < len(sequence) else idle
+                                     for p, sequence in sequences.items()})
+            for p, reward in expected[1].items():
+                expected_rewards[p] += reward
+
+        assert rewards == expected_rewards
+        assert acting == expected[2]
+        assert dones == expected[3]
+        for p in observations:
+            np.testing.assert_array_equal(observations[p], expected[0][p])
+            np.testing.assert_array_equal(masks[p], expected[4][p])
+        if all(dones.values()):
+            break
+
+@pytest.mark.parametrize('fast_forward', [False, True])
+@pytest.mark.parametrize('action', [-1, 10 ** 6, 1.0, None])
+def test_step_round_rejects_invalid_actions(fast_forward, action):
+    env = SimpleTFT(dict(CONFIG, seed=0))
+    env.reset()
+    with pytest.raises(ValueError):
+        env.step_round({'player_0': [action]}, fast_forward=fast_forward)
+
+@pytest.mark.parametrize('fast_forward', [False, True])
+def test_failed_rounds_leave_the_game_unchanged(fast_forward):
+    env, reference = SimpleTFT(dict(CONFIG, seed=2)), SimpleTFT(dict(CONFIG, seed=2))
+    env.reset()
+    reference.reset()
+    rng = np.random.default_rng(0)
+    refresh = env.action_space_size() - 2
+    env.step_round(random_sequences(env, rng, idle_rate=0.3))
+    reference.set_state(env.get_state())
+    state = env.get_state()
+    sequences = random_sequences(env, rng, idle_rate=0.3)
+
+    # An invalid action late in one sequence is caught before any step is played
+    invalid = dict(sequences, player_3=sequences['player_3'][:ROUND - 1] + [10 ** 6])
+    with pytest.raises(ValueError):
+        env.step_round(invalid, fast_forward=fast_forward)
+    np.testing.assert_equal(env.get_state(), state)
+
+    # Refreshing without gold only fails mid-round, and the steps played before are rolled back
+    env.set_state(state._replace(gold=(1,) + state.gold[1:]))
+    before = env.get_state()
+    with pytest.raises(ValueError):
+        env.step_round(dict(sequences, player_0=[refresh, refresh]), fast_forward=fast_forward)
+    np.testing.assert_equal(env.get_state(), before)
+
+    # The game then plays on as if the failed rounds never happened
+    env.set_state(state)
+    outputs = env.step_round(sequences, fast_forward=fast_forward)
+    expected = reference.step_round(sequences)
+    assert outputs[1:4] == expected[1:4]
+    for p in outputs[0]:
+        np.testing.assert_array_equal(outputs[0][p], expected[0][p])
+        np.testing.assert_array_equal(outputs[4][p], expected[4][p])
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from simpletft.subproc_env import SubprocVectorEnv
+from simpletft.vector_env import SimpleTFTVectorEnv
+import numpy as np
+
+def test_subproc_env_matches_vector_env():
+    config = {'num_players': 4, 'num_teams': 8, 'reward_structure': 'mixed', 'seed': 6}
+    venv = SimpleTFTVectorEnv(config, 4)
+    rng = np.random.default_rng(0)
+
+    with SubprocVectorEnv(config, num_workers=2, games_per_worker=2) as env:
+        outputs, expected = env.reset(), venv.reset()
+        for output, expected_output in zip(outputs, expected):
+            np.testing.assert_array_equal(output, expected_output)
+
+        for _ in range(300):
+            masks = expected[-1]
+            actions = np.array([[rng.choice(np.flatnonzero(mask)) if mask.any() else len(mask) - 1
+                                 for mask in game_masks] for game_masks in masks])
+            outputs = env.step(actions)
+            expected = venv.step(actions)
+
+            # The workers reset finished games within the step
+            observations, rewards, acting, dones, masks = expected
+            finished = dones.all(1)
+            if finished.any():
+                observations, acting, masks = venv.reset(finished)
+            for output, expected_output in zip(outputs, (observations, rewards, acting, dones, masks)):
+                np.testing.assert_array_equal(output, expected_output)
+            expected = (observations, rewards, acting, dones, masks)
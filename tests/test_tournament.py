@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+from simpletft.tournament import SimpleTFTTournamentStats, run_tournament, random_policy, idle_policy
+import numpy as np
+import pytest
+
+POLICIES = {'random': random_policy, 'idle': idle_policy}
+CONFIG = {'num_players': 3, 'num_teams': 6}
+
+def assert_same_stats(stats, other):
+    assert stats.games == other.games
+    np.testing.assert_array_equal(stats.pair_scores, other.pair_scores)
+    assert stats.summary() == other.summary()
+
+def test_parallel_runs_match_serial_run():
+    serial = run_tournament(POLICIES, 24, CONFIG, num_workers=0, games_per_task=5, seed=3)
+    parallel = run_tournament(POLICIES, 24, CONFIG, num_workers=2, games_per_task=5, seed=3)
+    assert_same_stats(serial, parallel)
+
+    # Task size only changes how games are batched
+    assert_same_stats(serial, run_tournament(POLICIES, 24, CONFIG, num_workers=2, games_per_task=7, seed=3))
+
+def test_continued_and_merged_runs_match_a_single_run():
+    full = run_tournament(POLICIES, 20, CONFIG, seed=1, games_per_task=4)
+
+    continued = run_tournament(POLICIES, 8, CONFIG, seed=1, games_per_task=4)
+    run_tournament(POLICIES, 12, CONFIG, seed=1, first_game=8, stats=continued, games_per_task=4)
+    assert_same_stats(full, continued)
+
+    merged = run_tournament(POLICIES, 8, CONFIG, seed=1)
+    merged.merge(run_tournament(POLICIES, 12, CONFIG, seed=1, first_game=8))
+    assert_same_stats(full, merged)
+
+def test_child_seed_sequences_play_different_tournaments():
+    # Two random policies, so that results depend on the games played
+    policies = {'a': random_policy, 'b': random_policy}
+    first, second = np.random.SeedSequence(5).spawn(2)
+    runs = [run_tournament(policies, 12, CONFIG, seed=s) for s in (first, second)]
+    assert not np.array_equal(runs[0].pair_scores, runs[1].pair_scores)
+
+    # A child sequence seeds the same games however it is passed, and integer seeds are unchanged
+    assert_same_stats(runs[0], run_tournament(policies, 12, CONFIG, num_workers=2, seed=first))
+    assert_same_stats(run_tournament(POLICIES, 12, CONFIG, seed=5),
+                      run_tournament(POLICIES, 12, CONFIG, seed=np.random.SeedSequence(5)))
+
+def test_stats_of_other_policies_are_rejected():
+    with pytest.raises(ValueError):
+        SimpleTFTTournamentStats(['a', 'b']).merge(SimpleTFTTournamentStats(['b', 'a']))
+    with pytest.raises(ValueError):
+        run_tournament(POLICIES, 1, CONFIG, stats=SimpleTFTTournamentStats(['idle', 'random']))
+
+def test_stats_aggregate_placements():
+    stats = SimpleTFTTournamentStats(['a', 'b'])
+    stats.update(np.array([[0, 1, 1], [1, 0, 0]]), np.array([[1, 2, 3], [1, 2, 2]]))
+    summary = stats.summary()
+    assert summary['a']['seats'] == 3 and summary['b']['seats'] == 3
+    assert summary['a']['win_rate'] == pytest.approx(1 / 3)
+    assert summary['b']['mean_placement'] == pytest.approx(2)
+    # a beats both b seats in game 0 and loses to b twice in game 1; seats of the same policy are not compared
+    np.testing.assert_array_equal(stats.pair_scores, [[0, 2], [2, 0]])
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+from simpletft.random_stream import spawn_seeds
+from simpletft.tft import SimpleTFT
+from simpletft.vector_env import SimpleTFTVectorEnv
+import numpy as np
+import pytest
+
+CONFIGS = [{},
+           {'num_players': 3, 'num_teams': 6},
+           {'num_players': 4, 'num_teams': 8, 'reward_structure': 'mixed'},
+           {'reward_structure': 'power'},
+           {'num_players': 5, 'num_teams': 10, 'champ_copies': 9, 'bench_size': 3, 'reward_structure': 'damage'},
+           {'num_players': 8, 'num_teams': 16, 'reward_structure': 'game_placement'}]
+
+def random_actions(masks: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Pick a valid action for every seat of every game, idling when there is none.
+    """
+    actions = np.full(masks.shape[:-1], masks.shape[-1] - 1, dtype=np.int64)
+    for index in np.ndindex(*masks.shape[:-1]):
+        valid = np.flatnonzero(masks[index])
+        if len(valid):
+            actions[index] = valid[rng.integers(len(valid))]
+    return actions
+
+def assert_matches_games(outputs: np.ndarray, games: list, player_ids: list):
+    """
+    Check the outputs of a vector env step against the outputs of one SimpleTFT step per game.
+    """
+    observations, rewards, acting, dones, masks = outputs
+    for k, (game_observations, game_rewards, game_acting, game_dones, game_masks) in enumerate(games):
+        for p, player_id in enumerate(player_ids):
+            np.testing.assert_array_equal(observations[k, p], game_observations[player_id])
+            np.testing.assert_array_equal(masks[k, p], game_masks[player_id])
+            assert rewards[k, p] == game_rewards[player_id]
+            assert acting[k, p] == game_acting[player_id]
+            assert dones[k, p] == game_dones[player_id]
+
+@pytest.mark.parametrize('config', CONFIGS)
+def test_games_follow_spawned_seeds(config):
+    num_games, seed = 3, 11
+    envs = [SimpleTFT(dict(config, seed=s)) for s in spawn_seeds(seed, num_games)]
+    venv = SimpleTFTVectorEnv(dict(config, seed=seed), num_games)
+    rng = np.random.default_rng(0)
+    player_ids = envs[0].live_agents
+
+    for env in envs:
+        env.reset()
+    masks = venv.reset()[-1]
+    for _ in range(400):
+        actions = random_actions(masks, rng)
+        outputs = venv.step(actions)
+        assert_matches_games(outputs, [env.step(dict(zip(player_ids, actions[k].tolist())))
+                                       for k, env in enumerate(envs)], player_ids)
+        masks = outputs[-1]
+
+        # Games are reset on their own as they finish
+        finished = outputs[3].all(1)
+        if finished.any():
+            masks = venv.reset(finished)[-1]
+            for k in np.flatnonzero(finished):
+                envs[k].reset()
+
+def test_game_streams_are_independent_of_other_games():
+    config = {'num_players': 4, 'num_teams': 8, 'seed': 3}
+    single = SimpleTFTVectorEnv(config, 1)
+    batch = SimpleTFTVectorEnv(config, 4)
+    rng = np.random.default_rng(0)
+
+    single_outputs = single.reset()
+    batch_outputs = batch.reset()
+    for t in range(200):
+        actions = random_actions(batch_outputs[-1], rng)
+        single_outputs = single.step(actions[:1])
+        batch_outputs = batch.step(actions)
+        for single_output, batch_output in zip(single_outputs, batch_outputs):
+            np.testing.assert_array_equal(single_output[0], batch_output[0])
+        # Resetting other games does not shift game 0's stream
+        if t % 25 == 0:
+            batch_outputs = batch.reset(np.array([2, 3]))
+
+def test_reset_seed_reseeds_selected_games():
+    config = {'num_players': 4, 'num_teams': 8}
+    env = SimpleTFTVectorEnv(config, 3)
+    first = env.reset(seed=5)[0]
+    env.step(random_actions(env.make_action_masks(), np.random.default_rng(0)))
+    observations = env.reset(np.array([1]), seed=5)[0]
+    np.testing.assert_array_equal(observations[1], first[1])
+
+@pytest.mark.parametrize('config', CONFIGS)
+def test_single_game_matches_simpletft(config):
+    env = SimpleTFT(dict(config, seed=spawn_seeds(0, 1)[0]))
+    venv = SimpleTFTVectorEnv(dict(config, seed=0), 1)
+    rng = np.random.default_rng(1)
+    player_ids = env.live_agents
+
+    observations, acting, masks = env.reset()
+    outputs = venv.reset()
+    for p, player_id in enumerate(player_ids):
+        np.testing.assert_array_equal(outputs[0][0, p], observations[player_id])
+        np.testing.assert_array_equal(outputs[2][0, p], masks[player_id])
+        assert outputs[1][0, p] == acting[player_id]
+
+    dones = np.zeros(1, dtype=bool)
+    while not dones.all():
+        actions = random_actions(outputs[-1], rng)
+        outputs = venv.step(actions)
+        assert_matches_games(outputs, [env.step(dict(zip(player_ids, actions[0].tolist())))], player_ids)
+        dones = outputs[3]